@@ -0,0 +1,95 @@
+# bench_bom_verify.py
+"""
+Benchmark of BOM verification: the vectorized join (bom_verify.verify_bom) against the
+previous per-line loop, on generated BOMs of 10k, 100k and 1M lines.
+
+BOM lines are drawn from the catalog, with a share of them (--miss-rate) altered so that
+they are not found. Closest-match suggestions are left out (suggest=False): they are the
+same batched n-gram search in both versions and would dominate the timings.
+
+    python bench_bom_verify.py
+    python bench_bom_verify.py --sizes 10000 100000 --synthetic-parts 1000000
+"""
+import argparse
+import random
+import string
+import time
+
+import pandas as pd
+
+from bom_verify import CatalogFrame, get_catalog_frame, verify_bom
+from catalog_db import get_catalog_db
+
+
+def synthetic_fields(parts, seed=0):
+    """A catalog fields frame (as CatalogDB.fields_frame returns) of `parts` generated parts."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits
+    numbers = list(dict.fromkeys("".join(rng.choices(alphabet, k=14)) for _ in range(parts)))
+    return pd.DataFrame({
+        "pn_norm": numbers, "pn_canon": numbers,
+        "manufacturer": [rng.choice(("TDK", "Murata", "Vishay", "Nexperia", "TI")) for _ in numbers],
+        "category": [rng.choice(("Capacitor", "Resistor", "Diode", "MCU")) for _ in numbers],
+        "qualification": [rng.choice(("AEC-Q200", "AEC-Q100", "AEC-Q101", None)) for _ in numbers],
+    })
+
+
+def generate_bom(part_numbers, lines, miss_rate, seed=0):
+    rng = random.Random(seed)
+    bom = rng.choices(part_numbers, k=lines)
+    for i in rng.sample(range(lines), int(lines * miss_rate)):
+        bom[i] = bom[i] + "-x"
+    return bom
+
+
+def loop_verify(part_numbers, records):
+    """The previous implementation: one dict per line, then three scans for the summary."""
+    results = []
+    for pn in part_numbers:
+        component_data = records.get(pn)
+        if component_data:
+            results.append({"Part Number": pn, "Status": "Found",
+                            "Manufacturer": component_data.get("Manufacturer", "N/A"),
+                            "Category": component_data.get("Product Category", "N/A"),
+                            "AEC-Q Qualified": component_data.get("Qualification", "No")})
+        else:
+            results.append({"Part Number": pn, "Status": "Not Found", "Manufacturer": "N/A",
+                            "Category": "N/A", "AEC-Q Qualified": "Unknown"})
+    results_df = pd.DataFrame(results)
+    found_count = len(results_df[results_df['Status'] == 'Found'])
+    not_found_count = len(results_df[results_df['Status'] == 'Not Found'])
+    aec_q_count = len(results_df[results_df['AEC-Q Qualified'].str.contains('AEC', na=False)])
+    return results_df, (found_count, not_found_count, aec_q_count)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="BOM line counts")
+    parser.add_argument("--miss-rate", type=float, default=0.25, help="share of BOM lines not in the catalog")
+    parser.add_argument("--synthetic-parts", type=int, default=0,
+                        help="benchmark against this many generated parts instead of the catalog database")
+    args = parser.parse_args()
+
+    fields = synthetic_fields(args.synthetic_parts) if args.synthetic_parts else get_catalog_db().fields_frame()
+    load_s, frame = timed(CatalogFrame, fields) if args.synthetic_parts else timed(get_catalog_frame)
+    records = {row.pn_norm: {"Manufacturer": row.manufacturer, "Product Category": row.category,
+                             "Qualification": row.qualification}
+               for row in fields.itertuples(index=False)}
+    print(f"catalog: {len(frame)} parts, frame built in {load_s:.2f} s")
+    print(f"{'lines':>10} {'loop s':>9} {'join s':>9} {'speedup':>8} {'lines/s (join)':>15}")
+    for size in args.sizes:
+        bom = generate_bom(fields["pn_norm"].tolist(), size, args.miss_rate)
+        loop_s, (_, loop_counts) = timed(loop_verify, bom, records)
+        join_s, (_, summary) = timed(verify_bom, bom, frame, suggest=False)
+        assert loop_counts == (summary["Components Found"], summary["Not Found"], summary["AEC-Q Qualified"])
+        print(f"{size:>10} {loop_s:>9.3f} {join_s:>9.3f} {loop_s / join_s:>7.1f}x {size / join_s:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
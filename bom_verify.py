@@ -0,0 +1,258 @@
+# bom_verify.py
+"""
+Vectorized BOM verification against the component catalog.
+
+The catalog's indexed fields are loaded once per process into a columnar CatalogFrame:
+a hash index over normalized part numbers, a second one over canonical part numbers
+(see catalog_db.canonical_part_number) and the Manufacturer, Category and Qualification
+columns as categoricals. Verifying a BOM is then a hash join of its part-number column
+against those indexes, one gather per output column, and the summary counts are taken
+from the same match arrays instead of rescanning the result table.
+
+Large BOMs are streamed: iter_bom_chunks reads a .csv or .xlsx file CHUNK_ROWS lines at a
+time and BomVerification verifies each chunk as it arrives, keeping running totals, the
+first DISPLAY_ROWS result lines and a line count per unresolved part number, so memory
+follows the chunk size rather than the BOM size.
+"""
+import itertools
+import os
+import threading
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from catalog_db import canonical_part_numbers, get_catalog_db
+from part_index import get_ngram_index
+from uploads import open_upload
+
+RESULT_COLUMNS = ("Part Number", "Status", "Manufacturer", "Category", "AEC-Q Qualified",
+                  "Closest Match", "Similarity", "Other Candidates")
+SUMMARY_KEYS = ("Total Components", "Components Found", "Not Found", "AEC-Q Qualified")
+CHUNK_ROWS = int(os.environ.get("COMPLIANCE_BOM_CHUNK_ROWS", "50000"))
+DISPLAY_ROWS = 10000
+PART_NUMBER_HINTS = ("part number", "mpn", "p/n")
+
+
+class BomFormatError(ValueError):
+    """Raised when a BOM file has an unsupported format or no part-number column."""
+
+
+class CatalogFrame:
+    """Columnar copy of the catalog fields BOM verification reports, with hash indexes for the join."""
+
+    def __init__(self, fields):
+        # Parts sharing a canonical form: the canonically spelled one, then the first, owns it (as in CatalogDB.get)
+        order = np.lexsort((fields["pn_norm"].to_numpy(), (fields["pn_canon"] != fields["pn_norm"]).to_numpy()))
+        fields = fields.iloc[order].reset_index(drop=True)
+        self.norm_index = pd.Index(fields["pn_norm"])
+        # get_indexer needs unique labels: keep each canonical form's first (preferred) row
+        first = ~fields["pn_canon"].duplicated().to_numpy()
+        self.canon_index = pd.Index(fields["pn_canon"][first])
+        self._canon_rows = np.flatnonzero(first)
+        self.manufacturer = fields["manufacturer"].fillna("N/A").astype("category")
+        self.category = fields["category"].fillna("N/A").astype("category")
+        self.qualification = fields["qualification"].fillna("No").astype("category")
+        self._aec_codes = self.qualification.cat.categories.str.contains("AEC", na=False)
+        # Build both hash tables now, once, rather than inside the first verification
+        for index in (self.norm_index, self.canon_index):
+            index.get_indexer(index[:1])
+
+    def __len__(self):
+        return len(self.norm_index)
+
+    def match(self, normalized):
+        """Catalog row of each normalized part number (exact spelling first, then canonical), or -1."""
+        rows = self.norm_index.get_indexer(normalized)
+        missing = rows < 0
+        if missing.any() and len(self.canon_index):
+            hits = self.canon_index.get_indexer(np.asarray(canonical_part_numbers(normalized[missing]), dtype=object))
+            rows[missing] = np.where(hits >= 0, self._canon_rows[hits], -1)
+        return rows
+
+    def is_aec(self, rows):
+        """Whether each catalog row's qualification mentions AEC."""
+        return self._aec_codes[self.qualification.cat.codes.to_numpy()[rows]]
+
+
+def _take(column, rows, found, default):
+    """Gathers a categorical column at the found `rows`, with `default` for the lines not found."""
+    values = np.full(len(rows), default, dtype=object)
+    values[found] = np.asarray(column.cat.categories, dtype=object)[column.cat.codes.to_numpy()[rows[found]]]
+    return values
+
+
+def _suggestions(part_numbers):
+    """Closest Match, Similarity and Other Candidates for unresolved part numbers, matched in one batch."""
+    closest = get_ngram_index().closest(part_numbers)
+    matches = [closest[pn] for pn in part_numbers]
+    return pd.DataFrame({
+        "Closest Match": [m[0][0] if m else "None" for m in matches],
+        "Similarity": [m[0][1] if m else np.nan for m in matches],
+        "Other Candidates": [", ".join(f"{pn} ({score:.2f})" for pn, score in m[1:]) for m in matches],
+    }).to_numpy(dtype=object)
+
+
+def verify_bom(part_numbers, frame=None, suggest=True):
+    """
+    Verifies BOM part numbers (already normalized: stripped, lowercased) against the catalog.
+    Returns (results DataFrame with RESULT_COLUMNS, summary dict). With `suggest`, lines not
+    found get the closest catalog parts (part_index.NGramIndex).
+
+    Each distinct part number is resolved once; the per-line table is a take() over
+    categorical columns, so repeated BOM lines cost no string work.
+    """
+    if frame is None:
+        frame = get_catalog_frame()
+    codes, uniques = pd.factorize(np.asarray(part_numbers, dtype=object))
+    uniques = np.asarray(uniques, dtype=object)
+    rows = frame.match(uniques)
+    found = rows >= 0
+    aec = np.zeros(len(rows), dtype=bool)
+    aec[found] = frame.is_aec(rows[found])
+
+    distinct = pd.DataFrame({
+        "Part Number": uniques,
+        "Status": np.where(found, "Found", "Not Found").astype(object),
+        "Manufacturer": _take(frame.manufacturer, rows, found, "N/A"),
+        "Category": _take(frame.category, rows, found, "N/A"),
+        "AEC-Q Qualified": _take(frame.qualification, rows, found, "Unknown"),
+        "Closest Match": np.full(len(rows), "N/A", dtype=object),
+        "Similarity": np.full(len(rows), np.nan),
+        "Other Candidates": np.full(len(rows), "", dtype=object),
+    }, columns=list(RESULT_COLUMNS))
+
+    if suggest and not found.all():
+        distinct.loc[~found, ["Closest Match", "Similarity", "Other Candidates"]] = _suggestions(uniques[~found])
+
+    if len(uniques) * 2 <= len(codes):  # repeated lines: expand compact categorical columns
+        text_columns = [name for name in RESULT_COLUMNS if name != "Similarity"]
+        distinct[text_columns] = distinct[text_columns].astype("category")
+    results = distinct.take(codes).reset_index(drop=True)
+
+    # Summary from the match arrays, weighted by how often each part number occurs
+    lines = np.bincount(codes, minlength=len(uniques))
+    found_count = int(lines[found].sum())
+    summary = {"Total Components": len(codes), "Components Found": found_count,
+               "Not Found": len(codes) - found_count, "AEC-Q Qualified": int(lines[aec].sum())}
+    return results, summary
+
+
+def find_part_number_column(columns):
+    """The first column whose name looks like a part number ('Part Number', 'MPN', 'P/N'), or None."""
+    for column in columns:
+        if any(hint in str(column).lower() for hint in PART_NUMBER_HINTS):
+            return column
+    return None
+
+
+def _normalized(values):
+    """Part numbers as verify_bom expects them: blanks dropped, text stripped and lowercased."""
+    return pd.Series(values, dtype=object).dropna().astype(str).str.strip().str.lower().to_numpy(dtype=object)
+
+
+def _csv_chunks(f, chunk_rows):
+    column = find_part_number_column(pd.read_csv(f, nrows=0).columns)
+    if column is None:
+        raise BomFormatError("Could not automatically find a 'Part Number' or 'MPN' column in the file.")
+    size = f.seek(0, os.SEEK_END) or 1
+    f.seek(0)
+    with pd.read_csv(f, usecols=[column], dtype=str, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield _normalized(chunk[column]), min(f.tell() / size, 1.0)
+
+
+def _xlsx_chunks(f, chunk_rows):
+    workbook = openpyxl.load_workbook(f, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, ())
+        column = find_part_number_column(header)
+        if column is None:
+            raise BomFormatError("Could not automatically find a 'Part Number' or 'MPN' column in the file.")
+        index = header.index(column)
+        total, done = max((sheet.max_row or 0) - 1, 1), 0
+        for batch in iter(lambda: list(itertools.islice(rows, chunk_rows)), []):
+            done += len(batch)
+            yield _normalized([row[index] if index < len(row) else None for row in batch]), min(done / total, 1.0)
+    finally:
+        workbook.close()
+
+
+def iter_bom_chunks(source, name, chunk_rows=CHUNK_ROWS):
+    """
+    Yields (normalized part numbers, fraction of the file read) for each chunk of up to
+    `chunk_rows` lines of a .csv or .xlsx BOM (the first sheet of a workbook).
+    """
+    with open_upload(source) as f:
+        if name.endswith(".xlsx"):
+            yield from _xlsx_chunks(f, chunk_rows)
+        elif name.endswith(".csv"):
+            yield from _csv_chunks(f, chunk_rows)
+        else:
+            raise BomFormatError("Unsupported file format. Please upload .xlsx or .csv")
+
+
+class BomVerification:
+    """
+    Verification of a BOM fed chunk by chunk. Keeps the running `summary`, the first
+    `display_rows` result lines and the number of lines of each unresolved part number;
+    closest-match suggestions are computed once, by finish().
+    """
+
+    def __init__(self, frame=None, display_rows=DISPLAY_ROWS):
+        self.frame = frame if frame is not None else get_catalog_frame()
+        self.display_rows = display_rows
+        self.summary = dict.fromkeys(SUMMARY_KEYS, 0)
+        self._preview = []
+        self._preview_rows = 0
+        self._unresolved = {}
+
+    def add(self, part_numbers):
+        """Verifies one chunk and folds it into the totals. Returns the chunk's summary."""
+        results, summary = verify_bom(part_numbers, self.frame, suggest=False)
+        for key, value in summary.items():
+            self.summary[key] += value
+        if self._preview_rows < self.display_rows:
+            head = results.iloc[:self.display_rows - self._preview_rows]
+            self._preview.append(head)
+            self._preview_rows += len(head)
+        for part_number, lines in results["Part Number"][results["Status"] == "Not Found"].value_counts().items():
+            if lines:  # categorical counts include every category
+                self._unresolved[part_number] = self._unresolved.get(part_number, 0) + int(lines)
+        return summary
+
+    def finish(self, suggest=True):
+        """
+        Returns (preview, unresolved): the first result lines, and one row per unresolved part
+        number with its line count, most frequent first. With `suggest`, both get the closest
+        catalog parts.
+        """
+        preview = pd.concat(self._preview, ignore_index=True).astype({"Similarity": float}) if self._preview \
+            else pd.DataFrame(columns=list(RESULT_COLUMNS))
+        preview = preview.astype({name: object for name in RESULT_COLUMNS if name != "Similarity"})
+        unresolved = pd.DataFrame({"Part Number": list(self._unresolved), "Lines": list(self._unresolved.values())},
+                                  columns=["Part Number", "Lines"])
+        unresolved = unresolved.sort_values("Lines", ascending=False, kind="stable").reset_index(drop=True)
+        if suggest and len(unresolved):
+            columns = ["Closest Match", "Similarity", "Other Candidates"]
+            suggestions = pd.DataFrame(_suggestions(unresolved["Part Number"].to_numpy(dtype=object)), columns=columns)
+            unresolved = pd.concat([unresolved, suggestions.astype({"Similarity": float})], axis=1)
+            by_part = unresolved.set_index("Part Number")[columns]
+            missing = preview["Status"] == "Not Found"
+            preview.loc[missing, columns] = by_part.loc[preview.loc[missing, "Part Number"]].to_numpy(dtype=object)
+        return preview, unresolved
+
+
+_catalog_frame = None
+_catalog_frame_lock = threading.Lock()
+
+
+def get_catalog_frame():
+    """Returns the process-wide columnar catalog frame, loading it from the catalog database on first use."""
+    global _catalog_frame
+    with _catalog_frame_lock:
+        if _catalog_frame is None:
+            _catalog_frame = CatalogFrame(get_catalog_db().fields_frame())
+        return _catalog_frame
@@ -0,0 +1,45 @@
+# cache_paths.py
+"""Location of the tool's on-disk caches (override with the COMPLIANCE_CACHE_DIR environment variable)."""
+import contextlib
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # no fcntl on Windows: the lock only serializes threads of one process
+    fcntl = None
+
+CACHE_DIR = os.environ.get("COMPLIANCE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".compliance_cache"))
+
+
+def cache_path(*parts):
+    """Returns a path inside the cache directory, creating its parent directories."""
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def atomic_write(path, data):
+    """Writes bytes to `path` via a temporary file and rename, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """Holds an exclusive lock on `path` (created if missing) across processes for the duration of the block."""
+    with open(path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,62 @@
+# catalog.py
+"""
+The component catalog's data files and the test-case knowledge base, shared read-only by
+every app.
+
+Both used to be large dict literals re-declared in each app script, so every Streamlit
+rerun rebuilt them. They now live as JSON under data/: the components are served by
+catalog_db.py, which builds its database from COMPONENTS_FILE, and the test cases are
+loaded here once per process. Every nested dict is exposed as a MappingProxyType and every
+list as a tuple (freeze), so a page that wants to annotate a record must copy it first
+(dict(record)) instead of changing the entry every other session sees.
+"""
+import json
+import os
+import threading
+from functools import cached_property
+from types import MappingProxyType
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+COMPONENTS_FILE = os.path.join(DATA_DIR, "components.json")
+TEST_CASES_FILE = os.path.join(DATA_DIR, "test_cases.json")
+
+
+def freeze(value):
+    """Returns a read-only view of nested dicts/lists: mapping proxies and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return freeze(json.load(f))
+
+
+class Catalog:
+    """
+    Read-only view of the test knowledge base, loaded on first access. Parts are looked up
+    through catalog_db.py.
+    """
+
+    def __init__(self, test_cases_file=TEST_CASES_FILE):
+        self.test_cases_file = test_cases_file
+
+    @cached_property
+    def test_cases(self):
+        return _load(self.test_cases_file)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """Returns the process-wide catalog, loading it on first use."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = Catalog()
+        return _catalog
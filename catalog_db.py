@@ -0,0 +1,447 @@
+# catalog_db.py
+"""
+The component catalog as a local SQLite database, opened once per process.
+
+Each part is one row keyed by its normalized part number, with the full record as JSON
+and the fields the apps filter on (manufacturer, category, qualification) in indexed
+columns, so a lookup is one B-tree probe however large the catalog grows. Each row also
+carries the canonical form of its part number (packaging and reel suffixes removed, see
+canonical_part_number), indexed, so a distributor or ERP spelling of a part resolves
+with one more probe when the exact spelling misses. Attributes with a unit ("25 VDC",
+"-55 C") are parsed once, at build time, into a parameters table of numbers in SI base
+units (see parametric.py), clustered by parameter and value for range queries.
+
+Parts come from sources: data/components.json (source "catalog") and distributor dumps
+imported with catalog_import.py. Each row records its source and a hash of its source
+row, so a source is applied as a diff (CatalogImport): unchanged parts are skipped, new
+and changed ones written, and parts the source no longer lists removed, in one
+transaction. A part belongs to one source: the curated catalog takes precedence over any
+dump, and a dump never takes over or removes a part another source owns. The database is
+built under the cache directory from data/components.json, which is re-applied the same
+way whenever it changes; only a schema change rebuilds the database from scratch (re-run
+the imports after one). A build writes to a temporary file and renames it into place, so
+other processes never open a half-built catalog.
+"""
+import hashlib
+import itertools
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from cache_paths import cache_path
+from catalog import COMPONENTS_FILE, freeze
+from parametric import parameter_values
+
+SCHEMA_VERSION = 4
+QUERY_CHUNK = 500  # part numbers per IN (...) query, well below SQLite's variable limit
+SCAN_PAGE = 10000
+IMPORT_BATCH = 50000
+IMPORT_CACHE_KIB = 256 * 1024  # page cache of an import: the indexes being updated stay in memory
+CATALOG_SOURCE = "catalog"  # the parts of data/components.json
+IMPORT_STATS = ("rows", "inserted", "changed", "unchanged", "conflicts", "removed")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE components (
+    id INTEGER PRIMARY KEY,
+    part_number TEXT NOT NULL,
+    pn_norm TEXT NOT NULL,
+    pn_canon TEXT NOT NULL,
+    manufacturer TEXT,
+    category TEXT,
+    qualification TEXT,
+    record TEXT NOT NULL,
+    source TEXT NOT NULL,
+    row_hash INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX components_pn_norm ON components (pn_norm);
+CREATE INDEX components_canon ON components (pn_canon);
+CREATE INDEX components_manufacturer ON components (manufacturer COLLATE NOCASE);
+CREATE INDEX components_category ON components (category COLLATE NOCASE);
+CREATE INDEX components_qualification ON components (qualification);
+CREATE INDEX components_source ON components (source);
+CREATE TABLE parameters (
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (name, value, id)
+) WITHOUT ROWID;
+CREATE INDEX parameters_id ON parameters (id);
+"""
+
+# Packaging/ordering suffixes at the end of a part number: "#", "#pbf", "#trpbf" (lead-free and
+# reel markers), parenthesized packaging codes such as "(05)", "-tr"/"-t&r"/"-reel" and "/nopb".
+_PACKAGING_SUFFIXES_RE = re.compile(r"(?:#(?:tr)?(?:pbf)?|\(\w{1,4}\)|[-/](?:t&r|tr|reel|nopb))+$")
+_SUFFIX_LAST_CHARS = frozenset("#)frlb")  # last characters of those suffixes: a cheap test before the regex
+
+
+def normalize_part_number(part_number):
+    """The form part numbers are stored and looked up in: stripped and lowercased."""
+    return str(part_number).strip().lower()
+
+
+def canonical_part_number(part_number):
+    """
+    The spelling-independent form of a part number: normalized, without whitespace and
+    with packaging suffixes removed ("gcm155l81e104ke02d#-tr" -> "gcm155l81e104ke02d").
+    A part number that is nothing but suffixes is kept as it is.
+    """
+    return _canonical(normalize_part_number(part_number))
+
+
+def _canonical(normalized):
+    compact = "".join(normalized.split())
+    if compact and compact[-1] in _SUFFIX_LAST_CHARS:
+        return _PACKAGING_SUFFIXES_RE.sub("", compact) or compact
+    return compact
+
+
+def canonical_part_numbers(normalized):
+    """canonical_part_number for many already normalized part numbers, as a list."""
+    return [_canonical(pn) for pn in normalized]
+
+
+def _source_signature(path):
+    info = os.stat(path)
+    return f"{info.st_size}:{info.st_mtime_ns}"
+
+
+def record_json(record):
+    """A record as stored in the database: compact JSON."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def text_hash(text):
+    """A 64-bit hash of `text`, as the signed integer SQLite stores."""
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+
+def _in_chunks(conn, sql, ids):
+    """Runs `sql` (with an IN ({}) placeholder) over `ids` in chunks of QUERY_CHUNK."""
+    for start in range(0, len(ids), QUERY_CHUNK):
+        chunk = ids[start:start + QUERY_CHUNK]
+        conn.execute(sql.format(",".join("?" * len(chunk))), chunk)
+
+
+class CatalogImport:
+    """
+    One full dump of a source applied to the catalog database at `path` as a diff. add()
+    takes the dump in batches: parts whose row hash is unchanged are skipped, new and changed
+    ones written along with their parameters. finish() removes the parts of the source that
+    the dump no longer lists and commits; until then other connections see the catalog as
+    it was.
+
+    Each part keeps the source that owns it. The catalog source (data/components.json)
+    takes over parts a dump added; a dump skips parts owned by any other source and counts
+    them as conflicts, so it can neither overwrite a curated record nor, by leaving the
+    part out later, remove it.
+    """
+
+    def __init__(self, path, source):
+        self.source = source
+        self.stats = dict.fromkeys(IMPORT_STATS, 0)
+        self._conn = sqlite3.connect(path, isolation_level=None, timeout=60)
+        self._conn.execute(f"PRAGMA cache_size = -{IMPORT_CACHE_KIB}")
+        self._conn.execute("BEGIN IMMEDIATE")  # one writer at a time
+        self._next_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM components").fetchone()[0]
+        self._seen = np.zeros(self._next_id, bool)
+
+    def meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _mark(self, row_ids):
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        if len(row_ids) and row_ids.max() >= len(self._seen):
+            self._seen = np.concatenate([self._seen, np.zeros(max(len(self._seen), int(row_ids.max()) + 1), bool)])
+        self._seen[row_ids] = True
+
+    def _existing(self, normalized):
+        """{normalized part number: (id, row hash, source)} for those already in the catalog."""
+        found = {}
+        for start in range(0, len(normalized), QUERY_CHUNK):
+            chunk = normalized[start:start + QUERY_CHUNK]
+            # INDEXED BY: the statistics may still describe the catalog before this import began
+            rows = self._conn.execute(f"SELECT pn_norm, id, row_hash, source FROM components INDEXED BY components_pn_norm"
+                                      f" WHERE pn_norm IN ({','.join('?' * len(chunk))})", chunk)
+            found.update((pn_norm, known) for pn_norm, *known in rows)
+        return found
+
+    def add(self, part_numbers, hashes, record_of):
+        """
+        Applies one batch of the dump: `part_numbers` as the source spells them, the hash of
+        each one's source row, and `record_of(i)`, which returns the record (a dict) of the
+        i-th part and is called only for new and changed parts. A part number listed twice
+        keeps its last row. Returns the batch's counts (IMPORT_STATS).
+        """
+        stats = dict.fromkeys(IMPORT_STATS, 0)
+        stats["rows"] = len(part_numbers)
+        latest = {normalize_part_number(part_number): i for i, part_number in enumerate(part_numbers)}
+        existing = self._existing(list(latest))
+        self._mark([known[0] for known in existing.values()])
+        inserts, updates, parameters = [], [], []
+        for pn_norm, i in latest.items():
+            row_hash = int(hashes[i])
+            known = existing.get(pn_norm)
+            if known is not None and known[2] != self.source and self.source != CATALOG_SOURCE:
+                stats["conflicts"] += 1
+                continue
+            if known is not None and known[1] == row_hash and known[2] == self.source:
+                stats["unchanged"] += 1
+                continue
+            record = record_of(i)
+            values = (str(part_numbers[i]).strip(), pn_norm, _canonical(pn_norm), record.get("Manufacturer"),
+                      record.get("Product Category"), record.get("Qualification"), record_json(record),
+                      self.source, row_hash)
+            if known is None:
+                row_id = self._next_id
+                self._next_id += 1
+                inserts.append((row_id, *values))
+            else:
+                row_id = known[0]
+                updates.append((*values, row_id))
+            parameters.extend((name, value, row_id) for name, value in parameter_values(record))
+        self._mark([row[0] for row in inserts])
+        _in_chunks(self._conn, "DELETE FROM parameters INDEXED BY parameters_id WHERE id IN ({})", [row[-1] for row in updates])
+        self._conn.executemany("INSERT INTO components (id, part_number, pn_norm, pn_canon, manufacturer, category,"
+                               " qualification, record, source, row_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", inserts)
+        self._conn.executemany("UPDATE components SET part_number = ?, pn_norm = ?, pn_canon = ?, manufacturer = ?,"
+                               " category = ?, qualification = ?, record = ?, source = ?, row_hash = ?"
+                               " WHERE id = ?", updates)
+        self._conn.executemany("INSERT OR IGNORE INTO parameters VALUES (?, ?, ?)", parameters)
+        stats["inserted"], stats["changed"] = len(inserts), len(updates)
+        for key, value in stats.items():
+            self.stats[key] += value
+        return stats
+
+    def finish(self, source_signature=""):
+        """
+        Removes the source's parts missing from the dump, records `source_signature` (what
+        the dump was read from) and commits. Returns the import's counts (IMPORT_STATS).
+        """
+        ids = np.fromiter((row[0] for row in self._conn.execute("SELECT id FROM components WHERE source = ?",
+                                                                  (self.source,))), dtype=np.int64)
+        removed = [int(row_id) for row_id in ids if row_id >= len(self._seen) or not self._seen[row_id]]
+        _in_chunks(self._conn, "DELETE FROM components WHERE id IN ({})", removed)
+        _in_chunks(self._conn, "DELETE FROM parameters INDEXED BY parameters_id WHERE id IN ({})", removed)
+        self.stats["removed"] = len(removed)
+        meta = [(f"source:{self.source}", source_signature)]
+        if self.stats["inserted"] or self.stats["changed"] or removed or self.meta("signature") is None:
+            meta.append(("signature", f"{SCHEMA_VERSION}:{time.time_ns()}"))  # tells snapshots they are stale
+        self._conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta)
+        self._conn.execute("COMMIT")
+        self._conn.execute("PRAGMA optimize")
+        self._conn.close()
+        return self.stats
+
+    def abort(self):
+        """Discards the import."""
+        self._conn.rollback()
+        self._conn.close()
+
+
+def import_components(path, components, source=CATALOG_SOURCE, source_signature=""):
+    """
+    Applies `components` ({part number: record}) to the database at `path` as the full
+    contents of `source`. Returns the counts, or None if `source_signature` was already
+    applied (by another process, meanwhile).
+    """
+    catalog_import = CatalogImport(path, source)
+    try:
+        if source_signature and catalog_import.meta(f"source:{source}") == source_signature:
+            catalog_import.abort()
+            return None
+        items = iter(components.items())
+        for batch in iter(lambda: list(itertools.islice(items, IMPORT_BATCH)), []):
+            part_numbers = [part_number for part_number, _ in batch]
+            records = [record for _, record in batch]
+            catalog_import.add(part_numbers, [text_hash(record_json(record)) for record in records], records.__getitem__)
+        return catalog_import.finish(source_signature)
+    except BaseException:
+        catalog_import.abort()
+        raise
+
+
+def build_catalog_db(path, components, source_signature=""):
+    """Writes `components` ({part number: record}) to a new database at `path`, atomically."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-", suffix=".sqlite3")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                conn.execute("INSERT INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+        finally:
+            conn.close()
+        import_components(tmp_path, components, source_signature=source_signature)
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.execute("ANALYZE")
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CatalogDB:
+    """
+    Read-only queries against the catalog database. Records come back as read-only
+    mappings, like catalog.Catalog's; copy one before changing it.
+    """
+
+    def __init__(self, path=None, source=COMPONENTS_FILE):
+        self.path = path or cache_path("catalog", "components.sqlite3")
+        source_signature = _source_signature(source)
+        meta = self._stored_meta()
+        if meta.get("schema") != str(SCHEMA_VERSION):
+            with open(source, encoding="utf-8") as f:
+                build_catalog_db(self.path, json.load(f), source_signature)
+        elif meta.get(f"source:{CATALOG_SOURCE}") != source_signature:
+            with open(source, encoding="utf-8") as f:
+                import_components(self.path, json.load(f), source_signature=source_signature)
+        # One connection shared by the session threads; sqlite3 objects are not thread-safe, hence the lock.
+        self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        # Changes with every import that changes the catalog (see catalog_snapshot.py)
+        self.signature = self._query("SELECT value FROM meta WHERE key = 'signature'")[0][0]
+
+    def _stored_meta(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            try:
+                return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                conn.close()
+        except sqlite3.DatabaseError:
+            return {}
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def __len__(self):
+        return self._query("SELECT COUNT(*) FROM components")[0][0]
+
+    def get(self, part_number):
+        """
+        Returns the record for `part_number`, or None. Case and surrounding spaces are ignored;
+        if the exact spelling is not in the catalog, packaging suffixes are too.
+        """
+        rows = self._query("SELECT record FROM components WHERE pn_norm = ?", (normalize_part_number(part_number),))
+        if not rows:
+            # Several parts may share a canonical form: prefer the one spelled canonically, then the first
+            rows = self._query("SELECT record FROM components WHERE pn_canon = ?"
+                               " ORDER BY pn_canon != pn_norm, pn_norm LIMIT 1", (canonical_part_number(part_number),))
+        return freeze(json.loads(rows[0][0])) if rows else None
+
+    def _records_by(self, column, keys):
+        """{column value: record} for `keys`, in chunked IN queries; the first row per value wins."""
+        found = {}
+        for start in range(0, len(keys), QUERY_CHUNK):
+            chunk = keys[start:start + QUERY_CHUNK]
+            sql = (f"SELECT {column}, record FROM components WHERE {column} IN ({','.join('?' * len(chunk))})"
+                   f" ORDER BY pn_canon != pn_norm, pn_norm")
+            for key, record in self._query(sql, chunk):
+                if key not in found:
+                    found[key] = freeze(json.loads(record))
+        return found
+
+    def get_many(self, part_numbers):
+        """
+        Returns {normalized part number: record} for the parts of `part_numbers` found in the
+        catalog, matching like get(): exact spellings first, canonical forms for the rest.
+        """
+        wanted = list(dict.fromkeys(normalize_part_number(pn) for pn in part_numbers))
+        found = self._records_by("pn_norm", wanted)
+        canonical = {pn: canonical_part_number(pn) for pn in wanted if pn not in found}
+        by_canonical = self._records_by("pn_canon", list(set(canonical.values())))
+        found.update((pn, by_canonical[canon]) for pn, canon in canonical.items() if canon in by_canonical)
+        return found
+
+    def fields_frame(self):
+        """
+        The indexed fields of every part as a DataFrame: id, pn_norm, pn_canon, manufacturer,
+        category, qualification.
+        """
+        with self._lock:
+            return pd.read_sql_query("SELECT id, pn_norm, pn_canon, manufacturer, category, qualification"
+                                     " FROM components", self._conn)
+
+    def parameter_names(self):
+        """The numeric parameters some part has, sorted."""
+        return [row[0] for row in self._query("SELECT DISTINCT name FROM parameters ORDER BY name")]
+
+    def parameter_column(self, name):
+        """Returns (values in SI base units, part ids) of one parameter as numpy arrays, sorted by value."""
+        with self._lock:
+            rows = self._conn.execute("SELECT value, id FROM parameters WHERE name = ? ORDER BY value, id", (name,))
+            column = np.fromiter(rows, dtype=[("value", np.float64), ("id", np.int32)])
+        return column["value"], column["id"]
+
+    def records_by_id(self, ids):
+        """Returns [(part number, record), ...] for the part `ids`, in part-number order."""
+        rows = []
+        for start in range(0, len(ids), QUERY_CHUNK):
+            chunk = [int(row_id) for row_id in ids[start:start + QUERY_CHUNK]]
+            rows += self._query(f"SELECT pn_norm, part_number, record FROM components"
+                                f" WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+        return [(part_number, freeze(json.loads(record))) for _, part_number, record in sorted(rows)]
+
+    def iter_part_numbers(self):
+        """Yields every normalized part number in sorted (UTF-8 byte) order, a page at a time."""
+        return (row[0] for row in self.iter_rows(()))
+
+    def iter_rows(self, columns):
+        """Yields (pn_norm, *columns) for every part in sorted part-number order, a page at a time."""
+        select = ", ".join(("pn_norm", *columns))
+        last = ""
+        while True:
+            rows = self._query(f"SELECT {select} FROM components WHERE pn_norm > ? ORDER BY pn_norm LIMIT ?",
+                               (last, SCAN_PAGE))
+            yield from rows
+            if len(rows) < SCAN_PAGE:
+                return
+            last = rows[-1][0]
+
+    def find(self, manufacturer=None, category=None, qualification=None, limit=100):
+        """
+        Returns [(part number, record), ...] matching every given filter exactly
+        (manufacturer and category ignore case), in part-number order.
+        """
+        clauses, params = [], []
+        for column, value, collate in (("manufacturer", manufacturer, " COLLATE NOCASE"),
+                                       ("category", category, " COLLATE NOCASE"),
+                                       ("qualification", qualification, "")):
+            if value is not None:
+                clauses.append(f"{column} = ?{collate}")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(f"SELECT part_number, record FROM components{where} ORDER BY pn_norm LIMIT ?",
+                           (*params, limit))
+        return [(part_number, freeze(json.loads(record))) for part_number, record in rows]
+
+
+_catalog_db = None
+_catalog_db_lock = threading.Lock()
+
+
+def get_catalog_db():
+    """Returns the process-wide catalog database, building it on first use if needed."""
+    global _catalog_db
+    with _catalog_db_lock:
+        if _catalog_db is None:
+            _catalog_db = CatalogDB()
+        return _catalog_db
@@ -0,0 +1,136 @@
+# catalog_import.py
+"""
+Bulk import of distributor catalog dumps (CSV) into the catalog database.
+
+The file is streamed CHUNK_ROWS rows at a time. Its columns are mapped onto the catalog's
+record fields (COLUMN_MAP, plus --map overrides; other columns keep their header as the
+attribute name), an "Operating Temperature" range is split into the minimum and maximum
+fields, and each row is hashed, vectorized, over its mapped values. The dump is then
+applied as a diff against the previous import of the same source (catalog_db.CatalogImport):
+only new and changed parts are written, and parts missing from the dump are removed, all
+in one transaction. Parts already owned by another source (data/components.json or another
+dump) are left as they are and counted as conflicts. Progress and the final rate are
+reported in rows per second.
+
+    python catalog_import.py digikey_capacitors.csv --source digikey
+    python catalog_import.py export.csv --source mouser --map "Mouser No=" --map "Description="
+
+Running apps see the imported parts on their next lookup; their in-memory indexes pick
+them up on restart (see catalog_snapshot.py).
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from catalog_db import CATALOG_SOURCE, IMPORT_STATS, CatalogDB, CatalogImport, text_hash
+
+CHUNK_ROWS = 100000
+PART_NUMBER = "part number"  # the mapping target of the part-number column
+
+# Lowercase distributor headers -> catalog record fields (PART_NUMBER for the key, "" to drop the column)
+COLUMN_MAP = {
+    "mfr part #": PART_NUMBER, "mfr. no": PART_NUMBER, "manufacturer part number": PART_NUMBER,
+    "mpn": PART_NUMBER, "part number": PART_NUMBER,
+    "mfr": "Manufacturer", "mfr.": "Manufacturer", "manufacturer": "Manufacturer",
+    "category": "Product Category", "product category": "Product Category",
+    "qualification": "Qualification", "voltage - rated": "Voltage Rating DC", "voltage rating": "Voltage Rating DC",
+    "power (watts)": "Power", "current rating (amps)": "Current Rating", "package / case": "Package Case",
+    "datasheet": "", "image": "", "stock": "", "price": "", "unit price": "", "quantity available": "",
+}
+# Range columns ("-55°C ~ 125°C (TA)") -> (field of the low end, field of the high end)
+RANGE_COLUMNS = {"Operating Temperature": ("Minimum Operating Temperature", "Maximum Operating Temperature")}
+_RANGE_RE = r"^\s*(\S+)\s*(?:~|\bto\b)\s*(\S+)"
+
+
+def column_mapping(header, overrides=None):
+    """{CSV column: record field} for the columns of `header` that are kept."""
+    overrides = {source.strip().lower(): target.strip() for source, target in (overrides or {}).items()}
+    mapping = {}
+    for column in header:
+        key = str(column).strip().lower()
+        target = overrides.get(key, COLUMN_MAP.get(key, str(column).strip()))
+        if target:
+            mapping[column] = target
+    return mapping
+
+
+def _mapped(chunk, mapping):
+    """The chunk with its columns renamed to record fields and range columns split."""
+    frame = chunk[list(mapping)].set_axis(list(mapping.values()), axis=1)
+    for column, (low, high) in RANGE_COLUMNS.items():
+        if column in frame.columns:
+            ends = frame[column].str.extract(_RANGE_RE)
+            frame = frame.drop(columns=column).assign(**{low: ends[0], high: ends[1]})
+    return frame
+
+
+def iter_dump(path, overrides=None, chunk_rows=CHUNK_ROWS, encoding="utf-8"):
+    """
+    Yields (part numbers, row hashes, record_of, fraction of the file read) per chunk of a
+    CSV dump, in the form CatalogImport.add takes them.
+    """
+    with open(path, "rb") as f:
+        mapping = column_mapping(pd.read_csv(f, nrows=0, encoding=encoding).columns, overrides)
+        part_columns = [column for column, target in mapping.items() if target == PART_NUMBER]
+        if not part_columns:
+            raise ValueError(f"{path}: no part-number column (map one with --map 'COLUMN={PART_NUMBER}')")
+        mapping = {column: target for column, target in mapping.items() if target != PART_NUMBER}
+        size = f.seek(0, os.SEEK_END) or 1
+        f.seek(0)
+        reader = pd.read_csv(f, dtype=str, keep_default_na=False, na_values=[""], chunksize=chunk_rows,
+                             encoding=encoding)
+        with reader:
+            for chunk in reader:
+                chunk = chunk[chunk[part_columns[0]].notna()]
+                frame = _mapped(chunk, mapping)
+                # The mapping is part of the row's content: re-mapping a column changes every hash
+                salt = np.int64(text_hash("\x1f".join(frame.columns)))
+                hashes = pd.util.hash_pandas_object(frame, index=False).to_numpy().view(np.int64) ^ salt
+                fields, values = list(frame.columns), frame.to_numpy(dtype=object)
+
+                def record_of(i, fields=fields, values=values):
+                    return {field: value for field, value in zip(fields, values[i]) if isinstance(value, str)}
+
+                yield chunk[part_columns[0]].to_numpy(dtype=object), hashes, record_of, min(f.tell() / size, 1.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="CSV dump of the distributor catalog")
+    parser.add_argument("--source", required=True,
+                        help="name of the source; re-importing it replaces that source's previous import")
+    parser.add_argument("--map", action="append", default=[], metavar="COLUMN=FIELD",
+                        help=f"map a CSV column to a record field ('{PART_NUMBER}' for the key, empty to drop it)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows read and applied at a time")
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--db", help="catalog database (default: the apps' database in the cache directory)")
+    args = parser.parse_args()
+    if args.source == CATALOG_SOURCE:
+        parser.error(f"source '{CATALOG_SOURCE}' is data/components.json")
+    overrides = dict(item.split("=", 1) for item in args.map if "=" in item)
+
+    db = CatalogDB(args.db)  # creates the database, with data/components.json, if there is none yet
+    start = time.perf_counter()
+    catalog_import = CatalogImport(db.path, args.source)
+    try:
+        for part_numbers, hashes, record_of, done in iter_dump(args.path, overrides, args.chunk_rows, args.encoding):
+            catalog_import.add(part_numbers, hashes, record_of)
+            stats, elapsed = catalog_import.stats, time.perf_counter() - start
+            print(f"{done:6.1%}  {stats['rows']:>12,} rows  {stats['rows'] / elapsed:>9,.0f} rows/s  "
+                  f"+{stats['inserted']:,} ~{stats['changed']:,} ={stats['unchanged']:,} !{stats['conflicts']:,}",
+                  flush=True)
+        info = os.stat(args.path)
+        stats = catalog_import.finish(f"{os.path.abspath(args.path)}:{info.st_size}:{info.st_mtime_ns}")
+    except BaseException:
+        catalog_import.abort()
+        raise
+    elapsed = time.perf_counter() - start
+    print(", ".join(f"{key} {stats[key]:,}" for key in IMPORT_STATS)
+          + f" in {elapsed:.1f} s ({stats['rows'] / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# catalog_snapshot.py
+"""
+A memory-mapped columnar snapshot of the catalog database, for fast process startup.
+
+The snapshot is two columnar table files (see columnar.py) written from the catalog
+database: the parts, sorted by normalized part number (with the record JSON, the row id
+and manufacturer, category and qualification as enum codes), and the numeric parameters,
+sorted by parameter and value. Opening them maps the files and reads their headers, so it
+costs the same for a hundred parts as for millions; cells are decoded when accessed, and
+every process serving the app shares the same physical pages through the OS page cache.
+The in-memory indexes (part_index.py) are built over the mapped buffers directly.
+
+The snapshot is compiled offline with `python catalog_snapshot.py` (e.g. at deployment)
+and otherwise on first use; it is rebuilt whenever the catalog database's signature
+changes.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from cache_paths import cache_path
+from catalog import freeze
+from catalog_db import get_catalog_db, normalize_part_number
+from columnar import FileTable, write_column_file
+
+SNAPSHOT_VERSION = 1
+FIELD_COLUMNS = ("manufacturer", "category", "qualification")
+
+
+def _paths(directory):
+    return os.path.join(directory, "components.snapshot"), os.path.join(directory, "parameters.snapshot")
+
+
+def write_catalog_snapshot(directory, db):
+    """Writes the snapshot of catalog database `db` into `directory`. Returns the bytes written."""
+    components_path, parameters_path = _paths(directory)
+    meta = {"version": SNAPSHOT_VERSION, "signature": db.signature}
+    names = db.parameter_names()
+    columns = {"name": [], "value": array("d"), "id": array("i")}
+    for name in names:
+        values, ids = db.parameter_column(name)
+        columns["name"] += [name] * len(values)
+        columns["value"].frombytes(values.tobytes())
+        columns["id"].frombytes(ids.astype(np.int32).tobytes())
+    size = write_column_file(parameters_path, columns, meta, enum_columns=("name",))
+
+    columns = {name: [] for name in ("pn_norm", "part_number", *FIELD_COLUMNS, "record")}
+    ids = array("q")
+    for pn_norm, part_number, row_id, *fields, record in db.iter_rows(("part_number", "id", *FIELD_COLUMNS, "record")):
+        for name, value in zip(columns, (pn_norm, part_number, *fields, record)):
+            columns[name].append(value)
+        ids.append(row_id)
+    columns["id"] = ids
+    # The parameters file goes first: a components file with a current signature implies both are current
+    return size + write_column_file(components_path, columns, meta, enum_columns=FIELD_COLUMNS)
+
+
+class CatalogSnapshot(Mapping):
+    """
+    Read-only {normalized part number: record} over the mapped snapshot, looked up by
+    binary search over the sorted part numbers. Records are read-only mappings, like
+    catalog_db.CatalogDB's.
+    """
+
+    def __init__(self, directory):
+        components_path, parameters_path = _paths(directory)
+        self.components = FileTable(components_path)
+        self.parameters = FileTable(parameters_path)
+        self.signature = self.components.meta.get("signature")
+        self.part_numbers = self.components.bytes_column("pn_norm")
+
+    def _row(self, part_number):
+        key = normalize_part_number(part_number).encode("utf-8")
+        i = bisect.bisect_left(self.part_numbers, key)
+        return i if i < len(self.part_numbers) and self.part_numbers[i] == key else -1
+
+    def __getitem__(self, part_number):
+        i = self._row(part_number)
+        if i < 0:
+            raise KeyError(part_number)
+        return freeze(json.loads(self.components.cell("record", i)))
+
+    def __contains__(self, part_number):
+        return self._row(part_number) >= 0
+
+    def __len__(self):
+        return len(self.part_numbers)
+
+    def __iter__(self):
+        return (key.decode("utf-8") for key in self.part_numbers)
+
+    def part_number(self, key):
+        """The part number as the catalog spells it, for a normalized part number in the snapshot."""
+        i = self._row(key)
+        if i < 0:
+            raise KeyError(key)
+        return self.components.cell("part_number", i)
+
+    def _field(self, name):
+        try:
+            codes = np.frombuffer(self.components.buffer(name), dtype=np.uint16)
+        except TypeError:  # more distinct values than an enum column holds: stored as text
+            return pd.Categorical(self.components.column(name))
+        vocab = self.components.vocab(name)
+        # Nulls become code -1, as pandas expects
+        known = [i for i, value in enumerate(vocab) if value is not None]
+        remap = np.full(len(vocab), -1, np.int32)
+        remap[known] = np.arange(len(known))
+        return pd.Categorical.from_codes(remap[codes], [vocab[i] for i in known])
+
+    def fields_frame(self):
+        """id, manufacturer, category and qualification of every part (as categoricals), in part-number order."""
+        frame = {"id": np.frombuffer(self.components.buffer("id"), dtype=np.int64)}
+        frame.update((name, self._field(name)) for name in FIELD_COLUMNS)
+        return pd.DataFrame(frame)
+
+    def parameter_columns(self):
+        """{parameter: (values in SI base units, part ids)}, sorted by value, as arrays over the mapped file."""
+        names = self.parameters.vocab("name")
+        codes = np.frombuffer(self.parameters.buffer("name"), dtype=np.uint16)
+        values = np.frombuffer(self.parameters.buffer("value"), dtype=np.float64)
+        ids = np.frombuffer(self.parameters.buffer("id"), dtype=np.int32)
+        bounds = np.searchsorted(codes, np.arange(len(names) + 1))  # rows are grouped by name, in vocabulary order
+        return {name: (values[bounds[i]:bounds[i + 1]], ids[bounds[i]:bounds[i + 1]]) for i, name in enumerate(names)}
+
+
+def _stored_signature(directory):
+    components_path, _ = _paths(directory)
+    if not os.path.exists(components_path):
+        return None
+    try:
+        table = FileTable(components_path)
+    except (ValueError, OSError):
+        return None
+    meta = table.meta
+    table.close()
+    return meta.get("signature") if meta.get("version") == SNAPSHOT_VERSION else None
+
+
+def open_catalog_snapshot(directory=None, db=None):
+    """Opens the snapshot of `db` (the process-wide catalog database) in `directory`, writing it first if stale."""
+    directory = directory or os.path.dirname(cache_path("catalog", "components.snapshot"))
+    if db is None:
+        db = get_catalog_db()
+    if _stored_signature(directory) != db.signature:
+        write_catalog_snapshot(directory, db)
+    return CatalogSnapshot(directory)
+
+
+_catalog_snapshot = None
+_catalog_snapshot_lock = threading.Lock()
+
+
+def get_catalog_snapshot():
+    """Returns the process-wide catalog snapshot, writing it on first use if the catalog changed."""
+    global _catalog_snapshot
+    with _catalog_snapshot_lock:
+        if _catalog_snapshot is None:
+            _catalog_snapshot = open_catalog_snapshot()
+        return _catalog_snapshot
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    snapshot = open_catalog_snapshot()
+    size = snapshot.components.size + snapshot.parameters.size
+    print(f"catalog snapshot: {len(snapshot):,} parts, {size / 1e6:.1f} MB, ready in {time.perf_counter() - start:.2f} s")
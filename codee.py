@@ -3,8 +3,23 @@ import streamlit as st
 import pandas as pd
 import pdfplumber
 import openpyxl
-import re
 import os
+from html_report import parse_html_report
+from rule_packs import RulePackError, compile_rule_pack, load_rule_pack, new_rule_stats
+from layout_cache import LayoutParse, get_layout_cache, parse_with_layout_cache
+from report_jobs import PREVIEW_BUDGET_S, find_job, get_or_start_job
+from tail_follow import follow_log, reset_follow
+from uploads import decode_upload, upload_view
+from pdf_pages import iter_relevant_pages, new_pruning_stats
+from page_cache import get_page_cache
+from parse_cache import get_parse_cache, parse_key
+from result_store import get_result_store
+from session_snapshot import restore_session, save_session, session_key
+from memory_governor import get_governor, governed_state
+from catalog import get_catalog
+from catalog_db import get_catalog_db
+from part_index import get_parametric_index, get_prefix_index
+from parametric import display_unit, from_si, to_si
 
 # To parse .docx files, you need to install python-docx
 try:
@@ -61,602 +76,33 @@ def init_session_state():
     for key, value in state_defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
+    governed_state("component_db", pd.DataFrame)  # tracks the per-session table under the memory governor
 init_session_state()
 
-
-# === UPGRADED KNOWLEDGE BASE with Detailed Procedures ===
-TEST_CASE_KNOWLEDGE_BASE = {
-    "water ingress": {
-        "name": "Water Ingress Protection Test (IPX7)",
-        "standard": "Based on ISO 20653 / IEC 60529",
-        "description": "This test simulates the temporary immersion of the device in water to ensure no harmful quantity of water can enter the enclosure.",
-        "procedure": [
-            "Ensure the Device Under Test (DUT) is in a non-operational state and at ambient temperature.",
-            "Submerge the DUT completely in a water tank.",
-            "The lowest point of the DUT should be 1 meter below the surface of the water.",
-            "The highest point of the DUT should be at least 0.15 meters below the surface.",
-            "Maintain the immersion for the specified duration.",
-            "After the test, remove the DUT, dry the exterior, and inspect the interior for any signs of water ingress.",
-            "Conduct a functional check to ensure the device operates as expected."
-        ],
-        "parameters": {
-            "Immersion Depth": "1 meter",
-            "Test Duration": "30 minutes",
-            "Water Temperature": "Ambient (within 5°C of DUT temperature)"
-        },
-        "equipment": ["Water Immersion Tank", "Depth Measurement Tool", "Stopwatch"]
-    },
-    "thermal shock": {
-        "name": "Thermal Shock Test",
-        "standard": "Based on ISO 16750-4",
-        "description": "This test simulates the stress placed on electronic components when moving between extreme temperatures, such as a car being washed in winter.",
-        "procedure": [
-            "Set up a dual-chamber thermal shock system (hot and cold chambers).",
-            "Place the DUT in the cold chamber and allow it to stabilize at the minimum temperature.",
-            "Rapidly transfer the DUT to the hot chamber (transfer time should be less than 1 minute).",
-            "Allow the DUT to stabilize at the maximum temperature.",
-            "This completes one cycle. Repeat for the specified number of cycles.",
-            "After the final cycle, allow the DUT to return to room temperature and perform a full functional and visual inspection."
-        ],
-        "parameters": {
-            "Minimum Temperature": "-40°C",
-            "Maximum Temperature": "+85°C",
-            "Soak Time per Chamber": "1 hour",
-            "Number of Cycles": "100 cycles"
-        },
-        "equipment": ["Dual-Chamber Thermal Shock System"]
-    },
-    "vibration": {
-        "name": "Sinusoidal Vibration Test",
-        "standard": "Based on IEC 60068-2-6",
-        "description": "This test simulates the vibrations that a component might experience during its operational life due to engine harmonics or rough road conditions.",
-        "procedure": [
-            "Securely mount the DUT onto the vibration shaker table in its intended orientation.",
-            "Sweep the frequency range from the minimum to the maximum value and back down.",
-            "Perform the sweep on all three axes (X, Y, and Z).",
-            "Maintain the specified G-force (acceleration) throughout the test.",
-            "During the test, monitor the DUT for any intermittent failures or resonant frequencies.",
-            "After the test, perform a full functional and visual inspection for any damage."
-        ],
-        "parameters": {
-            "Frequency Range": "10 Hz to 500 Hz",
-            "Acceleration": "5g (49 m/s²)",
-            "Sweep Rate": "1 octave/minute",
-            "Duration per Axis": "2 hours"
-        },
-        "equipment": ["Electrodynamic Shaker Table", "Vibration Controller", "Accelerometers"]
-    },
-     "short circuit": {
-        "name": "External Short Circuit Protection",
-        "standard": "Based on AIS-156 / IEC 62133-2",
-        "description": "Verifies the safety performance of the battery or system when an external short circuit is applied.",
-        "procedure": [
-            "Ensure the DUT is fully charged.",
-            "Connect the positive and negative terminals of the DUT with a copper wire or load with a resistance of less than 100 mΩ.",
-            "Maintain the short circuit condition for the specified duration or until the protection circuit interrupts the current.",
-            "Monitor the DUT for any hazardous events like fire, explosion, or casing rupture.",
-            "Measure the case temperature during the test; it should not exceed the specified limit.",
-            "After the test, the DUT should not show signs of fire or explosion."
-        ],
-        "parameters": {
-            "Short Circuit Resistance": "< 100 mΩ",
-            "Test Temperature": "55°C ± 5°C",
-            "Observation Period": "1 hour after the event"
-        },
-        "equipment": ["High-Current Contactor", "Low-Resistance Load", "Thermocouples", "Safety Enclosure"]
-    }
-}
-TEST_CASE_KNOWLEDGE_BASE = {
-    "high temperature endurance": {
-        "name": "High Temperature Endurance Test",
-        "standard": "Based on ISO 16750-4 / IEC 60068-2-2",
-        "description": "This test evaluates the device's ability to operate and survive prolonged exposure to high temperatures, simulating engine compartment conditions.",
-        "procedure": [
-            "Place the DUT in a high-temperature chamber.",
-            "Bring the chamber temperature up to the specified maximum operating temperature.",
-            "Maintain the temperature for the specified duration.",
-            "During the test, apply nominal voltage and monitor the DUT for functional anomalies.",
-            "After the test, allow the DUT to return to room temperature and perform a full functional and visual inspection."
-        ],
-        "parameters": {
-            "Temperature": "+105°C (non-operating) / +85°C (operating)",
-            "Duration": "96 hours to 1000 hours (depending on severity level)",
-            "Relative Humidity": "Less than 20% RH (unless combined with humidity)"
-        },
-        "equipment": ["Temperature Chamber", "Data Logger", "Power Supply"]
-    },
-    "low temperature endurance": {
-        "name": "Low Temperature Endurance Test",
-        "standard": "Based on ISO 16750-4 / IEC 60068-2-1",
-        "description": "This test assesses the device's performance and structural integrity under prolonged exposure to low temperatures, such as those found in cold climates.",
-        "procedure": [
-            "Place the DUT in a low-temperature chamber.",
-            "Bring the chamber temperature down to the specified minimum operating temperature.",
-            "Maintain the temperature for the specified duration.",
-            "During the test, apply nominal voltage and monitor the DUT for functional anomalies.",
-            "After the test, allow the DUT to return to room temperature and perform a full functional and visual inspection."
-        ],
-        "parameters": {
-            "Temperature": "-40°C (non-operating) / -30°C (operating)",
-            "Duration": "96 hours to 1000 hours (depending on severity level)"
-        },
-        "equipment": ["Low-Temperature Chamber", "Data Logger", "Power Supply"]
-    },
-    "temperature cycling": {
-        "name": "Temperature Cycling Test",
-        "standard": "Based on ISO 16750-4 / IEC 60068-2-14",
-        "description": "This test subjects the device to alternating high and low temperatures to detect failures caused by thermal expansion and contraction, which can lead to material fatigue and joint failures.",
-        "procedure": [
-            "Place the DUT in a temperature cycling chamber.",
-            "Cycle the temperature between the specified minimum and maximum values.",
-            "Maintain the specified dwell time at each extreme temperature.",
-            "Ensure the transition rate between temperatures is within specified limits.",
-            "Perform the specified number of cycles.",
-            "After the final cycle, allow the DUT to return to room temperature and perform a full functional and visual inspection."
-        ],
-        "parameters": {
-            "Minimum Temperature": "-40°C",
-            "Maximum Temperature": "+105°C",
-            "Dwell Time at Extremes": "1 hour",
-            "Transition Rate": "5°C/minute minimum",
-            "Number of Cycles": "50 to 1000 cycles"
-        },
-        "equipment": ["Thermal Cycling Chamber", "Data Logger", "Power Supply (for operational checks)"]
-    },
-    "humidity & damp heat test": {
-        "name": "Humidity & Damp Heat Test",
-        "standard": "Based on ISO 16750-4 / IEC 60068-2-78 (Steady State) / IEC 60068-2-30 (Cyclic)",
-        "description": "This test evaluates the device's resistance to high humidity, which can cause corrosion, insulation degradation, and moisture absorption in materials.",
-        "procedure": [
-            "Place the DUT in a climatic chamber.",
-            "Set the chamber to the specified temperature and relative humidity.",
-            "Maintain the conditions for the specified duration (steady state) or cycle through specified temperature and humidity profiles (cyclic).",
-            "If specified, apply nominal power to the DUT during certain phases.",
-            "Monitor for condensation, water droplets, and functional anomalies.",
-            "After the test, allow the DUT to dry, then perform a full functional and visual inspection."
-        ],
-        "parameters": {
-            "Temperature": "+40°C (Steady) / +25°C to +55°C (Cyclic)",
-            "Relative Humidity": "93% RH (Steady) / 95% RH (Cyclic)",
-            "Duration": "48 hours to 56 days (Steady) / 24 hours per cycle, 2-6 cycles (Cyclic)"
-        },
-        "equipment": ["Climatic Chamber (Humidity Chamber)", "Data Logger", "Humidity Sensor"]
-    },
-    "salt spray / corrosion test": {
-        "name": "Salt Spray / Corrosion Test",
-        "standard": "Based on ISO 9227 / ASTM B117",
-        "description": "This test assesses the resistance of components and coatings to corrosion in a saline environment, simulating exposure to road salt or marine conditions.",
-        "procedure": [
-            "Prepare a salt solution (e.g., 5% NaCl solution).",
-            "Place the DUT in a salt spray chamber.",
-            "Atomize the salt solution into a fine mist within the chamber.",
-            "Maintain the specified temperature and continuous salt spray for the duration.",
-            "Periodically inspect the DUT for signs of corrosion (e.g., red rust, white rust).",
-            "After the test, thoroughly rinse and dry the DUT, then perform a functional and visual inspection."
-        ],
-        "parameters": {
-            "Salt Solution Concentration": "5% NaCl",
-            "Temperature": "35°C",
-            "pH of Solution": "6.5 to 7.2",
-            "Test Duration": "24 hours to 1000 hours (depending on material/coating)"
-        },
-        "equipment": ["Salt Spray Chamber", "Salt Solution Preparation", "pH Meter"]
-    },
-    "dust ingress (ip rating)": {
-        "name": "Dust Ingress Protection Test (IP Rating)",
-        "standard": "Based on IEC 60529 (IP5X, IP6X)",
-        "description": "This test verifies the protection of an enclosure against the ingress of dust, which can affect electrical components, moving parts, and optical surfaces.",
-        "procedure": [
-            "Place the DUT in a dust chamber filled with specified talcum powder (or similar fine dust).",
-            "A vacuum pump may be connected to the DUT if negative pressure is required (for category 1 enclosures).",
-            "Circulate the dust within the chamber using fans or blowers for the specified duration.",
-            "After the test, remove the DUT and carefully clean the exterior.",
-            "Disassemble the DUT (if applicable) and visually inspect the interior for any dust penetration.",
-            "Conduct a functional check."
-        ],
-        "parameters": {
-            "Dust Type": "Talcum powder (particle size < 75µm)",
-            "Dust Concentration": "2 kg/m³",
-            "Test Duration": "2 to 8 hours (IP5X) / 8 hours with vacuum (IP6X)",
-            "Air Velocity": "Variable, to ensure uniform dust suspension"
-        },
-        "equipment": ["Dust Chamber", "Vacuum Pump (optional)", "Talcum Powder", "Air Circulator"]
-    },
-    "drop test / mechanical shock": {
-        "name": "Drop Test / Mechanical Shock",
-        "standard": "Based on IEC 60068-2-27 (Shock) / MIL-STD-810G Method 516.6 (Drop)",
-        "description": "This test assesses the device's ability to withstand sudden, non-repetitive forces, such as those experienced during accidental drops, impacts, or rough handling.",
-        "procedure": [
-            "Securely mount the DUT onto a shock testing machine or prepare it for free fall.",
-            "For shock: Subject the DUT to a specified number of shocks (half-sine or sawtooth pulse) along each of its three axes.",
-            "For drop: Drop the DUT from a specified height onto a hard surface, ensuring it lands in different orientations.",
-            "After each shock/drop, visually inspect the DUT for damage.",
-            "Perform functional checks at specified intervals or after all shocks/drops.",
-            "The DUT should remain functional and structurally sound."
-        ],
-        "parameters": {
-            "Shock Pulse": "Half-sine",
-            "Peak Acceleration": "50g to 200g (depending on application)",
-            "Pulse Duration": "6 ms to 11 ms",
-            "Number of Shocks": "3 to 18 shocks per axis",
-            "Drop Height": "0.5 meters to 1.5 meters",
-            "Number of Drops": "Multiple drops on faces, edges, corners"
-        },
-        "equipment": ["Shock Testing Machine", "Drop Tester", "Accelerometer", "Data Acquisition System"]
-    },
-    "overvoltage protection test": {
-        "name": "Overvoltage Protection Test",
-        "standard": "Based on ISO 16750-2 / LV 124",
-        "description": "This test verifies that the device can withstand transient or continuous overvoltage conditions without damage or permanent degradation, simulating faults in the vehicle's electrical system.",
-        "procedure": [
-            "Connect the DUT to a programmable power supply.",
-            "Apply the specified overvoltage level to the DUT's power input.",
-            "Maintain the overvoltage for the specified duration.",
-            "Monitor the DUT for smoke, fire, or catastrophic failure.",
-            "After the test, return to nominal voltage and perform a functional check.",
-            "The device's protection circuit should activate, or it should withstand the overvoltage without damage."
-        ],
-        "parameters": {
-            "Test Voltage": "18V (for 12V systems) or higher transients",
-            "Duration": "60 minutes (continuous) / < 1 second (transient)",
-            "Test Temperature": "Room ambient"
-        },
-        "equipment": ["Programmable DC Power Supply", "Voltmeter", "Ammeter", "Load Box"]
-    },
-    "overcurrent protection test": {
-        "name": "Overcurrent Protection Test",
-        "standard": "Based on UL 60950-1 / IEC 62368-1",
-        "description": "This test confirms that the device's protection mechanisms (e.g., fuses, current limiters) effectively prevent damage from excessive current draw, simulating a short circuit or overload.",
-        "procedure": [
-            "Connect the DUT to a power supply with current limiting capabilities.",
-            "Gradually increase the current beyond the DUT's rated operating current.",
-            "Observe at what current level the protection mechanism (fuse blows, circuit breaker trips, current limiter engages) activates.",
-            "Verify that the device safely enters a protected state without generating excessive heat, smoke, or fire.",
-            "After the protection activates, confirm that the device is not permanently damaged (unless it's a non-resettable fuse).",
-            "Perform a functional check after the test (if applicable)."
-        ],
-        "parameters": {
-            "Overcurrent Level": "1.5 times nominal current up to short circuit",
-            "Activation Time": "Within specified limits (e.g., < 1 second for severe overload)",
-            "Monitoring": "Current, Voltage, Temperature"
-        },
-        "equipment": ["Programmable Power Supply", "Electronic Load", "High-Speed Ammeter", "Thermal Camera"]
-    },
-    "insulation resistance test": {
-        "name": "Insulation Resistance Test",
-        "standard": "Based on IEC 60364-6 / ISO 6469-1",
-        "description": "This test measures the electrical resistance of insulation materials to ensure they adequately prevent current leakage, which is crucial for safety and proper function, especially in high-voltage applications.",
-        "procedure": [
-            "Isolate the DUT from all power sources and ensure all capacitors are discharged.",
-            "Connect the insulation resistance tester (megohmmeter) between the conductors and ground, or between different insulated conductors.",
-            "Apply a specified DC test voltage (e.g., 500V or 1000V) for a set duration.",
-            "Read and record the insulation resistance value.",
-            "Repeat for all relevant insulation points.",
-            "The measured resistance must exceed the specified minimum value."
-        ],
-        "parameters": {
-            "Test Voltage": "500V DC or 1000V DC",
-            "Minimum Resistance": "Generally > 1 MΩ (operating) / > 5 MΩ (new product)",
-            "Test Duration": "1 minute"
-        },
-        "equipment": ["Insulation Resistance Tester (Megohmmeter)"]
-    },
-    "dielectric strength test": {
-        "name": "Dielectric Strength (Hipot) Test",
-        "standard": "Based on IEC 60950-1 / IEC 62368-1",
-        "description": "This test applies a high voltage across insulation barriers to confirm they can withstand electrical stress without breaking down, preventing electric shock hazards.",
-        "procedure": [
-            "Isolate the DUT from all power sources.",
-            "Connect a Hipot tester across the insulation barrier (e.g., between primary and secondary circuits, or between live parts and accessible conductive parts).",
-            "Gradually increase the test voltage to the specified level (AC or DC).",
-            "Maintain the test voltage for the specified duration.",
-            "Monitor for breakdown (arc-over) or excessive leakage current.",
-            "The insulation must withstand the voltage without breakdown or exceeding the current limit."
-        ],
-        "parameters": {
-            "Test Voltage": "e.g., 1500V AC or 2121V DC (for basic insulation)",
-            "Test Duration": "60 seconds or 1 second (production line)",
-            "Leakage Current Limit": "Typically < 5 mA"
-        },
-        "equipment": ["Hipot Tester (Dielectric Withstand Tester)"]
-    },
-    "electrostatic discharge (esd) test": {
-        "name": "Electrostatic Discharge (ESD) Test",
-        "standard": "Based on ISO 10605 / IEC 61000-4-2",
-        "description": "This test evaluates the device's immunity to electrostatic discharges, which can occur from human contact or charged objects, potentially causing malfunctions or damage to sensitive electronics.",
-        "procedure": [
-            "Place the DUT on a ground reference plane.",
-            "Apply ESD pulses to various points on the DUT (contact discharge) and to nearby surfaces (air discharge).",
-            "Perform both positive and negative polarity discharges.",
-            "Monitor the DUT for any functional degradation, resets, or permanent damage during and after discharges.",
-            "The device should either operate without interruption or recover to its normal state after the discharge."
-        ],
-        "parameters": {
-            "Contact Discharge Voltage": "±2 kV to ±8 kV",
-            "Air Discharge Voltage": "±2 kV to ±15 kV (depending on severity level)",
-            "Number of Discharges": "10 per test point",
-            "Repetition Rate": "Minimum 1 second between discharges"
-        },
-        "equipment": ["ESD Simulator Gun", "Ground Reference Plane", "Coupling Plane"]
-    },
-    "emi/emc test (electromagnetic compatibility)": {
-        "name": "EMI/EMC Test (Electromagnetic Compatibility)",
-        "standard": "Based on CISPR 25 (Emissions) / ISO 11452 (Immunity) / ECE R10",
-        "description": "This is a broad category of tests ensuring the device does not interfere with other electronic systems (emissions) and is immune to external electromagnetic interference (immunity).",
-        "procedure": [
-            "This involves multiple sub-tests (Radiated Emissions, Conducted Emissions, Radiated Immunity, Conducted Immunity).",
-            "Each sub-test has specific setup, instrumentation, and pass/fail criteria.",
-            "Generally, the DUT is placed in an anechoic chamber or shielded room.",
-            "Measurements are taken across a specified frequency range.",
-            "The DUT must meet defined limits for emitted electromagnetic energy and operate without degradation when subjected to specified levels of interference."
-        ],
-        "parameters": {
-            "Frequency Ranges": "Vary by sub-test (e.g., 150 kHz - 1 GHz)",
-            "Limit Lines": "Defined by standard (e.g., dBµV/m for emissions, V/m for immunity)",
-            "Modulation": "Specific modulations for immunity (e.g., AM, Pulse)"
-        },
-        "equipment": ["Anechoic Chamber", "EMI Receiver/Spectrum Analyzer", "Antennas", "Signal Generators", "Power Amplifiers"]
-    },
-    "conducted immunity test": {
-        "name": "Conducted Immunity Test (CI)",
-        "standard": "Based on ISO 11452-4 (BCI) / IEC 61000-4-6",
-        "description": "This test subjects the device to radio-frequency disturbances injected directly into its cables, simulating interference from nearby cables or power lines.",
-        "procedure": [
-            "Place the DUT on a ground plane.",
-            "Inject modulated RF signals onto the DUT's power and signal lines using a coupling clamp or CDNs (Coupling/Decoupling Networks).",
-            "Sweep the frequency range at specified power levels.",
-            "Monitor the DUT for any functional anomalies or degradation during the test.",
-            "The device must maintain normal operation throughout the test without error or degradation below acceptable limits."
-        ],
-        "parameters": {
-            "Frequency Range": "150 kHz to 200 MHz",
-            "Test Level": "e.g., 100 mA (BCI) / 3 Vrms, 10 Vrms (IEC)",
-            "Modulation": "80% AM, 1 kHz sine wave"
-        },
-        "equipment": ["RF Signal Generator", "Power Amplifier", "Coupling/Decoupling Networks (CDNs) or Bulk Current Injection (BCI) Probe", "Spectrum Analyzer"]
-    },
-    "radiated emissions test": {
-        "name": "Radiated Emissions Test (RE)",
-        "standard": "Based on CISPR 25 / ECE R10 / FCC Part 15",
-        "description": "This test measures the electromagnetic fields radiated by the device into the air to ensure it does not cause interference with other electronic systems.",
-        "procedure": [
-            "Place the DUT in an anechoic chamber or on an open-area test site (OATS).",
-            "Operate the DUT in its typical modes.",
-            "Scan across a specified frequency range using calibrated antennas at defined measurement distances.",
-            "Measure both horizontal and vertical polarization of the electric field.",
-            "The measured emissions must fall below the specified limit lines.",
-            "Identify and investigate any emissions exceeding limits."
-        ],
-        "parameters": {
-            "Frequency Range": "30 MHz to 1 GHz (or higher)",
-            "Measurement Distance": "1 meter, 3 meters, or 10 meters",
-            "Limit Lines": "Defined in dBµV/m by the standard",
-            "Antenna Types": "Biconical, Log-Periodic, Horn"
-        },
-        "equipment": ["Anechoic Chamber / OATS", "EMI Receiver / Spectrum Analyzer", "Antennas", "Preamplifiers", "Turntable", "Antenna Mast"]
-    },
-    "endurance / life cycle test": {
-        "name": "Endurance / Life Cycle Test",
-        "standard": "Generic, application-specific",
-        "description": "This test simulates the total expected operational life of a component to identify potential long-term wear-out mechanisms or degradation over time.",
-        "procedure": [
-            "Operate the DUT continuously or through specified cycles (e.g., power on/off cycles, switch actuations, motor runs).",
-            "Conduct the test under nominal environmental conditions (or accelerated conditions if specified).",
-            "Periodically perform functional checks and measure key performance parameters.",
-            "Record any failures, degradation, or changes in performance over the test duration.",
-            "The device should maintain its specified performance throughout its expected lifespan."
-        ],
-        "parameters": {
-            "Test Duration": "Equivalent to 5 to 15 years of operational life (e.g., 5000 hours, 100,000 cycles)",
-            "Operating Conditions": "Nominal voltage, current, temperature",
-            "Monitoring Frequency": "Regular intervals or continuous logging"
-        },
-        "equipment": ["Test Bench with DUT fixtures", "Programmable Controller (for cycling)", "Data Logger", "Measurement Instruments"]
-    },
-    "connector durability test": {
-        "name": "Connector Durability Test",
-        "standard": "Based on USCAR-2 / IEC 60512-9",
-        "description": "This test assesses the mechanical and electrical integrity of electrical connectors over repeated mating and unmating cycles, simulating their operational lifespan.",
-        "procedure": [
-            "Mount the connector to a test fixture that simulates its application.",
-            "Perform repeated mating and unmating cycles using an automated machine.",
-            "Conduct the test at a specified speed and force.",
-            "Periodically perform electrical measurements (e.g., contact resistance, insulation resistance) during or after a set number of cycles.",
-            "Visually inspect the connector for mechanical damage (e.g., deformation, wear, breakage of contacts or housing).",
-            "The contact resistance should remain stable and within limits, and no mechanical damage should occur."
-        ],
-        "parameters": {
-            "Number of Cycles": "10 to 1000 cycles (depending on application)",
-            "Mating/Unmating Force": "Measured or controlled by machine",
-            "Contact Resistance Limit": "Typically < 10 mΩ",
-            "Test Environment": "Room ambient (or combined with environmental tests)"
-        },
-        "equipment": ["Connector Mating/Unmating Machine", "Contact Resistance Meter", "Optical Inspection Tools"]
-    }
-}
-
-# --- COMPLETE, UNIFIED, and FULLY POPULATED Component Database ---
-UNIFIED_COMPONENT_DB = {
-    "cga3e1x7r1e105k080ac": {"Manufacturer":"TDK", "Product Category":"Multilayer Ceramic Capacitors MLCC - SMD/SMT", "RoHS":"Yes", "Capacitance":"1 uF", "Voltage Rating DC":"25 VDC", "Dielectric":"X7R", "Tolerance":"10 %", "Case Code - in":"0603", "Case Code - mm":"1608", "Termination Style":"SMD/SMT", "Termination":"Standard", "Minimum Operating Temperature":"-55 C", "Maximum Operating Temperature":"+125 C", "Length":"1.6 mm", "Width":"0.8 mm", "Height":"0.8 mm", "Product":"Automotive MLCCs", "Qualification":"AEC-Q200"},
-    "spc560p50l3": {"Manufacturer": "STMicroelectronics", "Product Category": "MCU", "RoHS": "Yes", "CPU Core": "PowerPC e200z0h", "Frequency": "64 MHz", "RAM Size": "48KB", "Flash Size": "512KB", "Package": "LQFP-100", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q100"},
-    "tja1051t": {"Manufacturer": "NXP", "Product Category": "CAN Transceiver", "RoHS": "Yes", "Data Rate": "1 Mbps", "Voltage Rating DC": "5V", "Package": "SO-8", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q100"},
-    "tle4275g": {"Manufacturer": "Infineon", "Product Category": "LDO Regulator", "RoHS": "Yes", "Output Voltage": "5V", "Output Current": "450mA", "Package": "TO-252-3", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "150 C", "Qualification": "AEC-Q100"},
-    "fsbb30ch60f": {"Manufacturer": "onsemi", "Product Category": "IGBT Module", "RoHS": "Yes", "Voltage Rating DC": "600V", "Current": "30A", "Package": "SPM27-CC", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "150 C", "Product": "Smart Power Module"},
-    "wslp2512r0100fe": {"Manufacturer": "Vishay", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "10 mOhm", "Power": "1W", "Tolerance": "1%", "Case Code - in": "2512", "Minimum Operating Temperature": "-65 C", "Maximum Operating Temperature": "170 C", "Qualification": "AEC-Q200"},
-    "bq76952": {"Manufacturer": "Texas Instruments", "Product Category": "Battery Monitor", "RoHS": "Yes", "Cell Count": "3-16", "Interface": "I2C, SPI", "Package": "TQFP-48", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "85 C", "Qualification": "AEC-Q100"},
-    "irfz44n": {"Manufacturer": "Infineon", "Product Category": "MOSFET", "RoHS": "Yes", "Vds": "55V", "Id": "49A", "Rds(on)": "17.5 mOhm", "Package": "TO-220AB", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "175 C"},
-    "1n4007": {"Manufacturer": "Multiple", "Product Category": "Diode", "RoHS": "Yes", "VRRM": "1000V", "If(AV)": "1A", "Package": "DO-41", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "150 C"},
-    "fh28-10s-0.5sh(05)": {"Manufacturer": "Hirose", "Product Category": "Connector", "RoHS": "Yes", "Pitch": "0.5mm", "Positions": "10", "Current": "0.5A", "Package": "FFC/FPC", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "105 C"},
-    "gcm155l81e104ke02d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.1uF", "Voltage Rating DC": "25V", "Dielectric": "X8L", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "150 C", "Qualification": "AEC-Q200"},
-    "grt1555c1e220ja02j": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "22pF", "Voltage Rating DC": "25V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt155r61a475me13d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "4.7uF", "Voltage Rating DC": "10V", "Dielectric": "X5R", "Case Code - mm": "1005", "Tolerance": "20%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "85 C", "Qualification": "AEC-Q200"},
-    "grt31cr61a476ke13l": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "47uF", "Voltage Rating DC": "10V", "Dielectric": "X5R", "Case Code - mm": "3216", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "85 C", "Qualification": "AEC-Q200"},
-    "cga2b2c0g1h180j050ba": {"Manufacturer": "TDK", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "18pF", "Voltage Rating DC": "50V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "c0402c103k4racauto": {"Manufacturer": "KEMET", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "10nF", "Voltage Rating DC": "16V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "gcm1555c1h101ja16d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "100pF", "Voltage Rating DC": "50V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt155r71h104ke01d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.1uF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt21br61e226me13l": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "22uF", "Voltage Rating DC": "25V", "Dielectric": "X5R", "Case Code - mm": "2012", "Tolerance": "20%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "85 C", "Qualification": "AEC-Q200"},
-    "grt1555c1h150fa02d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "15pF", "Voltage Rating DC": "50V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "1%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "0402yc222j4t2a": {"Manufacturer": "AVX", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "2.2nF", "Voltage Rating DC": "16V", "Dielectric": "X7R", "Case Code - in": "0402", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "gcm1555c1h560fa16d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "56pF", "Voltage Rating DC": "50V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "1%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt1555c1h330fa02d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "33pF", "Voltage Rating DC": "50V", "Dielectric": "C0G", "Case Code - mm": "1005", "Tolerance": "1%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt188c81a106me13d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "10uF", "Voltage Rating DC": "10V", "Dielectric": "X6S", "Case Code - mm": "1608", "Tolerance": "20%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "105 C", "Qualification": "AEC-Q200"},
-    "umk212b7105kfna01": {"Manufacturer": "Taiyo Yuden", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "1uF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - in": "0805", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C"},
-    "c1206c104k5racauto": {"Manufacturer": "KEMET", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.1uF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - in": "1206", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "grt31cr61h106ke01k": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "10uF", "Voltage Rating DC": "50V", "Dielectric": "X5R", "Case Code - in": "1206", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "85 C", "Qualification": "AEC-Q200"},
-    "c0402c333k4racauto": {"Manufacturer": "KEMET", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "33nF", "Voltage Rating DC": "16V", "Dielectric": "X7R", "Case Code - in": "0402", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "cl10b474ko8vpnc": {"Manufacturer": "Samsung", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.47uF", "Voltage Rating DC": "16V", "Dielectric": "X7R", "Case Code - in": "0603", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C"},
-    "gcm155r71c224ke02d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.22uF", "Voltage Rating DC": "16V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "gcm155r71h102ka37j": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "1nF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "50tpv330m10x10.5": {"Manufacturer": "Panasonic", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "330uF", "Voltage Rating DC": "50V", "Type": "Polymer", "ESR": "18 mOhm", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "105 C"},
-    "cl31b684kbhwpne": {"Manufacturer": "Samsung", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "0.68uF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - in": "1206", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C"},
-    "gcm155r71h272ka37d": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "2.7nF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "edk476m050s9haa": {"Manufacturer": "KEMET", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "47uF", "Voltage Rating DC": "50V", "Type": "Aluminum Electrolytic", "ESR": "700 mOhm", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "105 C"},
-    "gcm155r71h332ka37j": {"Manufacturer": "Murata", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "3.3nF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - mm": "1005", "Tolerance": "10%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "a768ke336m1hlae042": {"Manufacturer": "KEMET", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "33uF", "Voltage Rating DC": "50V", "Type": "Polymer", "ESR": "42 mOhm", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "ac0402jrx7r9bb152": {"Manufacturer": "Yageo", "Product Category": "Capacitor", "RoHS": "Yes", "Capacitance": "1.5nF", "Voltage Rating DC": "50V", "Dielectric": "X7R", "Case Code - in": "0402", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "d5v0h1b2lpq-7b": {"Manufacturer": "Diodes Inc.", "Product Category": "TVS Diode", "RoHS": "Yes", "V Rwm": "5V", "Power": "30W", "Package": "X2-DFN1006-2", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "150 C"},
-    "szmmbz9v1alt3g": {"Manufacturer": "onsemi", "Product Category": "Zener Diode", "RoHS": "Yes", "Vz": "9.1V", "Power": "225mW", "Tolerance": "5%", "Package": "SOT-23", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "150 C"},
-    "d24v0s1u2tq-7": {"Manufacturer": "Diodes Inc.", "Product Category": "TVS Diode Array", "RoHS": "Yes", "V Rwm": "24V", "Channels": "1", "Package": "SOD-323", "Minimum Operating Temperature": "-65 C", "Maximum Operating Temperature": "150 C"},
-    "b340bq-13-f": {"Manufacturer": "Diodes Inc.", "Product Category": "Schottky Diode", "RoHS": "Yes", "VRRM": "40V", "If(AV)": "3A", "Package": "SMC", "Minimum Operating Temperature": "-65 C", "Maximum Operating Temperature": "150 C", "Qualification": "AEC-Q101"},
-    "tld8s22ah": {"Manufacturer": "Infineon", "Product Category": "TVS Diode", "RoHS": "Yes", "V Rwm": "22V", "Power": "8000W", "Package": "DO-218AB", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "175 C", "Qualification": "AEC-Q101"},
-    "b260aq-13-f": {"Manufacturer": "Diodes Inc.", "Product Category": "Schottky Diode", "RoHS": "Yes", "VRRM": "60V", "If(AV)": "2A", "Package": "SMB", "Minimum Operating Temperature": "-65 C", "Maximum Operating Temperature": "150 C", "Qualification": "AEC-Q101"},
-    "rb530sm-40fht2r": {"Manufacturer": "ROHM", "Product Category": "Schottky Diode", "RoHS": "Yes", "VRM": "40V", "IF": "30mA", "Package": "SOD-523", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C"},
-    "74279262": {"Manufacturer": "Würth Elektronik", "Product Category": "Ferrite Bead", "RoHS": "Yes", "Impedance @ 100MHz": "220 Ohm", "Current": "3A", "Package": "0805", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "742792641": {"Manufacturer": "Würth Elektronik", "Product Category": "Ferrite Bead", "RoHS": "Yes", "Impedance @ 100MHz": "1000 Ohm", "Current": "1.5A", "Package": "0805", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "742792625": {"Manufacturer": "Würth Elektronik", "Product Category": "Ferrite Bead", "RoHS": "Yes", "Impedance @ 100MHz": "500 Ohm", "Current": "2.5A", "Package": "0805", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "742792150": {"Manufacturer": "Würth Elektronik", "Product Category": "Ferrite Bead", "RoHS": "Yes", "Impedance @ 100MHz": "30 Ohm", "Current": "6A", "Package": "1206", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "voma617a-4x001t": {"Manufacturer": "Vishay", "Product Category": "Optocoupler", "RoHS": "Yes", "Type": "Transistor Output", "CTR": "100-200%", "Package": "SOP-4", "Isolation": "3750Vrms", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "110 C", "Qualification": "AEC-Q101"},
-    "534260610": {"Manufacturer": "Molex", "Product Category": "Connector", "RoHS": "Yes", "Type": "Pico-Lock", "Positions": "6", "Pitch": "1.5mm", "Termination Style": "Wire-to-Board Header", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "105 C"},
-    "fh52-40s-0.5sh(99)": {"Manufacturer": "Hirose", "Product Category": "Connector", "RoHS": "Yes", "Pitch": "0.5mm", "Positions": "40", "Current": "0.5A", "Termination Style": "FFC/FPC", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "105 C"},
-    "744235510": {"Manufacturer": "Würth Elektronik", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "51uH", "Current": "1.8A", "Package": "Shielded SMD", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "lqw15an56nj8zd": {"Manufacturer": "Murata", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "56nH", "Current": "350mA", "Case Code - in": "0402", "Tolerance": "5%", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "spm7054vt-220m-d": {"Manufacturer": "Sumida", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "22uH", "Current": "3.1A", "Package": "7mm SMD", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C"},
-    "744273801": {"Manufacturer": "Würth Elektronik", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "8uH", "Current": "1.8A", "Package": "Shielded SMD", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "74404084068": {"Manufacturer": "Würth Elektronik", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "6.8uH", "Current": "2.2A", "Package": "0804", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "125 C"},
-    "744231091": {"Manufacturer": "Würth Elektronik", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "0.9uH", "Current": "6.5A", "Package": "Shielded SMD", "Minimum Operating Temperature": "-40 C", "Maximum Operating Temperature": "150 C", "Qualification": "AEC-Q200"},
-    "mlz2012m6r8htd25": {"Manufacturer": "TDK", "Product Category": "Inductor", "RoHS": "Yes", "Inductance": "6.8uH", "Current": "300mA", "Case Code - in": "0805", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "125 C", "Qualification": "AEC-Q200"},
-    "rq3g270bjfratcb": {"Manufacturer": "ROHM", "Product Category": "MOSFET", "RoHS": "Yes", "Vds": "20V", "Id": "27A", "Rds(on)": "2.8 mOhm", "Package": "HSMT8", "Minimum Operating Temperature": "-55 C", "Maximum Operating Temperature": "150 C"},
-    "pja138k-au_r1_000a1": {"Manufacturer": "PANJIT", "Product Category": "MOSFET", "RoHS": "Yes", "Vds": "100V", "Id": "7A", "Rds(on)": "138 mOhm", "Package": "SOT-223", "Qualification": "AEC-Q101"},
-    "dmp2070uq-7": {"Manufacturer": "Diodes Inc.", "Product Category": "MOSFET", "RoHS": "Yes", "Vds": "20V", "Id": "5.6A", "Rds(on)": "38 mOhm", "Package": "SOT-23", "Qualification": "AEC-Q101"},
-    "ac0402jr-070rl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "0 Ohm", "Power": "0.063W", "Case Code - in": "0402", "Product": "Jumper", "Qualification": "AEC-Q200"},
-    "ac0402fr-07100kl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "100 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft158k": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "158 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft30k0": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "30 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft127k": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "127 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmc10k204fth": {"Manufacturer": "Kamaya", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "200 kOhm", "Power": "0.125W", "Tolerance": "1%", "Case Code - in": "0805", "Qualification": "AEC-Q200"},
-    "erj-2rkf2201x": {"Manufacturer": "Panasonic", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "2.2 kOhm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "erj-2rkf1002x": {"Manufacturer": "Panasonic", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "10 kOhm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "wr04x1004ftl": {"Manufacturer": "Walsin", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "1 MOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "wr04x10r0ftl": {"Manufacturer": "Walsin", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "10 Ohm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rc0603fr-0759rl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "59 Ohm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0603", "Qualification": "AEC-Q200"},
-    "ac0402fr-07100rl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "100 Ohm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "ac0402fr-076k04l": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "6.04 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "ac0402fr-07510rl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "510 Ohm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "crgcq0402f56k": {"Manufacturer": "TE Connectivity", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "56 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft24k9": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "24.9 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft5k36": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "5.36 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0603ft12k0": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "12 kOhm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0603", "Qualification": "AEC-Q200"},
-    "rmcf0402ft210k": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "210 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "ltr18ezpfsr015": {"Manufacturer": "ROHM", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "15 mOhm", "Power": "1.5W", "Tolerance": "1%", "Case Code - in": "1206", "Qualification": "AEC-Q200"},
-    "erj-pa2j102x": {"Manufacturer": "Panasonic", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "1 kOhm", "Power": "0.25W", "Tolerance": "5%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft5k10": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "5.1 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0603ft100r": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "100 Ohm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0603", "Qualification": "AEC-Q200"},
-    "ac0402jr-074k7l": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "4.7 kOhm", "Power": "0.063W", "Tolerance": "5%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "crf0805-fz-r010elf": {"Manufacturer": "Bourns", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "10 mOhm", "Power": "0.5W", "Tolerance": "1%", "Case Code - in": "0805", "Qualification": "AEC-Q200"},
-    "rmcf0402ft3k16": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "3.16 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft3k48": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "3.48 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft1k50": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "1.5 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf0402ft4k02": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "4.02 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "rmcf1206zt0r00": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "0 Ohm", "Power": "0.25W", "Case Code - in": "1206", "Product": "Jumper", "Qualification": "AEC-Q200"},
-    "rmcf0402ft402k": {"Manufacturer": "Stackpole", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "402 kOhm", "Power": "0.063W", "Tolerance": "1%", "Case Code - in": "0402", "Qualification": "AEC-Q200"},
-    "ac0603fr-7w20kl": {"Manufacturer": "Yageo", "Product Category": "Resistor", "RoHS": "Yes", "Resistance": "20 kOhm", "Power": "0.1W", "Tolerance": "1%", "Case Code - in": "0603", "Qualification": "AEC-Q200"},
-    "h164yp": {"Manufacturer": "Yageo", "Product Category": "Resistor Array", "RoHS": "Yes", "Resistance": "10 kOhm", "Elements": "4", "Package": "0804", "Tolerance": "5%"},
-    "zldo1117qg33ta": {"Manufacturer": "Diodes Inc.", "Product Category": "LDO Regulator", "RoHS": "Yes", "Output Voltage": "3.3V", "Output Current": "1A", "Package": "SOT-223", "Qualification": "AEC-Q100"},
-    "ap63357qzv-7": {"Manufacturer": "Diodes Inc.", "Product Category": "Buck Converter", "RoHS": "Yes", "Input Voltage": "3.8V-32V", "Output Current": "3.5A", "Package": "SOT-563", "Qualification": "AEC-Q100"},
-    "pca9306idcurq1": {"Manufacturer": "Texas Instruments", "Product Category": "I2C Translator", "RoHS": "Yes", "Channels": "2", "Voltage Range": "1V-5.5V", "Package": "VSSOP-8", "Qualification": "AEC-Q100"},
-    "mcp2518fdt-e/sl": {"Manufacturer": "Microchip", "Product Category": "CAN FD Controller", "RoHS": "Yes", "Data Rate": "8 Mbps", "Interface": "SPI", "Package": "SOIC-14", "Qualification": "AEC-Q100"},
-    "iso1042bqdwvq1": {"Manufacturer": "Texas Instruments", "Product Category": "CAN Transceiver", "RoHS": "Yes", "Product": "Isolated", "Data Rate": "5 Mbps", "Package": "SOIC-16", "Qualification": "AEC-Q100"},
-    "pesd2canfd27v-tr": {"Manufacturer": "Nexperia", "Product Category": "ESD Suppressor", "RoHS": "Yes", "Bus Type": "CAN", "V Rwm": "27V", "Package": "SOT-23", "Qualification": "AEC-Q101"},
-    "lt8912b": {"Manufacturer": "Analog Devices", "Product Category": "MIPI DSI to LVDS Bridge", "RoHS": "Yes", "Lanes": "4", "Resolution": "1080p", "Package": "QFN-48"},
-    "sn74lv1t34qdckrq1": {"Manufacturer": "Texas Instruments", "Product Category": "Buffer Gate", "RoHS": "Yes", "Channels": "1", "Direction": "Uni-Directional", "Package": "SC-70", "Qualification": "AEC-Q100"},
-    "ncp164csnadjt1g": {"Manufacturer": "onsemi", "Product Category": "LDO Regulator", "RoHS": "Yes", "Output Voltage": "Adj", "Output Current": "250mA", "Package": "TSOP-5", "Qualification": "AEC-Q100"},
-    "20279-001e-03": {"Manufacturer": "Amphenol", "Product Category": "Antenna", "RoHS": "Yes", "Product": "GPS", "Gain": "28 dBi", "Termination Style": "Adhesive"},
-    "ncv8161asn180t1g": {"Manufacturer": "onsemi", "Product Category": "LDO Regulator", "RoHS": "Yes", "Output Voltage": "1.8V", "Output Current": "450mA", "Package": "TSOP-5", "Qualification": "AEC-Q100"},
-    "drtr5v0u2sr-7": {"Manufacturer": "Diodes Inc.", "Product Category": "ESD Suppressor", "RoHS": "Yes", "V Rwm": "5V", "Channels": "2", "Package": "SOT-23", "Qualification": "AEC-Q101"},
-    "ncv8161asn330t1g": {"Manufacturer": "onsemi", "Product Category": "LDO Regulator", "RoHS": "Yes", "Output Voltage": "3.3V", "Output Current": "450mA", "Package": "TSOP-5", "Qualification": "AEC-Q100"},
-    "ecmf04-4hswm10y": {"Manufacturer": "STMicroelectronics", "Product Category": "ESD Filter", "RoHS": "Yes", "Channels": "4", "Bus Type": "HDMI", "Package": "WLCSP-10", "Qualification": "AEC-Q101"},
-    "nxs0102dc-q100h": {"Manufacturer": "Nexperia", "Product Category": "Level Translator", "RoHS": "Yes", "Channels": "2", "Direction": "Bi-Directional", "Package": "VSSOP-8", "Qualification": "AEC-Q100"},
-    "cf0505xt-1wr3": {"Manufacturer": "Mornsun", "Product Category": "DC/DC Converter", "RoHS": "Yes", "Power": "1W", "Input Voltage": "4.5V-5.5V", "Output Voltage": "5V", "Isolation": "3kVDC", "Package": "SIP"},
-    "iam-20680ht": {"Manufacturer": "TDK InvenSense", "Product Category": "IMU", "RoHS": "Yes", "Axes": "6", "Interface": "SPI, I2C", "Package": "LGA-16", "Qualification": "AEC-Q100"},
-    "attiny1616-szt-vao": {"Manufacturer": "Microchip", "Product Category": "MCU", "RoHS": "Yes", "CPU Core": "AVR", "Frequency": "20MHz", "RAM Size": "2KB", "Flash Size": "16KB", "Package": "SOIC-24", "Qualification": "AEC-Q100"},
-    "tlv9001qdckrq1": {"Manufacturer": "Texas Instruments", "Product Category": "Op-Amp", "RoHS": "Yes", "Channels": "1", "GBW": "1MHz", "Package": "SC-70", "Qualification": "AEC-Q100"},
-    "qmc5883l": {"Manufacturer": "QST", "Product Category": "Magnetometer", "RoHS": "Yes", "Axes": "3", "Interface": "I2C", "Package": "LGA-12"},
-    "lm76202qpwprq1": {"Manufacturer": "Texas Instruments", "Product Category": "Ideal Diode Controller", "RoHS": "Yes", "Input Voltage": "3V-60V", "Package": "HTSSOP-16", "Qualification": "AEC-Q100"},
-    "bd83a04efv-me2": {"Manufacturer": "ROHM", "Product Category": "DC/DC Converter", "RoHS": "Yes", "Type": "Buck", "Input Voltage": "4.5V-40V", "Output Current": "4A", "Package": "HTSOP-J8", "Qualification": "AEC-Q100"},
-    "ecs-200-12-33q-jes-tr": {"Manufacturer": "ECS Inc.", "Product Category": "Crystal", "RoHS": "Yes", "Frequency": "20MHz", "Tolerance": "10ppm", "Package": "3.2x2.5mm", "Qualification": "AEC-Q200"},
-    "ecs-250-12-33q-jes-tr": {"Manufacturer": "ECS Inc.", "Product Category": "Crystal", "RoHS": "Yes", "Frequency": "25MHz", "Tolerance": "10ppm", "Package": "3.2x2.5mm", "Qualification": "AEC-Q200"},
-    "aggbp.25a.07.0060a": {"Manufacturer": "Taoglas", "Product Category": "Antenna", "RoHS": "Yes", "Product": "GPS Patch", "Frequency": "1575.42MHz", "Package": "25x25mm"},
-    "y4ete00a0aa": {"Manufacturer": "Quectel", "Product Category": "LTE Module", "RoHS": "Yes", "Series": "EC25-AFX", "Bands": "LTE-FDD, T-Mobile, AT&T", "Package": "LCC"},
-    "yf0023aa": {"Manufacturer": "Quectel", "Product Category": "LTE Antenna", "RoHS": "Yes", "Frequency Range": "698-2690MHz", "Cable": "RG178", "Termination": "MHF-I"},
-    "mb9df125": {"Manufacturer": "Cypress/Infineon", "Product Category": "MCU", "RoHS": "Yes", "CPU Core": "ARM Cortex-R4", "Frequency": "128MHz", "RAM Size": "96KB", "Flash Size": "1MB", "Package": "LQFP-208"},
-    "veml6031x00": {"Manufacturer": "Vishay", "Product Category": "Light Sensor", "RoHS": "Yes", "Product": "Ambient Light", "Interface": "I2C", "Package": "2x2mm OPLGA", "Qualification": "AEC-Q100"},
-    "01270019-00": {"Manufacturer": "Custom", "Product Category": "Cable Assembly", "Description": "Main harness wiring"},
-    "01270020-00": {"Manufacturer": "Custom", "Product Category": "Cable Assembly", "Description": "Display interface cable"},
-    "01270021-00": {"Manufacturer": "Custom", "Product Category": "Cable Assembly", "Description": "I/O port wiring"},
-    "p0024-03": {"Manufacturer": "Custom", "Product Category": "PCB", "Description": "Main Logic Board"},
-    "01270018-00": {"Manufacturer": "Custom", "Product Category": "Enclosure", "Description": "Main device housing"},
-    "01270010-02": {"Manufacturer": "Custom", "Product Category": "Accessory", "Description": "Mounting bracket kit"}
-}
-
-def intelligent_parser(text: str):
-    extracted_tests = []
-    lines = text.splitlines()
-    for line in lines:
-        line = line.strip()
-        if not line: continue
-        
-        test_data = {"TestName": "Not found", "Result": "N/A", "Actual": "Not found", "Standard": "Not found"}
-        
-        patterns = [
-            r'^(.*?)\s*-->\s*(Passed|Failed|Success)\s*-->\s*(.+)$',
-            r'^(.*?)\s*-->\s*(.+)$',
-            r'^\d+:\s*([A-Z_]+):\s*"([A-Z]+)"$',
-            r'^(.+?)\s+is\s+(success|failure|passed|failed)$',
-            r'^(.+?)\s+(Failed|Passed)$',
-        ]
-
-        match_found = False
-        for i, p in enumerate(patterns):
-            match = re.match(p, line, re.I)
-            if match:
-                groups = match.groups()
-                if i == 0: test_data.update({"TestName": groups[0].strip(), "Result": "PASS" if groups[1].lower() in ["passed", "success"] else "FAIL", "Actual": groups[2].strip()})
-                elif i == 1:
-                    result_str = groups[1].lower()
-                    result = "PASS" if "passed" in result_str or "success" in result_str else "FAIL" if "failed" in result_str else "INFO"
-                    test_data.update({"TestName": groups[0].strip(), "Result": result, "Actual": groups[1].strip()})
-                elif i == 2: test_data.update({"TestName": groups[0].replace("_", " ").strip(), "Result": groups[1].upper()})
-                elif i == 3: test_data.update({"TestName": groups[0].strip(), "Result": "PASS" if groups[1].lower() in ["success", "passed"] else "FAIL"})
-                elif i == 4: test_data.update({"TestName": groups[0].strip(), "Result": "PASS" if groups[1].lower() == "passed" else "FAIL"})
-                match_found = True
-                break
-        
-        if match_found:
-            KEYWORD_TO_STANDARD_MAP = {
-                "gps": "NMEA 0183", "gnss": "3GPP", "bluetooth": "Bluetooth Core Specification", "wifi": "IEEE 802.11",
-                "lte": "3GPP LTE", "can": "ISO 11898", "sensor": "AEC-Q104", "ip rating": "IEC 60529",
-                "short circuit": "AIS-156 / IEC 62133", "overcharge": "AIS-156", "vibration": "IEC 60068-2-6"
-            }
-            for keyword, standard in KEYWORD_TO_STANDARD_MAP.items():
-                if keyword in test_data["TestName"].lower():
-                    test_data["Standard"] = standard
-                    break
-            extracted_tests.append(test_data)
-            
+# Restored after a browser refresh or reconnect (parsed records come back from the result store)
+SESSION_SNAPSHOT_KEYS = ("reports_verified", "requirements_generated", "found_component", "searched_part", "last_report")
+restore_session(SESSION_SNAPSHOT_KEYS)
+
+
+# --- Component database and test knowledge base (read-only, loaded once per process; see catalog.py, catalog_db.py) ---
+CATALOG = get_catalog()
+UNIFIED_COMPONENT_DB = get_catalog_db()
+TEST_CASE_KNOWLEDGE_BASE = CATALOG.test_cases
+PARAMETRIC_ROWS = 500  # parametric search results shown at once
+
+def intelligent_parser(text: str, rule_pack=None, pages=None, source_name=""):
+    """
+    Parses line-oriented logs with an optional supplier rule pack followed by the built-in formats.
+    Repeat layouts are recognized and counted in the layout cache (see layout_cache.py).
+    """
+    compiled = compile_rule_pack(rule_pack)
+    stats = new_rule_stats(compiled)
+    extracted_tests, fingerprint, reused = parse_with_layout_cache(compiled, text, pages, stats, source_name)
+    st.session_state.rule_stats = stats
+    st.session_state.layout_match = {"fingerprint": fingerprint, "reused": reused}
     return extracted_tests
 
-def parse_report(uploaded_file):
+def parse_report(uploaded_file, rule_pack=None, force_full=False):
     if not uploaded_file: return []
     try:
         file_extension = os.path.splitext(uploaded_file.name.lower())[1]
@@ -666,16 +112,81 @@ def parse_report(uploaded_file):
             rename_map = {'test': 'TestName', 'standard': 'Standard', 'expected': 'Expected', 'actual': 'Actual', 'result': 'Result', 'description': 'Description', 'part': 'TestName', 'manufacturer pn': 'Actual'}
             df.rename(columns=rename_map, inplace=True)
             return df.to_dict('records')
+        elif file_extension in ['.html', '.htm']:
+            uploaded_file.seek(0)
+            return parse_html_report(uploaded_file)
         elif file_extension == '.pdf':
-             with pdfplumber.open(uploaded_file) as pdf:
-                content = "".join(page.extract_text() + "\n" for page in pdf.pages if page.extract_text())
+            pruning, memo, page_cache = new_pruning_stats(), {}, get_page_cache()
+            with pdfplumber.open(uploaded_file) as pdf:
+                pages = iter_relevant_pages(pdf, force_full, pruning, compile_rule_pack(rule_pack))
+                page_texts = [text for text in (page_cache.page_text(page, memo, pruning) for page in pages) if text]
+            st.session_state.page_pruning = pruning
+            content = "".join(text + "\n" for text in page_texts)
+            return intelligent_parser(content, rule_pack, pages=page_texts, source_name=uploaded_file.name)
         else:
-            content = uploaded_file.getvalue().decode('utf-8', errors='ignore')
-        return intelligent_parser(content)
+            content = decode_upload(uploaded_file, errors='ignore')
+        return intelligent_parser(content, rule_pack, source_name=uploaded_file.name)
     except Exception as e:
         st.error(f"An error occurred while parsing: {e}")
         return []
 
+PARSE_DIAGNOSTICS = ("rule_stats", "layout_match", "page_pruning")
+
+def report_key(uploaded_file, rule_pack=None, force_full=False, mode="full"):
+    """Content-addressed key of an upload parsed with the given options."""
+    with upload_view(uploaded_file) as view:
+        digest = get_parse_cache().upload_digest(uploaded_file, view)
+    file_extension = os.path.splitext(uploaded_file.name.lower())[1]
+    return parse_key(digest, file_extension, compile_rule_pack(rule_pack).digest, force_full, mode)
+
+def load_cached_report(key):
+    """Returns a cached parse ({"records": ..., diagnostics...}) from memory or the host-wide result store, or None."""
+    cache = get_parse_cache()
+    cached = cache.get(key)
+    if cached is None:
+        table = get_result_store().get(key)
+        if table is not None:
+            cached = {"records": list(table), **table.meta.get("diagnostics", {})}
+            table.close()
+            cache.put(key, cached)
+    return cached
+
+def store_report(key, uploaded_file, records, diagnostics):
+    """Caches a parse in memory and in the result store, and remembers it as the session's last report."""
+    get_parse_cache().put(key, {"records": records, **diagnostics})
+    try:
+        get_result_store().put(key, records, {"diagnostics": diagnostics, "source_bytes": uploaded_file.size})
+    except OSError as e:  # a full or read-only cache disk must not fail the parse
+        st.caption(f"Result not stored for other replicas: {e}")
+    st.session_state.last_report = {"key": key, "name": uploaded_file.name, "results": len(records)}
+
+def find_cached_report(uploaded_file, rule_pack=None, force_full=False):
+    """Returns (key, cached parse) of an earlier full or quick-preview parse of the same content, or (None, None)."""
+    for mode in ("full", "preview"):
+        key = report_key(uploaded_file, rule_pack, force_full, mode=mode)
+        cached = load_cached_report(key)
+        if cached is not None:
+            return key, cached
+    return None, None
+
+def parse_report_cached(uploaded_file, rule_pack=None, force_full=False):
+    """
+    parse_report through the process-wide parse cache, then the host-wide result store;
+    a hit also restores the parse diagnostics.
+    """
+    if not uploaded_file: return []
+    key = report_key(uploaded_file, rule_pack, force_full)
+    cached = load_cached_report(key)
+    if cached is None:
+        records = parse_report(uploaded_file, rule_pack, force_full)
+        if records:  # failures are not cached so that their error message shows again
+            store_report(key, uploaded_file, records, {name: st.session_state.get(name) for name in PARSE_DIAGNOSTICS})
+        return records
+    for name in PARSE_DIAGNOSTICS:
+        st.session_state[name] = cached.get(name)
+    st.session_state.last_report = {"key": key, "name": uploaded_file.name, "results": len(cached["records"])}
+    return cached["records"]
+
 def display_test_card(test_case, color):
     details = f"<b>🧪 Test:</b> {test_case.get('TestName', 'N/A')}<br>"
     for key, label in {'Standard': '📘 Standard', 'Expected': '🎯 Expected', 'Actual': '📌 Actual', 'Description': '💬 Description'}.items():
@@ -684,6 +195,68 @@ def display_test_card(test_case, color):
             details += f"<b>{label}:</b> {value}<br>"
     st.markdown(f"<div class='card' style='border-left-color:{color};'>{details}</div>", unsafe_allow_html=True)
 
+def display_report_results(parsed_data, partial=False, max_failures=25):
+    """Shows the pass/fail summary; a partial view shows counts so far and only the first failures."""
+    passed = [t for t in parsed_data if "PASS" in str(t.get("Result", "")).upper()]
+    failed = [t for t in parsed_data if "FAIL" in str(t.get("Result", "")).upper()]
+    others = [t for t in parsed_data if not ("PASS" in str(t.get("Result", "")).upper() or "FAIL" in str(t.get("Result", "")).upper())]
+
+    st.markdown(f"### Found {len(passed)} Passed, {len(failed)} Failed, and {len(others)} Other items{' so far' if partial else ''}.")
+
+    if partial:
+        if failed:
+            with st.expander(f"🔴 First Failed Cases ({min(len(failed), max_failures)} of {len(failed)} so far)", expanded=True):
+                for t in failed[:max_failures]: display_test_card(t, '#c43a31')
+        return
+
+    if passed:
+        with st.expander("✅ Passed Cases", expanded=True):
+            for t in passed: display_test_card(t, '#1e9f50')
+    if failed:
+        with st.expander("🔴 Failed Cases", expanded=True):
+            for t in failed: display_test_card(t, '#c43a31')
+    if others:
+        with st.expander("ℹ️ Other/Informational Items", expanded=False):
+            for t in others: display_test_card(t, '#808080')
+
+def display_rule_stats(rule_stats):
+    """Shows per-rule match counts and CPU time for the last parse."""
+    if not rule_stats:
+        return
+    with st.expander("⏱️ Parsing Rule Statistics", expanded=False):
+        st.dataframe(pd.DataFrame(rule_stats), use_container_width=True)
+        tripped = [s["Rule"] for s in rule_stats if s["Tripped"]]
+        if tripped:
+            st.warning(f"These rules exceeded the per-line time budget and were switched off for the rest of the report: {', '.join(tripped)}")
+
+def display_report_job(job):
+    """Renders a background parse; refreshes every second until the job completes."""
+    @st.fragment(run_every=None if job.done else 1.0)
+    def job_view():
+        snapshot = job.snapshot()
+        if snapshot["done"] and not job_view.rendered_done:
+            st.rerun()  # repaint the whole page once without the polling timer
+        if snapshot["error"]:
+            st.error(f"An error occurred while parsing: {snapshot['error']}")
+        total = snapshot["units_total"]
+        if not snapshot["done"]:
+            progress = snapshot["units_done"] / total if total else 0.0
+            st.warning(f"⏳ PARTIAL RESULTS — parsed {snapshot['units_done']:,} of {f'{total:,}' if total else '?'} {snapshot['unit']} "
+                       f"in {snapshot['elapsed']:.1f} s. Parsing continues in the background; this summary updates automatically.")
+            st.progress(min(progress, 1.0))
+        elif not snapshot["error"]:
+            st.caption(f"Parsed all {total or 0:,} {snapshot['unit']} in {snapshot['elapsed']:.1f} s.")
+        if snapshot["cached"]:
+            st.caption(f"Reused the extraction of {snapshot['cached']:,} unchanged pages from earlier uploads.")
+        if snapshot["pruned"]:
+            st.caption(f"Skipped {snapshot['pruned']:,} pages without result-bearing content (cover, photo, certificate pages).")
+        if snapshot["records"]:
+            display_report_results(snapshot["records"], partial=not snapshot["done"])
+        elif snapshot["done"]:
+            st.warning("No recognizable data was extracted.")
+    job_view.rendered_done = job.done
+    job_view()
+
 # ---- Streamlit App Layout ----
 option = st.sidebar.radio("Navigate", ("Component Information", "Test Requirement Generation", "Test Report Verification", "Dashboard & Analytics"))
 st.sidebar.info("An integrated tool for automotive compliance.")
@@ -693,15 +266,27 @@ if option == "Component Information":
     st.subheader("Key Component Information", anchor=False)
     st.caption("Look up parts from the fully populated component database.")
     
-    part_q = st.text_input("Quick Lookup (part number)", placeholder="e.g., gcm155l81e104ke02d").lower().strip()
-    
-    if st.button("Find Component"):
+    # live: the value commits after a short pause in typing, not only on Enter or blur, so the
+    # completions below follow each keystroke.
+    part_q = st.text_input("Quick Lookup (part number)", placeholder="e.g., gcm155l81e104ke02d", live="200ms").lower().strip()
+
+    # Type-ahead: ranked completions of what has been typed so far (an exact match is looked up directly).
+    suggestion = None
+    if part_q:
+        prefix_index = get_prefix_index()
+        suggestions = prefix_index.suggest(part_q)
+        if suggestions and suggestions[0] != part_q:
+            matches = prefix_index.count(part_q)
+            suggestion = st.selectbox("Matching part numbers", suggestions, index=None,
+                                      placeholder=f"Pick one of {matches} part numbers starting with '{part_q}'")
+
+    if st.button("Find Component") or suggestion:
+        part_q = suggestion or part_q
         if part_q:
-            db_for_search = {k.lower(): v for k, v in UNIFIED_COMPONENT_DB.items()}
-            result = db_for_search.get(part_q)
+            result = UNIFIED_COMPONENT_DB.get(part_q)
 
             if result:
-                st.session_state.found_component = result
+                st.session_state.found_component = dict(result)  # a copy: the catalog entry is shared and read-only
                 st.session_state.searched_part = part_q
                 st.success(f"Found: {part_q.upper()}. Displaying details below.")
             else:
@@ -746,6 +331,38 @@ if option == "Component Information":
                 st.markdown(str(value) if str(value).strip() else " ")
                 st.markdown("---")
 
+    # Parametric search: attribute values parsed into SI numbers when the catalog was built (see parametric.py)
+    with st.expander("Parametric Search", expanded=False):
+        parametric_index = get_parametric_index()
+        available = parametric_index.parameters()
+        chosen = st.multiselect("Parameters", sorted(available),
+                                default=[name for name in ("Voltage Rating DC", "Maximum Operating Temperature") if name in available],
+                                format_func=lambda name: f"{name} ({display_unit(name)}, {available[name]:,} parts)")
+        ranges = {}
+        for name in chosen:
+            unit = display_unit(name)
+            lowest, highest = (from_si(value, name) for value in parametric_index.value_range(name))
+            col_min, col_max = st.columns(2)
+            low = col_min.number_input(f"{name} at least ({unit})", value=None, format="%g", key=f"param_min_{name}",
+                                       placeholder=f"{lowest:g}")
+            high = col_max.number_input(f"{name} at most ({unit})", value=None, format="%g", key=f"param_max_{name}",
+                                        placeholder=f"{highest:g}")
+            ranges[name] = (None if low is None else to_si(low, name), None if high is None else to_si(high, name))
+        col_qual, col_cat = st.columns(2)
+        qualification = col_qual.selectbox("Qualification", ["Any"] + parametric_index.labels("qualification"))
+        category = col_cat.text_input("Category contains", placeholder="e.g., capacitor").strip()
+
+        if st.button("Search Parameters"):
+            ids = parametric_index.search(ranges, None if qualification == "Any" else qualification, category)
+            shown = ids[:PARAMETRIC_ROWS]
+            st.caption(f"{len(ids):,} matching parts" + (f", showing the first {len(shown):,}." if len(shown) < len(ids) else "."))
+            if len(shown):
+                rows = [{"Part Number": part_number, "Manufacturer": record.get("Manufacturer", "N/A"),
+                         "Category": record.get("Product Category", "N/A"), "Qualification": record.get("Qualification") or "No",
+                         **{name: record.get(name, "") for name in chosen}}
+                        for part_number, record in UNIFIED_COMPONENT_DB.records_by_id(shown)]
+                st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
 # --- CORRECTED Test Requirement Generation Module ---
 elif option == "Test Requirement Generation":
     st.subheader("Generate Detailed Test Requirements", anchor=False)
@@ -794,30 +411,110 @@ elif option == "Test Requirement Generation":
 # --- Test Report Verification Module ---
 elif option == "Test Report Verification":
     st.subheader("Upload & Verify Test Report", anchor=False)
-    st.caption("Upload reports (PDF, TXT, CSV, XLSX) to extract and display all relevant data.")
-    uploaded_file = st.file_uploader("Upload a report file", type=["pdf", "docx", "xlsx", "csv", "txt", "log"])
-    if uploaded_file:
-        parsed_data = parse_report(uploaded_file)
+    st.caption("Upload reports (PDF, HTML, TXT, CSV, XLSX) to extract and display all relevant data.")
+    uploaded_file = st.file_uploader("Upload a report file", type=["pdf", "html", "htm", "docx", "xlsx", "csv", "txt", "log"])
+    rule_pack_file = st.file_uploader("Optional: supplier parsing rule pack (JSON)", type=["json"], key="rule_pack_uploader")
+    rule_pack = None
+    if rule_pack_file:
+        try:
+            rule_pack = load_rule_pack(rule_pack_file.getvalue())
+            st.caption(f"Using rule pack '{rule_pack.get('name', rule_pack_file.name)}' ({len(rule_pack['rules'])} rules) ahead of the built-in formats.")
+        except RulePackError as e:
+            st.error(f"Rule pack rejected: {e}")
+    quick_preview = st.toggle(
+        "Quick preview for PDF/TXT/LOG reports", value=True,
+        help=f"Show counts and the first failures within {PREVIEW_BUDGET_S:.0f} s, then keep parsing in the background.")
+    follow_mode = st.toggle(
+        "Follow mode for growing bench logs (TXT/LOG)", value=False,
+        help="Re-upload the same log as it grows: only the newly appended lines are parsed and merged into the results.")
+    file_extension = os.path.splitext(uploaded_file.name.lower())[1] if uploaded_file else ""
+    force_full = False
+    if file_extension == '.pdf':
+        force_full = st.checkbox(
+            "Force full PDF parse", value=False,
+            help="Parse every page, including pages the pre-pass judged to be boilerplate (covers, photos, certificates).")
+    if uploaded_file and follow_mode and file_extension in ['.txt', '.log']:
+        source = st.text_input("Log source name", value=uploaded_file.name,
+                               help="Uploads under the same source name continue where the previous upload stopped.")
+        compiled = compile_rule_pack(rule_pack)
+        with upload_view(uploaded_file) as view:
+            follow_state, new_bytes, new_records = follow_log(source, view, compiled, session_key())
+        if new_bytes:
+            st.session_state.reports_verified += 1
+            st.info(f"Parsed {new_bytes / 1024:,.1f} KB appended since the last upload: {len(new_records)} new results "
+                    f"({follow_state.offset / 1024:,.1f} KB of '{source}' followed so far).")
+        else:
+            st.caption(f"No new complete lines since the last upload of '{source}' ({follow_state.offset / 1024:,.1f} KB followed).")
+        if st.button("Restart follow from the beginning"):
+            reset_follow(source, session_key())
+            st.rerun()
+        if follow_state.records:
+            display_report_results(follow_state.records)
+        else:
+            st.warning("No recognizable data was extracted.")
+        display_rule_stats(follow_state.stats)
+    elif uploaded_file and quick_preview and file_extension in ['.pdf', '.txt', '.log']:
+        compiled = compile_rule_pack(rule_pack)
+        job_key = f"{getattr(uploaded_file, 'file_id', uploaded_file.name)}:{uploaded_file.size}:{compiled.digest}:{force_full}"
+        # Content parsed before, by any session or replica, is served from the caches without a new job
+        cached_key, cached = (None, None) if find_job(job_key) else find_cached_report(uploaded_file, rule_pack, force_full)
+        if cached is not None:
+            for name in PARSE_DIAGNOSTICS:
+                st.session_state[name] = cached.get(name)
+            if (st.session_state.get("last_report") or {}).get("key") != cached_key:
+                st.session_state.reports_verified += 1
+            st.session_state.last_report = {"key": cached_key, "name": uploaded_file.name, "results": len(cached["records"])}
+            st.caption("This report was parsed before; showing the stored results.")
+            display_report_results(cached["records"])
+            display_rule_stats(cached.get("rule_stats"))
+        else:
+            job, started = get_or_start_job(job_key, uploaded_file.name, uploaded_file.getvalue(),
+                                            LayoutParse(compiled, uploaded_file.name), force_full)
+            if started:
+                st.session_state.reports_verified += 1
+            job.wait(PREVIEW_BUDGET_S)
+            display_report_job(job)
+            if job.done:
+                preview_key = report_key(uploaded_file, rule_pack, force_full, mode="preview")
+                snapshot = job.snapshot()
+                diagnostics = {name: snapshot[name] for name in PARSE_DIAGNOSTICS}
+                st.session_state.update(diagnostics)
+                if snapshot["layout_match"]["reused"]:
+                    st.caption(f"Known report layout `{snapshot['layout_match']['fingerprint']}`: seen in a previous upload.")
+                display_rule_stats(snapshot["rule_stats"])
+                if snapshot["records"] and not snapshot["error"] and (st.session_state.get("last_report") or {}).get("key") != preview_key:
+                    store_report(preview_key, uploaded_file, snapshot["records"], diagnostics)
+    elif uploaded_file:
+        st.session_state.rule_stats = None
+        st.session_state.layout_match = None
+        st.session_state.page_pruning = None
+        parsed_data = parse_report_cached(uploaded_file, rule_pack, force_full)
+        pruning = st.session_state.get("page_pruning")
+        if pruning and pruning["Pruned"]:
+            st.caption(f"Skipped {pruning['Pruned']:,} of {pruning['Pages']:,} pages without result-bearing content. "
+                       "Tick 'Force full PDF parse' if results are missing.")
+        if pruning and pruning["Cached"]:
+            st.caption(f"Reused the extraction of {pruning['Cached']:,} unchanged pages from earlier uploads.")
+        layout_match = st.session_state.get("layout_match")
+        if layout_match and layout_match["reused"]:
+            st.caption(f"Known report layout `{layout_match['fingerprint']}`: seen in a previous upload.")
         if parsed_data:
             st.session_state.reports_verified += 1
-            passed = [t for t in parsed_data if "PASS" in str(t.get("Result", "")).upper()]
-            failed = [t for t in parsed_data if "FAIL" in str(t.get("Result", "")).upper()]
-            others = [t for t in parsed_data if not ("PASS" in str(t.get("Result", "")).upper() or "FAIL" in str(t.get("Result", "")).upper())]
-            
-            st.markdown(f"### Found {len(passed)} Passed, {len(failed)} Failed, and {len(others)} Other items.")
-            
-            if passed:
-                with st.expander("✅ Passed Cases", expanded=True):
-                    for t in passed: display_test_card(t, '#1e9f50')
-            if failed:
-                with st.expander("🔴 Failed Cases", expanded=True):
-                    for t in failed: display_test_card(t, '#c43a31')
-            if others:
-                with st.expander("ℹ️ Other/Informational Items", expanded=False):
-                    for t in others: display_test_card(t, '#808080')
+            display_report_results(parsed_data)
         else:
             st.warning("No recognizable data was extracted.")
 
+        display_rule_stats(st.session_state.get("rule_stats"))
+    elif st.session_state.get("last_report"):
+        last_report = st.session_state.last_report
+        cached = load_cached_report(last_report["key"])
+        if cached:
+            st.info(f"Showing your last report, '{last_report['name']}', restored from before the page was reloaded. Upload a file to verify another report.")
+            display_report_results(cached["records"])
+            display_rule_stats(cached.get("rule_stats"))
+        else:
+            st.caption(f"Your last report, '{last_report['name']}', is no longer cached. Upload it again to see its results.")
+
 
 # --- Dashboard & Analytics Module ---
 elif option == "Dashboard & Analytics":
@@ -827,3 +524,38 @@ elif option == "Dashboard & Analytics":
     c1.metric("Reports Verified", st.session_state.reports_verified)
     c2.metric("Requirements Generated", st.session_state.requirements_generated)
     c3.metric("Components in DB", len(UNIFIED_COMPONENT_DB))
+
+    layout_stats = get_layout_cache().stats()
+    st.markdown("### Report Layout Cache")
+    l1, l2, l3 = st.columns(3)
+    l1.metric("Known Layouts", layout_stats["Layouts"])
+    l2.metric("Extractor Reuses", layout_stats["Hits"])
+    l3.metric("Hit Rate", f"{layout_stats['Hit Rate']:.0%}")
+
+    parse_stats = get_parse_cache().stats()
+    st.markdown("### Parsed Report Cache")
+    p1, p2, p3 = st.columns(3)
+    p1.metric("Cached Reports", parse_stats["Entries"])
+    p2.metric("Memory Used", f"{parse_stats['Bytes'] / 1024 / 1024:,.1f} MB")
+    p3.metric("Hit Rate", f"{parse_stats['Hit Rate']:.0%}")
+
+    store_stats = get_result_store().stats()
+    st.markdown("### Shared Result Store")
+    s1, s2, s3 = st.columns(3)
+    s1.metric("Stored Results", store_stats["Entries"], help=f"{store_stats['Bytes'] / 1024 / 1024:,.1f} MB on disk")
+    s2.metric("Hit Rate", f"{store_stats['Hit Rate']:.0%}")
+    s3.metric("Report Bytes Not Re-parsed", f"{store_stats['Bytes Saved'] / 1024 / 1024:,.1f} MB")
+
+    governor = get_governor()
+    memory_stats = governor.stats()
+    st.markdown("### Session Memory")
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Resident", f"{memory_stats['Resident'] / 1024 / 1024:,.1f} MB", help=f"Budget: {memory_stats['Budget'] / 1024 / 1024:,.0f} MB")
+    m2.metric("Spilled to Disk", f"{memory_stats['Spilled Bytes'] / 1024 / 1024:,.1f} MB", help=f"{memory_stats['Spilled Objects']} objects")
+    m3.metric("Rehydrations", memory_stats["Rehydrations"])
+    usage = governor.usage_by_owner()
+    if usage:
+        with st.expander("Memory by session", expanded=False):
+            st.dataframe(pd.DataFrame(usage), use_container_width=True, hide_index=True)
+
+save_session(SESSION_SNAPSHOT_KEYS)
@@ -0,0 +1,336 @@
+# columnar.py
+"""
+Columnar result tables, in shared memory (between processes) or in files (on disk).
+
+Each string column is a UTF-8 heap plus an offsets array (row i is heap[offsets[i]:
+offsets[i + 1]]), with a null bitmap when some rows have no value. Low-cardinality columns
+such as Result are uint16 codes into a small vocabulary, and columns holding other types
+(numbers from CSV/XLSX reports) are stored as JSON text per cell. Tables written column by
+column (write_column_file) may also hold typed numeric arrays, which readers can hand to
+numpy without a copy. A table's layout is a small descriptor; readers map the buffers and
+decode a row only when it is accessed.
+
+Shared memory blocks are registered with the resource tracker shared by the pool's
+processes, so a block that is never attached is still removed when the application exits.
+"""
+import bisect
+import itertools
+import json
+import mmap
+import os
+import struct
+import weakref
+from array import array
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+
+from cache_paths import atomic_write
+
+ENUM_COLUMNS = ("Result", "Sheet")
+MAX_VOCAB = 65535
+FILE_MAGIC = b"CCTABLE1"
+_ALIGN = 8
+_HEADER = struct.Struct("<8sQ")
+
+
+def _align(n):
+    return (n + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+def _encode_columns(column_values, enum_columns):
+    """Yields (layout entry, [(part name, buffer), ...]) per (name, values) of `column_values`."""
+    for name, values in column_values:
+        if isinstance(values, array):
+            yield {"name": name, "kind": "num", "typecode": values.typecode}, [("values", values)]
+            continue
+        if name in enum_columns:
+            vocab = list(dict.fromkeys(values))
+            if len(vocab) <= MAX_VOCAB:
+                index = {value: code for code, value in enumerate(vocab)}
+                codes = array("H", [index[value] for value in values])
+                yield {"name": name, "kind": "enum", "vocab": vocab}, [("codes", codes)]
+                continue
+        if all(value is None or isinstance(value, str) for value in values):
+            kind, encoded = "str", [b"" if value is None else value.encode("utf-8") for value in values]
+        else:
+            kind, encoded = "json", [json.dumps(value, default=str).encode("utf-8") for value in values]
+        offsets = array("Q", [0])
+        offsets.extend(itertools.accumulate(len(chunk) for chunk in encoded))
+        parts = [("offsets", offsets), ("heap", b"".join(encoded))]
+        if kind == "str" and None in values:
+            nulls = bytearray((len(values) + 7) // 8)
+            for i, value in enumerate(values):
+                if value is None:
+                    nulls[i >> 3] |= 1 << (i & 7)
+            parts.append(("nulls", nulls))
+        yield {"name": name, "kind": kind}, parts
+
+
+def encode_table(records, columns=None, enum_columns=ENUM_COLUMNS):
+    """
+    Lays out `records` (dicts) column by column. Returns (descriptor, chunks, size): chunks are
+    (offset, buffer, nbytes) to be copied into a buffer of `size` bytes.
+    """
+    if columns is None:
+        columns = list(dict.fromkeys(key for record in records for key in record))
+    column_values = ((name, [record.get(name) for record in records]) for name in columns)
+    return _layout(column_values, len(records), enum_columns)
+
+
+def _layout(column_values, rows, enum_columns):
+    layout, chunks, size = [], [], 0
+    for entry, buffers in _encode_columns(column_values, enum_columns):
+        for part, data in buffers:
+            nbytes = len(data) * (data.itemsize if isinstance(data, array) else 1)
+            entry[part] = (size, nbytes)
+            chunks.append((size, data, nbytes))
+            size = _align(size + nbytes)
+        layout.append(entry)
+    return {"rows": rows, "columns": layout}, chunks, size
+
+
+def _copy_chunks(buf, chunks, base=0):
+    for start, data, nbytes in chunks:
+        buf[base + start:base + start + nbytes] = memoryview(data).cast("B")
+
+
+def write_shared_table(records, columns=None, enum_columns=ENUM_COLUMNS):
+    """
+    Writes `records` into a new shared memory block and returns its descriptor.
+    The writer only detaches; the process that attaches the table owns and unlinks it.
+    """
+    descriptor, chunks, size = encode_table(records, columns, enum_columns)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        _copy_chunks(shm.buf, chunks)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    descriptor["name"] = shm.name
+    return descriptor
+
+
+def write_table_file(path, records, meta=None, columns=None, enum_columns=ENUM_COLUMNS):
+    """
+    Writes `records` to a columnar file atomically: magic, header length, JSON header
+    (descriptor plus `meta`), padding, then the column buffers. Returns the file size.
+    """
+    return _write_file(path, encode_table(records, columns, enum_columns), meta)
+
+
+def write_column_file(path, columns, meta=None, enum_columns=()):
+    """
+    write_table_file for data already held by column: `columns` is {name: values}, all of
+    the same length. A column given as an array.array is stored as a typed numeric column.
+    """
+    rows = len(next(iter(columns.values()))) if columns else 0
+    return _write_file(path, _layout(columns.items(), rows, enum_columns), meta)
+
+
+def _write_file(path, encoded, meta):
+    descriptor, chunks, size = encoded
+    descriptor["meta"] = meta or {}
+    header = json.dumps(descriptor, default=str).encode("utf-8")
+    base = _align(_HEADER.size + len(header))
+    out = bytearray(base + size)
+    out[:_HEADER.size + len(header)] = _HEADER.pack(FILE_MAGIC, len(header)) + header
+    _copy_chunks(out, chunks, base)
+    atomic_write(path, out)
+    return len(out)
+
+
+def _release(views, close):
+    try:
+        for view in reversed(views):
+            view.release()
+        close()
+    except BufferError:
+        pass  # buffers still exported (numpy arrays over a mapped column): freed along with them
+
+
+class ColumnarTable(Sequence):
+    """
+    Read-only rows over column buffers. Indexing returns a row as a dict; value_counts() on
+    an enum column works on the codes without decoding any strings.
+    """
+
+    def __init__(self, buf, descriptor, close):
+        self._rows = descriptor["rows"]
+        self._views = []
+        self._columns = {}
+        for entry in descriptor["columns"]:
+            if entry["kind"] == "enum":
+                codes = self._view(buf, *entry["codes"], "H")
+                self._columns[entry["name"]] = ("enum", codes, tuple(entry["vocab"]), None)
+            elif entry["kind"] == "num":
+                values = self._view(buf, *entry["values"], entry["typecode"])
+                self._columns[entry["name"]] = ("num", values, None, None)
+            else:
+                offsets = self._view(buf, *entry["offsets"], "Q")
+                heap = self._view(buf, *entry["heap"])
+                nulls = self._view(buf, *entry["nulls"]) if "nulls" in entry else None
+                self._columns[entry["name"]] = (entry["kind"], offsets, heap, nulls)
+        self._close = weakref.finalize(self, _release, self._views, close)
+
+    def _view(self, buf, start, nbytes, fmt=None):
+        view = buf[start:start + nbytes]
+        self._views.append(view)
+        if fmt:
+            view = view.cast(fmt)
+            self._views.append(view)
+        return view
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def __len__(self):
+        return self._rows
+
+    def _cell(self, column, i):
+        kind, data, extra, nulls = column
+        if kind == "enum":
+            return extra[data[i]]
+        if kind == "num":
+            return data[i]
+        if nulls is not None and nulls[i >> 3] & (1 << (i & 7)):
+            return None
+        text = str(extra[data[i]:data[i + 1]], "utf-8")
+        return json.loads(text) if kind == "json" else text
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._rows))]
+        if i < 0:
+            i += self._rows
+        if not 0 <= i < self._rows:
+            raise IndexError("table index out of range")
+        return {name: self._cell(column, i) for name, column in self._columns.items()}
+
+    def column(self, name):
+        """Decodes one whole column into a list."""
+        column = self._columns[name]
+        return [self._cell(column, i) for i in range(self._rows)]
+
+    def cell(self, name, i):
+        """Decodes one cell."""
+        return self._cell(self._columns[name], i)
+
+    def buffer(self, name):
+        """The mapped values of a numeric column, or the codes of an enum column, as a memoryview (no copy)."""
+        kind, data, _, _ = self._columns[name]
+        if kind not in ("num", "enum"):
+            raise TypeError(f"column {name!r} is not numeric")
+        return data
+
+    def vocab(self, name):
+        """The values an enum column's codes stand for."""
+        return self._columns[name][2]
+
+    def bytes_column(self, name):
+        """The cells of a string column as UTF-8 bytes read straight from the mapped heap (nulls read as b"")."""
+        kind, offsets, heap, _ = self._columns[name]
+        if kind != "str":
+            raise TypeError(f"column {name!r} is not a string column")
+        return BytesColumn(offsets, heap)
+
+    def value_counts(self, name):
+        """Returns {value: count} for a column; enum columns are counted on their codes."""
+        kind, data, extra, _ = self._columns[name]
+        if kind == "enum":
+            counts = [0] * len(extra)
+            for code in data:
+                counts[code] += 1
+            return {value: count for value, count in zip(extra, counts) if count}
+        counts = {}
+        for value in self.column(name):
+            counts[value] = counts.get(value, 0) + 1
+        return counts
+
+    def close(self):
+        """Releases the underlying buffer."""
+        self._close()
+
+
+class BytesColumn(Sequence):
+    """Cells of a string column as bytes; item i is heap[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, offsets, heap):
+        self._offsets = offsets
+        self._heap = heap
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self._heap[self._offsets[i]:self._offsets[i + 1]])
+
+
+def _close_shared(shm):
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedTable(ColumnarTable):
+    """Table written by write_shared_table; the block is unlinked by close() or garbage collection."""
+
+    def __init__(self, descriptor):
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+        super().__init__(shm.buf, descriptor, lambda: _close_shared(shm))
+
+
+class FileTable(ColumnarTable):
+    """Table written by write_table_file, memory-mapped read-only. `meta` is the header's metadata."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(mm)
+        try:
+            magic, header_len = _HEADER.unpack_from(buf)
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{path} is not a columnar table file")
+            descriptor = json.loads(bytes(buf[_HEADER.size:_HEADER.size + header_len]))
+            body = buf[_align(_HEADER.size + header_len):]
+        except BaseException:
+            buf.release()
+            mm.close()
+            raise
+        self.path = path
+        self.meta = descriptor.get("meta", {})
+        self.size = os.path.getsize(path)
+
+        def close():
+            body.release()
+            buf.release()
+            mm.close()
+        super().__init__(body, descriptor, close)
+
+
+class TableChain(Sequence):
+    """Concatenation of several row sequences (shared tables or lists) without copying them."""
+
+    def __init__(self, parts):
+        self.parts = [part for part in parts if len(part)]
+        self._ends = list(itertools.accumulate(len(part) for part in self.parts))
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.parts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("table index out of range")
+        part = bisect.bisect_right(self._ends, i)
+        return self.parts[part][i - (self._ends[part - 1] if part else 0)]
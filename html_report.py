@@ -0,0 +1,289 @@
+# html_report.py
+"""
+Streaming extraction of test verdicts from HTML test reports (e.g. Vector CANoe).
+
+The report is fed to an incremental tokenizer chunk by chunk; only the table row
+currently being read is kept in memory, so very large reports never build a DOM.
+"""
+import codecs
+import html
+import re
+
+# Maps (lowercased) table header text onto the record schema used by the report view.
+HEADER_TO_FIELD = {
+    "test": "TestName", "test name": "TestName", "test case": "TestName", "testcase": "TestName",
+    "test case name": "TestName", "title": "TestName", "name": "TestName", "test step": "TestName",
+    "verdict": "Result", "result": "Result", "status": "Result", "test result": "Result",
+    "expected": "Expected", "expected value": "Expected", "limit": "Expected",
+    "actual": "Actual", "actual value": "Actual", "measured": "Actual", "measured value": "Actual", "value": "Actual",
+    "standard": "Standard", "specification": "Standard",
+    "description": "Description", "comment": "Description", "remarks": "Description",
+}
+
+VERDICT_MAP = {
+    "pass": "PASS", "passed": "PASS", "ok": "PASS", "success": "PASS",
+    "fail": "FAIL", "failed": "FAIL", "nok": "FAIL", "failure": "FAIL", "error": "FAIL",
+    "inconclusive": "INFO", "none": "INFO", "n/a": "INFO", "not executed": "INFO", "skipped": "INFO",
+}
+
+# CANoe marks verdict cells with these CSS classes even when the text is localized.
+VERDICT_CLASSES = {"positiveresultcell": "PASS", "negativeresultcell": "FAIL", "inconclusiveresultcell": "INFO"}
+
+_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+_TAG_RE = re.compile(r"<!--.*?-->|<(/?)(table|tr|script|style)\b[^>]*>", re.I | re.S)
+# A cell's text runs up to the next cell tag; written as an unrolled loop (runs of text, then a
+# "<" that starts no cell tag), which is several times faster than a lazy .*? with a lookahead.
+_CELL_RE = re.compile(r"<(t[dh])\b([^>]*)>([^<]*(?:<(?!t[dh]\b|/t[dh]>)[^<]*)*)", re.I)
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+_CLASS_RE = re.compile(r"""class\s*=\s*["']?([^"'>]*)""", re.I)
+_COLSPAN_RE = re.compile(r"""colspan\s*=\s*["']?(\d+)""", re.I)
+
+
+def _verdict_of(text, css_class=""):
+    """Returns PASS/FAIL/INFO for a verdict cell, or None if the cell is not a verdict."""
+    for cls in css_class.lower().split():
+        if cls in VERDICT_CLASSES:
+            return VERDICT_CLASSES[cls]
+    return VERDICT_MAP.get(text.lower())
+
+
+def _cell_text(text):
+    """Visible text of a raw cell: inner tags dropped, entities decoded, whitespace collapsed."""
+    if "<" in text:
+        text = _INNER_TAG_RE.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+
+def _css_class(attrs):
+    css_class = _CLASS_RE.search(attrs) if attrs else None
+    return css_class.group(1) if css_class else ""
+
+
+def _cells(raw_row):
+    """Decodes raw (tag, attrs, text) cells into (text, CSS class, is header) cells, expanding colspans."""
+    row = []
+    for tag, attrs, text in raw_row:
+        is_header = tag.lower() == "th"
+        row.append((_cell_text(text), _css_class(attrs), is_header))
+        colspan = _COLSPAN_RE.search(attrs) if attrs else None
+        if colspan and int(colspan.group(1)) > 1:
+            row.extend([("", "", is_header)] * (int(colspan.group(1)) - 1))
+    return row
+
+
+class _VerdictTableParser:
+    """
+    Incremental tokenizer that only stops on table structure (table/tr, plus script/style
+    to skip); the cells of a row are split with a single regex once the row is complete.
+    Collects one record per table row that carries a verdict. Once a table's header is
+    known, only the cells of its mapped columns are decoded.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._buffer = ""
+        self._scan = 0  # where tokenizing resumes inside the buffer
+        self._tables = []  # one {"columns", "row", "row_start", "spans"} frame per open <table>
+        self._skip_until = None  # closing tag of the <script>/<style> block being skipped
+
+    def feed(self, text):
+        """Tokenizes as much of the buffered text as is complete; keeps an open row for the next feed."""
+        buffer = self._buffer + text
+        pos = self._scan
+        # A comment still open at the end of the buffer hides whatever follows it.
+        last_close = buffer.rfind("-->")
+        limit = buffer.find("<!--", pos if last_close < 0 else max(pos, last_close + 3))
+        limit = len(buffer) if limit < 0 else limit
+        while True:
+            if self._skip_until:
+                end = buffer.lower().find(self._skip_until, pos)
+                if end < 0:
+                    pos = max(pos, len(buffer) - len(self._skip_until))
+                    break
+                pos, self._skip_until = end + len(self._skip_until), None
+                self._resume_row(pos)
+            for match in _TAG_RE.finditer(buffer, pos, limit):
+                closing, tag = match.group(1, 2)
+                if not tag:  # comment
+                    continue
+                self._collect_cells(buffer, match.start())
+                pos = match.end()
+                self._handle_tag(closing == "/", tag.lower(), pos)
+                if self._skip_until:
+                    break
+            else:
+                break
+
+        # Keep an unfinished row (or a tag cut in half by the chunk boundary) for the next feed.
+        keep = buffer.rfind("<", pos, limit + 1)
+        keep = pos if keep < 0 else keep
+        frame = self._tables[-1] if self._tables else None
+        if frame is not None and frame["row_start"] is not None:
+            keep = min(keep, frame["row_start"])
+            frame["row_start"] -= keep
+        self._buffer = buffer[keep:]
+        self._scan = max(0, pos - keep)
+
+    def close(self):
+        if self._tables:
+            self._collect_cells(self._buffer, len(self._buffer))
+        self._buffer, self._scan = "", 0
+        while self._tables:  # tolerate truncated reports with unclosed tables
+            self._handle_tag(True, "table", 0)
+
+    def _handle_tag(self, closing, tag, pos):
+        if tag in ("script", "style"):
+            if not closing:
+                self._skip_until = f"</{tag}"
+        elif tag == "table":
+            if not closing:
+                self._tables.append({"columns": None, "row": None, "row_start": None, "spans": False})
+            elif self._tables:
+                self._finish_row()
+                self._tables.pop()
+                self._resume_row(pos)
+        elif tag == "tr" and self._tables:
+            self._finish_row()
+            if not closing:
+                self._tables[-1]["row"] = []
+                self._tables[-1]["spans"] = False
+                self._tables[-1]["row_start"] = pos
+
+    def _resume_row(self, pos):
+        """After a nested table or skipped block, keep reading the enclosing row's cells."""
+        if self._tables and self._tables[-1]["row"] is not None:
+            self._tables[-1]["row_start"] = pos
+
+    def _collect_cells(self, buffer, end):
+        """Splits the pending row text buffer[row_start:end] into cells."""
+        if not self._tables:
+            return
+        frame = self._tables[-1]
+        if frame["row_start"] is None:
+            return
+        frame["row"] += _CELL_RE.findall(buffer, frame["row_start"], end)  # raw cells, decoded in _finish_row
+        if not frame["spans"] and _COLSPAN_RE.search(buffer, frame["row_start"], end):
+            frame["spans"] = True
+        frame["row_start"] = None
+
+    def _finish_row(self):
+        table = self._tables[-1]
+        row, table["row"], table["row_start"] = table["row"], None, None
+        if not row:
+            return
+
+        columns = table["columns"]
+        if columns is not None and not table["spans"] and row[0][0].lower() != "th":
+            record = self._record_from_raw_columns(row, columns)
+            if record is not None:
+                self.records.append(record)
+                return
+
+        row = _cells(row)
+        header = self._as_header(row) if columns is None or row[0][2] else None
+        if header:
+            table["columns"] = header
+            return
+
+        record = self._record_from_columns(row, columns) if columns else None
+        if record is None:
+            record = self._record_from_verdict_cell(row)
+        if record is not None:
+            self.records.append(record)
+
+    @staticmethod
+    def _as_header(row):
+        """Returns {column index: field} if the row looks like a header row."""
+        columns = {}
+        for i, (text, _, _) in enumerate(row):
+            field = HEADER_TO_FIELD.get(text.lower().rstrip(":"))
+            if field and field not in columns.values():
+                columns[i] = field
+        all_th = all(is_header for _, _, is_header in row)
+        if "Result" in columns.values() and (all_th or len(columns) >= 2):
+            return columns
+        return None
+
+    @staticmethod
+    def _record_from_columns(row, columns):
+        record = {"TestName": "Not found", "Result": "N/A", "Actual": "Not found", "Standard": "Not found"}
+        for i, field in columns.items():
+            if i >= len(row) or not row[i][0]:
+                continue
+            text, css_class, _ = row[i]
+            if field == "Result":
+                record["Result"] = _verdict_of(text, css_class) or text.upper()
+            else:
+                record[field] = text
+        if record["TestName"] == "Not found" or record["Result"] == "N/A":
+            return None
+        return record
+
+    @staticmethod
+    def _record_from_raw_columns(row, columns):
+        """_record_from_columns for a data row of raw cells without colspans, decoding only the mapped columns."""
+        record = {"TestName": "Not found", "Result": "N/A", "Actual": "Not found", "Standard": "Not found"}
+        for i, field in columns.items():
+            if i >= len(row):
+                continue
+            _, attrs, text = row[i]
+            text = _cell_text(text)
+            if not text:
+                continue
+            if field == "Result":
+                record["Result"] = _verdict_of(text, _css_class(attrs)) or text.upper()
+            else:
+                record[field] = text
+        if record["TestName"] == "Not found" or record["Result"] == "N/A":
+            return None
+        return record
+
+    @staticmethod
+    def _record_from_verdict_cell(row):
+        """Fallback for header-less tables: a row with a verdict cell is a test row."""
+        verdict, names = None, []
+        for text, css_class, _ in row:
+            if not text:
+                continue
+            cell_verdict = _verdict_of(text, css_class) if verdict is None else None
+            if cell_verdict:
+                verdict = cell_verdict
+            elif len(names) < 2:
+                names.append(text)
+        if verdict is None or not names:
+            return None
+        return {"TestName": " ".join(names), "Result": verdict, "Actual": "Not found", "Standard": "Not found"}
+
+
+def iter_html_records(stream, chunk_size=1 << 20):
+    """
+    Yields test records from a binary HTML stream as soon as their table row closes.
+    Memory use is bounded by the chunk size and the open row, not by the report size.
+    """
+    parser = _VerdictTableParser()
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if decoder is None:
+            match = _CHARSET_RE.search(chunk[:4096] if chunk else b"")
+            encoding = match.group(1).decode("ascii") if match else "utf-8"
+            try:
+                decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        if not chunk:
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+            yield from parser.records
+            return
+        parser.feed(decoder.decode(chunk))
+        if parser.records:
+            yield from parser.records
+            parser.records = []
+
+
+def parse_html_report(stream, chunk_size=1 << 20):
+    """Parses an HTML test report into a list of test records."""
+    return list(iter_html_records(stream, chunk_size))
@@ -0,0 +1,211 @@
+# layout_cache.py
+"""
+Layout fingerprints for supplier reports and a persistent cache of the extractor plan
+(the parsing rules that matched) for each layout last time. The plan is advisory: parsing
+always applies the whole rule pack in its own order, so a line's record never depends on
+which layouts were seen before (first match wins; any rule left out or moved ahead could
+change the winner), and the parse cache and result store can key results on content alone.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+from cache_paths import atomic_write, cache_path, file_lock
+from rule_packs import new_rule_stats
+
+HEADER_LINES = 8
+SAMPLE_LINES = 400
+MAX_ENTRIES = 500
+
+_DIGITS_RE = re.compile(r"\d+")
+_SHAPE_TOKENS = ("\t", ";", "|", "-->", "->", ":", ",", '"')
+
+
+def _normalize(line):
+    """Masks the parts of a line that change between reports of the same layout (numbers, spacing, case)."""
+    return " ".join(_DIGITS_RE.sub("9", line).lower().split())[:80]
+
+
+def _shape(line):
+    return tuple(line.count(token) for token in _SHAPE_TOKENS)
+
+
+def layout_fingerprint(text, pages=None):
+    """
+    Fingerprints a document's layout from its masked header lines, the distribution of
+    column/delimiter shapes over a sample of lines and, for paged documents, the repeated
+    page header/footer template. Returns a short hex digest.
+    """
+    lines = []
+    for line in (text.splitlines() if isinstance(text, str) else text):
+        line = line.strip()
+        if line:
+            lines.append(line)
+            if len(lines) >= SAMPLE_LINES:
+                break
+
+    features = {
+        "header": [_normalize(line) for line in lines[:HEADER_LINES]],
+        "shapes": sorted(Counter(_shape(line) for line in lines).most_common(6)),
+    }
+    if pages:
+        edges = Counter()
+        for page in pages[:20]:
+            page_lines = [l.strip() for l in (page or "").splitlines() if l.strip()]
+            if page_lines:
+                edges[("top", _normalize(page_lines[0]))] += 1
+                edges[("bottom", _normalize(page_lines[-1]))] += 1
+        features["page_template"] = sorted(key for key, count in edges.items() if count > 1)
+
+    canonical = json.dumps(features, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class LayoutCache:
+    """
+    Maps layout fingerprints to learned extractor plans. Persisted as JSON and shared by every
+    process on the host: the file is only written on a miss or a change, as a read-modify-write
+    under an exclusive file lock, so processes never overwrite each other's entries. Hits are
+    served from memory; their counters are written along with the process's next change.
+    Entries are evicted least-recently-used beyond MAX_ENTRIES.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path("layouts.json")
+        self._lock = threading.RLock()
+        self._unsaved_hits = 0
+        self._unsaved_uses = {}  # fingerprint -> [uses, last used]
+        self._data = self._read()
+
+    def _read(self):
+        data = {"entries": {}, "hits": 0, "misses": 0}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data.update(json.load(f))
+            except (OSError, ValueError):
+                pass  # a corrupt cache is just an empty cache
+        return data
+
+    def _update(self, change):
+        """Applies `change(data)` and this process's unsaved hits to the file's current content and writes it back."""
+        with self._lock, file_lock(self.path + ".lock"):
+            data = self._read()
+            data["hits"] += self._unsaved_hits
+            for fingerprint, (uses, last_used) in self._unsaved_uses.items():
+                entry = data["entries"].get(fingerprint)
+                if entry is not None:
+                    entry["uses"] += uses
+                    entry["last_used"] = max(entry["last_used"], last_used)
+            self._unsaved_hits, self._unsaved_uses = 0, {}
+            result = change(data)
+            entries = data["entries"]
+            if len(entries) > MAX_ENTRIES:
+                for key in sorted(entries, key=lambda k: entries[k]["last_used"])[:len(entries) - MAX_ENTRIES]:
+                    del entries[key]
+            atomic_write(self.path, json.dumps(data).encode("utf-8"))
+            self._data = data
+            return result
+
+    def lookup(self, fingerprint, pack_digest):
+        """Returns the cached rule positions for this layout and rule pack, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._data["entries"].get(fingerprint)
+            if entry is not None and entry["pack"] == pack_digest:
+                self._unsaved_hits += 1
+                uses = self._unsaved_uses.setdefault(fingerprint, [0, 0.0])
+                uses[0] += 1
+                uses[1] = time.time()
+                return entry["rules"]
+
+        def miss(data):  # another process may have learned the layout since this one last read the file
+            entry = data["entries"].get(fingerprint)
+            if entry is None or entry["pack"] != pack_digest:
+                data["misses"] += 1
+                return None
+            data["hits"] += 1
+            entry["uses"] += 1
+            entry["last_used"] = time.time()
+            return entry["rules"]
+
+        return self._update(miss)
+
+    def learn(self, fingerprint, pack_digest, rule_positions, source_name=""):
+        """Remembers which rules extracted data for this layout."""
+        def change(data):
+            entry = data["entries"].get(fingerprint) or {"uses": 0}
+            data["entries"][fingerprint] = {
+                "pack": pack_digest, "rules": sorted(rule_positions), "source": source_name,
+                "uses": entry["uses"], "last_used": time.time(),
+            }
+        self._update(change)
+
+    def forget(self, fingerprint):
+        with self._lock:
+            if fingerprint in self._data["entries"]:
+                self._update(lambda data: data["entries"].pop(fingerprint, None))
+
+    def stats(self):
+        with self._lock:
+            hits, misses = self._data["hits"] + self._unsaved_hits, self._data["misses"]
+            return {"Layouts": len(self._data["entries"]), "Hits": hits, "Misses": misses,
+                    "Hit Rate": hits / (hits + misses) if hits + misses else 0.0}
+
+
+_layout_cache = None
+_layout_cache_lock = threading.Lock()
+
+
+def get_layout_cache():
+    """Returns the process-wide layout cache."""
+    global _layout_cache
+    with _layout_cache_lock:
+        if _layout_cache is None:
+            _layout_cache = LayoutCache()
+        return _layout_cache
+
+
+class LayoutParse:
+    """
+    One document parsed with `compiled` (a CompiledRulePack) through the layout cache, in one
+    call or segment by segment as the quick preview does. The layout is fingerprinted from the
+    first segment and looked up (`reused` tells whether it was known); every segment is parsed
+    by the whole pack, so the records equal CompiledRulePack.parse's. finish() re-learns the
+    plan when the rules that matched have changed. `stats` (one row per rule of `compiled`)
+    is filled like CompiledRulePack.parse fills it.
+    """
+
+    def __init__(self, compiled, source_name="", stats=None):
+        self.compiled = compiled
+        self.source_name = source_name
+        self.stats = stats if stats is not None else new_rule_stats(compiled)
+        self.fingerprint = None
+        self.reused = False
+        self._learned = None
+
+    def parse(self, text, pages=None):
+        """Returns the records of one segment (or of the whole document)."""
+        if self.fingerprint is None:
+            self.fingerprint = layout_fingerprint(text, pages)
+            positions = get_layout_cache().lookup(self.fingerprint, self.compiled.digest) or ()
+            self._learned = sorted(i for i in set(positions) if i < len(self.compiled.rules))
+            self.reused = bool(self._learned)
+        return self.compiled.parse(text, self.stats)
+
+    def finish(self):
+        """Remembers the rules that matched over the whole document for its layout."""
+        matched = [i for i, row in enumerate(self.stats) if row["Matches"]]
+        if self.fingerprint is not None and matched and matched != self._learned:
+            get_layout_cache().learn(self.fingerprint, self.compiled.digest, matched, self.source_name)
+
+
+def parse_with_layout_cache(compiled, text, pages=None, stats=None, source_name=""):
+    """Parses a whole document through LayoutParse. Returns (records, fingerprint, reused)."""
+    layout = LayoutParse(compiled, source_name, stats)
+    records = layout.parse(text, pages)
+    layout.finish()
+    return records, layout.fingerprint, layout.reused
@@ -0,0 +1,276 @@
+# memory_governor.py
+"""
+Process-wide accounting of the heavy objects held for sessions: parsed record lists,
+finished background parses, component DataFrames.
+
+Every tracked object is measured and charged to the session that created it. When the
+resident total exceeds BUDGET_BYTES, the least recently used objects are spilled to disk
+(record lists as columnar files, DataFrames and anything else as pickles) and dropped from
+memory; Governed.get() loads a spilled object back transparently. Objects whose handle is
+garbage collected, for example with the session that held it, are forgotten together with
+their spill file. The lock only guards the bookkeeping: spill files are written, read and
+deleted outside it, so one session's spill never stalls every other session's access.
+"""
+import itertools
+import os
+import pickle
+import threading
+import time
+import weakref
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from cache_paths import cache_path
+from columnar import FileTable, write_table_file
+from parse_cache import estimate_size
+
+BUDGET_BYTES = int(os.environ.get("COMPLIANCE_MEMORY_BUDGET_MB", "1024")) * 1024 * 1024
+
+
+def measure(value):
+    """Approximate memory footprint of a tracked object, in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return estimate_size(value)
+
+
+def session_owner():
+    """Id of the Streamlit session running the current script, or "shared" outside one."""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else "shared"
+
+
+def _is_record_list(value):
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "owner", "label", "last_used", "spill_path", "spill_kind", "spilling")
+
+    def __init__(self, value, size, owner, label):
+        self.value = value
+        self.size = size
+        self.owner = owner
+        self.label = label
+        self.last_used = time.monotonic()
+        self.spill_path = None
+        self.spill_kind = None
+        self.spilling = False
+
+
+class Governed:
+    """Handle on a tracked object. Use get() for every access; set() after replacing or growing the value."""
+
+    __slots__ = ("_governor", "_id", "__weakref__")
+
+    def __init__(self, governor, entry_id):
+        self._governor = governor
+        self._id = entry_id
+
+    def get(self):
+        return self._governor._get(self._id)
+
+    def set(self, value, size=None):
+        """Replaces the value; pass `size` when it is known, to skip re-measuring a large object."""
+        self._governor._set(self._id, value, size)
+
+    @property
+    def size(self):
+        return self._governor._entries[self._id].size
+
+    @property
+    def spilled(self):
+        return self._governor._entries[self._id].value is None
+
+
+class MemoryGovernor:
+    """Tracks objects against one memory budget and spills least recently used ones to disk."""
+
+    def __init__(self, budget=BUDGET_BYTES, spill_dir=None):
+        self.budget = budget
+        self.spill_dir = spill_dir or os.path.dirname(cache_path("spill", "_"))
+        self.resident = 0
+        self.spills = 0
+        self.rehydrations = 0
+        self._pending = 0  # bytes of resident objects being written out by some thread
+        self._entries = {}
+        self._ids = itertools.count()
+        self._lock = threading.RLock()
+
+    def track(self, value, owner=None, label=""):
+        """Starts accounting for `value`, charged to `owner` (default: the current session)."""
+        entry = _Entry(value, measure(value), owner or session_owner(), label)
+        with self._lock:
+            entry_id = next(self._ids)
+            self._entries[entry_id] = entry
+            self.resident += entry.size
+        self._enforce(keep=entry_id)
+        handle = Governed(self, entry_id)
+        weakref.finalize(handle, self._forget, entry_id)
+        return handle
+
+    def _get(self, entry_id):
+        while True:
+            with self._lock:
+                entry = self._entries[entry_id]
+                entry.last_used = time.monotonic()
+                if entry.value is not None:
+                    return entry.value
+                spill_path, spill_kind = entry.spill_path, entry.spill_kind
+            try:
+                value = self._load(spill_path, spill_kind)
+            except OSError:
+                with self._lock:
+                    if entry.spill_path == spill_path:
+                        raise
+                continue  # another thread loaded it and deleted the file meanwhile
+            with self._lock:
+                if entry.value is None and entry.spill_path == spill_path:
+                    entry.value = value
+                    entry.spill_path = entry.spill_kind = None
+                    self.resident += entry.size
+                    self.rehydrations += 1
+                    break
+            # another thread loaded or replaced it meanwhile: take that value
+        _remove(spill_path)
+        self._enforce(keep=entry_id)
+        return value
+
+    def _set(self, entry_id, value, size=None):
+        with self._lock:
+            entry = self._entries[entry_id]
+            spill_path, entry.spill_path, entry.spill_kind = entry.spill_path, None, None
+            if entry.value is not None:
+                self.resident -= entry.size
+            entry.value, entry.size = value, measure(value) if size is None else size
+            entry.last_used = time.monotonic()
+            self.resident += entry.size
+        _remove(spill_path)
+        self._enforce(keep=entry_id)
+
+    def _forget(self, entry_id):
+        with self._lock:
+            entry = self._entries.pop(entry_id, None)
+            if entry is None:
+                return
+            if entry.value is not None:
+                self.resident -= entry.size
+            spill_path = entry.spill_path
+        _remove(spill_path)
+
+    def _enforce(self, keep):
+        """
+        Spills least recently used objects (never `keep`) until the resident total fits the
+        budget. Each victim is chosen and retired under the lock and written out between the
+        two; it stays resident and readable meanwhile, and is kept if it was replaced or
+        forgotten before its file was complete.
+        """
+        skipped = set()
+        while True:
+            with self._lock:
+                if self.resident - self._pending <= self.budget:
+                    return
+                candidates = [(e.last_used, entry_id) for entry_id, e in self._entries.items()
+                              if e.value is not None and not e.spilling and entry_id != keep and entry_id not in skipped]
+                if not candidates:
+                    return
+                entry_id = min(candidates)[1]
+                entry = self._entries[entry_id]
+                value, size = entry.value, entry.size
+                entry.spilling = True
+                self._pending += size
+            try:
+                spill_path, spill_kind = self._spill(entry_id, value)
+            except (OSError, TypeError, ValueError, pickle.PicklingError):
+                spill_path = None  # unspillable objects stay resident
+            with self._lock:
+                entry.spilling = False
+                self._pending -= size
+                if spill_path and entry.value is value and self._entries.get(entry_id) is entry:
+                    entry.spill_path, entry.spill_kind = spill_path, spill_kind
+                    entry.value = None
+                    self.resident -= size
+                    self.spills += 1
+                    continue
+            skipped.add(entry_id)
+            _remove(spill_path)
+
+    def _spill(self, entry_id, value):
+        path = os.path.join(self.spill_dir, f"{os.getpid()}-{entry_id}-{next(self._ids)}")
+        if _is_record_list(value):
+            write_table_file(path + ".col", value)
+            return path + ".col", "records"
+        with open(path + ".pkl", "wb") as f:  # our own objects, read back only by this process
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path + ".pkl", "pickle"
+
+    @staticmethod
+    def _load(spill_path, spill_kind):
+        if spill_kind == "records":
+            table = FileTable(spill_path)
+            try:
+                return list(table)
+            finally:
+                table.close()
+        with open(spill_path, "rb") as f:
+            return pickle.load(f)
+
+    def stats(self):
+        with self._lock:
+            spilled = [e for e in self._entries.values() if e.value is None]
+            return {"Budget": self.budget, "Resident": self.resident, "Objects": len(self._entries),
+                    "Spilled Objects": len(spilled), "Spilled Bytes": sum(e.size for e in spilled),
+                    "Spills": self.spills, "Rehydrations": self.rehydrations}
+
+    def usage_by_owner(self):
+        """Rows of resident and spilled bytes per owner, largest first."""
+        with self._lock:
+            rows = {}
+            for e in self._entries.values():
+                row = rows.setdefault(e.owner, {"Owner": e.owner, "Objects": 0, "Resident": 0, "Spilled": 0})
+                row["Objects"] += 1
+                row["Resident" if e.value is not None else "Spilled"] += e.size
+            return sorted(rows.values(), key=lambda row: -(row["Resident"] + row["Spilled"]))
+
+
+def _remove(path):
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_governor = None
+_governor_lock = threading.Lock()
+
+
+def get_governor():
+    """Returns the process-wide memory governor."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = MemoryGovernor()
+        return _governor
+
+
+def governed_state(name, factory):
+    """
+    Returns the value of st.session_state[name] kept under the governor, creating it with
+    `factory()` on first use. Store changes back with set_governed_state().
+    """
+    handle = st.session_state.get(name)
+    if not isinstance(handle, Governed):
+        handle = st.session_state[name] = get_governor().track(factory() if handle is None else handle, label=name)
+    return handle.get()
+
+
+def set_governed_state(name, value):
+    """Replaces the governed value of st.session_state[name]."""
+    handle = st.session_state.get(name)
+    if isinstance(handle, Governed):
+        handle.set(value)
+    else:
+        st.session_state[name] = get_governor().track(value, label=name)
@@ -0,0 +1,155 @@
+# page_cache.py
+"""
+On-disk cache of the text extracted from individual PDF pages.
+
+A page is keyed by a hash of everything its extraction depends on: the decoded content
+stream, the resources it draws with (fonts, XObjects, including their stream data), its
+geometry and the extractor version. A revised report that changes a few pages therefore
+re-extracts only those pages; every unchanged page is served from the cache, whatever
+its position in the new revision.
+"""
+import hashlib
+import json
+import os
+import threading
+
+from pdfminer.pdftypes import PDFObjRef, PDFStream
+from pdfminer.psparser import PSLiteral
+
+from cache_paths import atomic_write, cache_path
+from pdf_pages import page_content
+
+EXTRACTOR_VERSION = 1
+MAX_BYTES = int(os.environ.get("COMPLIANCE_PAGE_CACHE_MB", "256")) * 1024 * 1024
+EVICT_EVERY = 200
+
+
+def _feed(h, obj, memo):
+    """Feeds a canonical serialization of a PDF object tree into hash `h`."""
+    if isinstance(obj, PDFObjRef):
+        digest = memo.get(obj.objid)
+        if digest is None:
+            memo[obj.objid] = b"cycle"
+            sub = hashlib.sha256()
+            _feed(sub, obj.resolve(), memo)
+            digest = memo[obj.objid] = sub.digest()
+        h.update(b"R" + digest)
+    elif isinstance(obj, PDFStream):
+        h.update(b"S")
+        _feed(h, obj.attrs, memo)
+        h.update(hashlib.sha256(obj.get_data()).digest())  # decoded: rawdata is dropped once a stream is decoded
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for key in sorted(obj, key=str):
+            h.update(str(key).encode("utf-8") + b"=")
+            _feed(h, obj[key], memo)
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for item in obj:
+            _feed(h, item, memo)
+        h.update(b"]")
+    elif isinstance(obj, PSLiteral):
+        h.update(b"/" + str(obj.name).encode("utf-8"))
+    elif isinstance(obj, bytes):
+        h.update(b"b%d:" % len(obj) + obj)
+    else:
+        h.update(repr(obj).encode("utf-8"))
+
+
+def page_key(page, memo=None):
+    """
+    Returns the cache key of a pdfplumber page. `memo` (one dict per document) avoids
+    re-hashing fonts and images shared by many pages.
+    """
+    h = hashlib.sha256(b"page-v%d" % EXTRACTOR_VERSION)
+    h.update(repr((tuple(page.bbox), page.rotation)).encode("utf-8"))
+    h.update(hashlib.sha256(page_content(page)).digest())
+    _feed(h, page.page_obj.resources, memo if memo is not None else {})
+    return h.hexdigest()
+
+
+class PageCache:
+    """Page extraction results stored one JSON file per page; least recently used files are evicted beyond MAX_BYTES."""
+
+    def __init__(self, root=None):
+        self.root = root or os.path.dirname(cache_path("pages", "_"))
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # mtime doubles as last-use time for eviction
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key, entry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, json.dumps(entry).encode("utf-8"))
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def evict(self, max_bytes=MAX_BYTES):
+        """Deletes least recently used pages until the cache fits in `max_bytes`."""
+        files = []
+        for folder, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(folder, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def _extract(self, page, field, extract, memo, stats):
+        key = page_key(page, memo)
+        entry = self.get(key) or {}
+        hit = field in entry
+        if not hit:
+            entry[field] = extract()
+            self.put(key, entry)
+        with self._lock:
+            self.hits += hit
+            self.misses += not hit
+        if stats is not None:
+            stats["Cached" if hit else "Extracted"] += 1
+        return entry[field]
+
+    def page_text(self, page, memo=None, stats=None):
+        """page.extract_text() through the cache. `stats` (see pdf_pages.new_pruning_stats) counts Cached and Extracted pages."""
+        return self._extract(page, "text", lambda: page.extract_text() or "", memo, stats)
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache():
+    """Returns the process-wide page cache."""
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageCache()
+        return _page_cache
@@ -0,0 +1,84 @@
+# parametric.py
+"""
+Unit-aware parsing of catalog attributes into numbers in SI base units.
+
+Catalog values are free text ("25 VDC", "-55 C", "1 uF", "10 mOhm", "450mA"). parse_quantity
+reads a number, an optional SI prefix and a unit, and returns the value in the base unit:
+farads, volts, amperes, ohms, henries, watts, hertz, metres, kelvin (temperatures are
+given in degrees Celsius) and plain ratios for percentages. PARAMETERS lists the
+attributes that become numeric parameters and the unit each must be in; values that do
+not parse, ranges ("3.5V to 28V") and values in another unit are left out.
+"""
+import re
+from functools import lru_cache
+
+_PREFIXES = {"p": 1e-12, "n": 1e-9, "u": 1e-6, "µ": 1e-6, "m": 1e-3, "": 1.0, "k": 1e3, "K": 1e3, "M": 1e6, "G": 1e9}
+_UNITS = {"F": "F", "V": "V", "VDC": "V", "A": "A", "Ohm": "Ω", "Ω": "Ω", "H": "H", "W": "W", "Hz": "Hz",
+          "m": "m", "C": "K", "°C": "K", "%": "", "ppm": ""}
+_UNIT_SCALES = {"%": 1e-2, "ppm": 1e-6}
+
+QUANTITY_RE = re.compile(r"^\s*([+-]?\d+(?:\.\d+)?)\s*([pnuµmkKMG]?)\s*(VDC|Ohm|Hz|ppm|°C|[FVAΩHWmC%])\s*$")
+SIGNIFICANT_DIGITS = 12  # so "100nF" and "0.1uF" (or a value typed in µF) compare equal
+
+# Attribute -> SI unit of its numeric parameter
+PARAMETERS = {
+    "Capacitance": "F", "Voltage Rating DC": "V", "Minimum Operating Temperature": "K",
+    "Maximum Operating Temperature": "K", "Resistance": "Ω", "Tolerance": "", "Power": "W",
+    "Current": "A", "Current Rating": "A", "Output Current": "A", "Output Voltage": "V", "Inductance": "H",
+    "Frequency": "Hz", "ESR": "Ω", "Impedance @ 100MHz": "Ω", "Vds": "V", "Id": "A", "Rds(on)": "Ω",
+    "V Rwm": "V", "VRRM": "V", "Vrrm": "V", "VRM": "V", "Vz": "V", "If(AV)": "A", "IF": "A",
+    "Coil Voltage": "V", "GBW": "Hz", "Length": "m", "Width": "m", "Height": "m", "Pitch": "m",
+}
+
+# SI unit -> (label, scale, offset) of the unit parameters are entered and shown in: si = shown * scale + offset
+DISPLAY_UNITS = {
+    "F": ("µF", 1e-6, 0.0), "V": ("V", 1.0, 0.0), "A": ("A", 1.0, 0.0), "Ω": ("Ω", 1.0, 0.0),
+    "H": ("µH", 1e-6, 0.0), "W": ("W", 1.0, 0.0), "Hz": ("MHz", 1e6, 0.0), "m": ("mm", 1e-3, 0.0),
+    "K": ("°C", 1.0, 273.15), "": ("%", 1e-2, 0.0),
+}
+
+
+@lru_cache(maxsize=65536)  # catalogs repeat the same few values ("25 VDC", "-55 C") across many parts
+def parse_quantity(text):
+    """Returns (value in SI base units, SI unit) for text like "450mA" or "-55 C", or None."""
+    match = QUANTITY_RE.match(str(text))
+    if not match:
+        return None
+    number, prefix, unit = match.groups()
+    value = float(number) * _PREFIXES[prefix] * _UNIT_SCALES.get(unit, 1.0)
+    if _UNITS[unit] == "K":
+        if prefix:
+            return None  # "mC" is not a temperature
+        value += 273.15
+    return _rounded(value), _UNITS[unit]
+
+
+def _rounded(value):
+    return float(f"{value:.{SIGNIFICANT_DIGITS}g}")
+
+
+def parameter_values(record):
+    """Yields (attribute, value in SI base units) for the attributes of `record` listed in PARAMETERS."""
+    for attribute, text in record.items():
+        unit = PARAMETERS.get(attribute)
+        if unit is None or text is None:
+            continue
+        quantity = parse_quantity(str(text))
+        if quantity is not None and quantity[1] == unit:
+            yield attribute, quantity[0]
+
+
+def to_si(value, attribute):
+    """Converts a value entered in the attribute's display unit to SI base units."""
+    _, scale, offset = DISPLAY_UNITS[PARAMETERS[attribute]]
+    return _rounded(value * scale + offset)
+
+
+def from_si(value, attribute):
+    """Converts a value in SI base units to the attribute's display unit."""
+    _, scale, offset = DISPLAY_UNITS[PARAMETERS[attribute]]
+    return (value - offset) / scale
+
+
+def display_unit(attribute):
+    return DISPLAY_UNITS[PARAMETERS[attribute]][0]
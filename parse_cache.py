@@ -0,0 +1,112 @@
+# parse_cache.py
+"""
+In-memory cache of parsed reports, shared by every session of the Streamlit process.
+
+Streamlit reruns the whole script on each widget interaction, so without a cache the same
+upload is parsed again every time a section is expanded. Results are keyed by the SHA-256
+of the upload content, PARSER_VERSION and the parse options, and evicted least recently
+used once their estimated size exceeds MAX_BYTES. Cached values are shared: callers must
+treat them as read-only.
+"""
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+PARSER_VERSION = 1  # bump whenever a report parser changes its output
+MAX_BYTES = int(os.environ.get("COMPLIANCE_PARSE_CACHE_MB", "512")) * 1024 * 1024
+MAX_DIGESTS = 256
+
+
+def content_digest(data):
+    """SHA-256 hex digest of a bytes-like object."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_key(digest, *options):
+    """Cache key for content `digest` parsed with `options` under the current PARSER_VERSION."""
+    return hashlib.sha256(repr((PARSER_VERSION, digest, options)).encode("utf-8")).hexdigest()
+
+
+def estimate_size(value):
+    """Approximate memory footprint of nested lists/dicts of scalars, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class ParseCache:
+    """Size-bounded LRU mapping of parse keys to results, with hit/miss counters."""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._digests = OrderedDict()
+        self._lock = threading.Lock()
+
+    def upload_digest(self, uploaded_file, view):
+        """
+        Returns the content digest of an upload, hashing `view` (its bytes) only the first
+        time a given upload is seen, so reruns on the same upload do not re-hash it.
+        """
+        memo_key = (getattr(uploaded_file, "file_id", None), len(view))
+        with self._lock:
+            digest = self._digests.get(memo_key) if memo_key[0] else None
+        if digest is None:
+            digest = content_digest(view)
+            if memo_key[0]:
+                with self._lock:
+                    self._digests[memo_key] = digest
+                    while len(self._digests) > MAX_DIGESTS:
+                        self._digests.popitem(last=False)
+        return digest
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size=None):
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            return  # would evict everything else for a single entry
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"Entries": len(self._entries), "Bytes": self.bytes, "Hits": self.hits,
+                    "Misses": self.misses, "Hit Rate": self.hits / lookups if lookups else 0.0}
+
+
+_parse_cache = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache():
+    """Returns the process-wide parse cache."""
+    global _parse_cache
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            _parse_cache = ParseCache()
+        return _parse_cache
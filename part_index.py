@@ -0,0 +1,293 @@
+# part_index.py
+"""
+In-memory indexes over the catalog's normalized part numbers.
+
+PrefixIndex serves type-ahead lookup. The part numbers are held sorted in one UTF-8 blob
+with an offsets array (about 20 bytes per part instead of a Python str each; the process-wide
+index uses the catalog snapshot's mapped column of that layout as is) and searched
+by binary search: the parts starting with a prefix form one contiguous range, found with
+two bisections. Only the first SCAN_LIMIT entries of a large range are ranked, so a
+one-letter prefix over millions of parts costs no more than a long one.
+
+NGramIndex proposes the closest parts for part numbers that are not in the catalog
+(typos, missing dashes, extra packaging suffixes). Each part is indexed by the trigrams
+of its alphanumeric characters, and candidates are ranked by the Dice coefficient of
+shared trigrams. Trigrams too common to have postings are still counted, through one bit
+per part for each of them. Postings are numpy arrays, so a whole BOM is matched in one
+batch with a few vectorized operations per distinct unresolved part number.
+
+ParametricIndex answers range queries over the numeric parameters (catalog_db's
+parameters table, mapped from the catalog snapshot): each parameter's values are held
+sorted with the ids of their parts, so a range is two binary searches and a slice, and a
+query over several ranges, a qualification and a category is a count per part id over
+those slices.
+"""
+import bisect
+import itertools
+import re
+import threading
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from catalog_db import normalize_part_number
+from catalog_snapshot import get_catalog_snapshot
+from columnar import BytesColumn
+
+SCAN_LIMIT = 2000
+MAX_POSTING_SHARE = 0.05  # trigrams in more than this share of a large catalog discriminate nothing
+MIN_POSTING_CAP = 1000
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], np.int64)
+
+
+class _SortedKeys(Sequence):
+    """Sorted byte strings packed into one blob; item i is blob[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, keys):
+        encoded = [key.encode("utf-8") for key in keys]
+        self._offsets = array("Q", [0])
+        self._offsets.extend(itertools.accumulate(len(key) for key in encoded))
+        self._blob = b"".join(encoded)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+
+class PrefixIndex:
+    """
+    Ranked completions of part-number prefixes. `part_numbers` must be normalized and sorted:
+    strings, or UTF-8 bytes in a sequence such as a mapped columnar.BytesColumn (used as is).
+    """
+
+    def __init__(self, part_numbers):
+        self._keys = part_numbers if isinstance(part_numbers, (_SortedKeys, BytesColumn)) else _SortedKeys(part_numbers)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _range(self, prefix):
+        prefix = normalize_part_number(prefix).encode("utf-8")
+        lo = bisect.bisect_left(self._keys, prefix)
+        hi = bisect.bisect_left(self._keys, prefix + b"\xff", lo)  # 0xff never occurs in UTF-8
+        return lo, hi
+
+    def count(self, prefix):
+        """Number of part numbers starting with `prefix`."""
+        lo, hi = self._range(prefix)
+        return hi - lo
+
+    def suggest(self, prefix, limit=10):
+        """
+        Up to `limit` part numbers starting with `prefix`: an exact match first, then the
+        shortest completions, ties in alphabetical order.
+        """
+        lo, hi = self._range(prefix)
+        candidates = (self._keys[i] for i in range(lo, min(hi, lo + SCAN_LIMIT)))
+        return [key.decode("utf-8") for key in sorted(candidates, key=len)[:limit]]
+
+
+def _gram_text(part_number):
+    """The characters trigrams are taken from: alphanumerics only, anchored at both ends."""
+    return b"\x01\x01" + _NON_ALNUM_RE.sub("", normalize_part_number(part_number)).encode("ascii", "ignore") + b"\x02"
+
+
+def _unique_counts(values):
+    """Sorted distinct values of an integer array and their counts (sort-based; np.unique hashes, slower here)."""
+    values = np.sort(values)
+    if not len(values):
+        return values, np.empty(0, np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    return values[starts], np.diff(np.append(starts, len(values)))
+
+
+def _trigrams(part_numbers):
+    """Returns (row, trigram code) arrays of the distinct trigrams of each part number, ordered by row."""
+    texts = np.array([_gram_text(pn) for pn in part_numbers], dtype=bytes)
+    if not len(texts):
+        return np.empty(0, np.int64), np.empty(0, np.int32)
+    chars = texts.view(np.uint8).reshape(len(texts), -1).astype(np.int32)
+    codes = (chars[:, :-2] << 16) | (chars[:, 1:-1] << 8) | chars[:, 2:]
+    rows, cols = np.nonzero(chars[:, 2:])  # a trigram ends on every character of the padded text
+    pairs, _ = _unique_counts((rows.astype(np.int64) << 32) | codes[rows, cols])
+    return pairs >> 32, (pairs & 0xFFFFFFFF).astype(np.int32)
+
+
+class NGramIndex:
+    """Closest catalog parts by shared trigrams. `part_numbers` must be normalized and sorted."""
+
+    def __init__(self, part_numbers):
+        self._keys = part_numbers if isinstance(part_numbers, (_SortedKeys, BytesColumn)) else _SortedKeys(part_numbers)
+        rows, codes = _trigrams(self._keys[i].decode("utf-8") for i in range(len(self._keys)))
+        self._grams_per_part = np.bincount(rows, minlength=len(self._keys)).astype(np.int32)
+        order = np.argsort(codes, kind="stable")
+        codes, rows = codes[order], rows[order]
+        gram_codes, counts = _unique_counts(codes)
+        keep = counts <= max(MIN_POSTING_CAP, int(len(self._keys) * MAX_POSTING_SHARE))
+        self._postings = rows[np.repeat(keep, counts)].astype(np.int32)
+        # The few trigrams too common to index still count towards similarity: each part
+        # keeps one bit per such trigram, packed, so shared ones are counted exactly.
+        self._common_codes = gram_codes[~keep]
+        self._common_bits = np.zeros((len(self._keys), (len(self._common_codes) + 7) // 8), np.uint8)
+        common_starts = np.cumsum(counts) - counts
+        for bit, g in enumerate(np.flatnonzero(~keep)):
+            self._common_bits[rows[common_starts[g]:common_starts[g] + counts[g]], bit >> 3] |= np.uint8(1 << (bit & 7))
+        self._gram_codes, counts = gram_codes[keep], counts[keep]
+        self._ends = np.cumsum(counts)
+        self._starts = self._ends - counts
+
+    def __len__(self):
+        return len(self._keys)
+
+    def closest(self, part_numbers, limit=3, min_score=0.3):
+        """
+        Returns {part number: [(catalog part number, similarity), ...]} with up to `limit`
+        parts of similarity (0..1) at least `min_score`, best first, for each distinct
+        entry of `part_numbers`. Similarity is the Dice coefficient of the two sets of
+        trigrams; equal similarities rank the part spelled exactly like the query first, then
+        in part-number order. Candidates are the parts sharing an indexed trigram.
+        """
+        queries = list(dict.fromkeys(part_numbers))
+        rows, codes = _trigrams(queries)
+        bounds = np.searchsorted(rows, np.arange(len(queries) + 1))
+        slots = np.searchsorted(self._gram_codes, codes)
+        slots[slots == len(self._gram_codes)] = 0
+        known = self._gram_codes[slots] == codes if len(self._gram_codes) else np.zeros(len(codes), bool)
+        common = np.searchsorted(self._common_codes, codes)
+        common[common == len(self._common_codes)] = 0
+        is_common = self._common_codes[common] == codes if len(self._common_codes) else np.zeros(len(codes), bool)
+        matches = {}
+        for q, query in enumerate(queries):
+            lo, hi = bounds[q], bounds[q + 1]
+            grams = slots[lo:hi][known[lo:hi]]
+            if not len(grams):
+                matches[query] = []
+                continue
+            hits = np.concatenate([self._postings[self._starts[g]:self._ends[g]] for g in grams])
+            candidates, shared = _unique_counts(hits)
+            bits = common[lo:hi][is_common[lo:hi]]
+            if len(bits):
+                query_bits = np.zeros(self._common_bits.shape[1], np.uint8)
+                np.bitwise_or.at(query_bits, bits >> 3, (1 << (bits & 7)).astype(np.uint8))
+                for byte in np.flatnonzero(query_bits):
+                    shared = shared + _POPCOUNT[self._common_bits[candidates, byte] & query_bits[byte]]
+            scores = 2.0 * shared / (hi - lo + self._grams_per_part[candidates])
+            best = np.flatnonzero(scores >= min_score)
+            if len(best) > limit:  # every part tied with the limit-th score goes on to the tie-break
+                best = best[scores[best] >= -np.partition(-scores[best], limit - 1)[limit - 1]]
+            keys = [self._keys[candidates[i]].decode("utf-8") for i in best]
+            spelled = normalize_part_number(query)
+            # candidates are rows of the sorted keys: by row is part-number order
+            ranked = sorted(range(len(best)), key=lambda j: (-scores[best[j]], keys[j] != spelled, candidates[best[j]]))
+            matches[query] = [(keys[j], round(float(scores[best[j]]), 3)) for j in ranked[:limit]]
+        return matches
+
+
+class ParametricIndex:
+    """
+    Parts by numeric parameter ranges. `columns` is {parameter: (values, part ids)} sorted by
+    value, `fields` has the id, qualification and category of every part
+    (CatalogSnapshot.parameter_columns and fields_frame, or the CatalogDB equivalents).
+    """
+
+    def __init__(self, columns, fields):
+        size = int(fields["id"].max()) + 1 if len(fields) else 1
+        ids = fields["id"].to_numpy()
+        self._exists = np.zeros(size, bool)
+        self._exists[ids] = True
+        self._labels = {}
+        for column in ("qualification", "category"):
+            values = fields[column].astype("category")
+            if values.isna().any():
+                if "N/A" not in values.cat.categories:
+                    values = values.cat.add_categories(["N/A"])
+                values = values.fillna("N/A")
+            codes = np.full(size, -1, np.int32)
+            codes[ids] = values.cat.codes.to_numpy()
+            self._labels[column] = (pd.Index(values.cat.categories), codes)
+        self._columns = dict(columns)
+
+    def __len__(self):
+        return int(self._exists.sum())
+
+    def parameters(self):
+        """{parameter: number of parts that have it}."""
+        return {name: len(values) for name, (values, _) in self._columns.items()}
+
+    def value_range(self, name):
+        """(lowest, highest) value of a parameter, in SI base units, or None if no part has it."""
+        values = self._columns.get(name, ((),))[0]
+        return (float(values[0]), float(values[-1])) if len(values) else None
+
+    def labels(self, column):
+        """The distinct qualifications or categories (`column`), for filter choices."""
+        return sorted(self._labels[column][0])
+
+    def search(self, ranges, qualification=None, category=None):
+        """
+        Returns the sorted ids of the parts whose parameters all lie in `ranges`
+        ({parameter: (low, high)} in SI base units, bounds inclusive, None for open), with the
+        given qualification (exact) and a category containing `category` (ignoring case).
+        """
+        hits = np.zeros(len(self._exists), np.uint8)
+        for name, (low, high) in ranges.items():
+            values, part_ids = self._columns.get(name, (np.empty(0), np.empty(0, np.int32)))
+            lo = 0 if low is None else np.searchsorted(values, low, "left")
+            hi = len(values) if high is None else np.searchsorted(values, high, "right")
+            hits[part_ids[lo:hi]] += 1  # a part has each parameter at most once
+        mask = (hits == len(ranges)) & self._exists
+        if qualification is not None:
+            labels, codes = self._labels["qualification"]
+            mask &= codes == (labels.get_loc(qualification) if qualification in labels else -2)
+        if category:
+            labels, codes = self._labels["category"]
+            matching = np.zeros(len(labels) + 1, bool)  # the extra last slot is code -1: no part
+            matching[:-1] = labels.str.contains(category, case=False, regex=False)
+            mask &= matching[codes]
+        return np.flatnonzero(mask)
+
+
+_prefix_index = None
+_prefix_index_lock = threading.Lock()
+
+
+def get_prefix_index():
+    """Returns the process-wide prefix index, over the mapped part numbers of the catalog snapshot."""
+    global _prefix_index
+    with _prefix_index_lock:
+        if _prefix_index is None:
+            _prefix_index = PrefixIndex(get_catalog_snapshot().part_numbers)
+        return _prefix_index
+
+
+_ngram_index = None
+_ngram_index_lock = threading.Lock()
+
+
+def get_ngram_index():
+    """Returns the process-wide trigram index over the catalog, building it on first use."""
+    global _ngram_index
+    with _ngram_index_lock:
+        if _ngram_index is None:
+            _ngram_index = NGramIndex(get_prefix_index()._keys)
+        return _ngram_index
+
+
+_parametric_index = None
+_parametric_index_lock = threading.Lock()
+
+
+def get_parametric_index():
+    """Returns the process-wide parametric index, over the mapped arrays of the catalog snapshot."""
+    global _parametric_index
+    with _parametric_index_lock:
+        if _parametric_index is None:
+            snapshot = get_catalog_snapshot()
+            _parametric_index = ParametricIndex(snapshot.parameter_columns(), snapshot.fields_frame())
+        return _parametric_index
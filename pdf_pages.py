@@ -0,0 +1,129 @@
+# pdf_pages.py
+"""
+Page relevance pre-pass for PDF reports.
+
+Supplier PDFs carry many pages that cannot hold results: cover pages, photographs, setup
+diagrams, calibration certificates. Before paying for layout analysis and text extraction,
+each page's raw content stream is scanned for result keywords in its literal strings and
+for table ruling (rectangles and line segments). Literal strings are unescaped, and the
+pieces of a kerned TJ array ("[(GPS fix --)10(> Pa)20(ssed)] TJ") are joined back into the
+text they show before the search. Given the active rule pack (a CompiledRulePack), a page
+is also kept when any of its rules matches that text, so every format the parser extracts,
+including a supplier pack's own, survives the pre-pass. Pages whose text cannot be read
+this way (CID/hex-encoded fonts, form XObjects) are always kept, so pruning only drops
+pages that are known to be irrelevant.
+"""
+import re
+
+from pdfminer.pdftypes import resolve1
+from pdfminer.psparser import LIT
+
+RESULT_KEYWORDS_RE = re.compile(rb"pass|fail|success|verdict|result|-->|n/a", re.I)
+TABLE_MIN_OPS = 8
+MIN_ASCII_RATIO = 0.8
+
+_LITERAL_RE = re.compile(rb"\((?:\\.|[^\\)])*\)", re.S)
+_KERNING_RE = re.compile(rb"[\s\d.+-]*")  # what separates the strings of one TJ array
+_ESCAPE_RE = re.compile(rb"\\(?:([0-7]{1,3})|(\r\n|\r|\n)|(.))", re.S)
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+_HEX_STRING_RE = re.compile(rb"<[0-9A-Fa-f\s]+>")
+_TEXT_SHOW_RE = re.compile(rb"(?:T[Jj]|['\"])(?=\s|$)")
+_RULING_RE = re.compile(rb"\s(?:re|l)(?=\s|$)")
+_XOBJECT_RE = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s+Do(?=\s|$)")
+
+_FORM = LIT("Form")
+
+
+def page_content(page):
+    """Returns the decoded content stream bytes of a pdfplumber page."""
+    return b"\n".join(resolve1(stream).get_data() for stream in (page.page_obj.contents or []))
+
+
+def _uses_forms(page, content):
+    """True if the page draws form XObjects, whose text lives outside the page's own stream."""
+    xobjects = resolve1(resolve1(page.page_obj.resources or {}).get("XObject")) or {}
+    for name in _XOBJECT_RE.findall(content):
+        xobject = resolve1(xobjects.get(name.decode("latin-1")))
+        if xobject is not None and resolve1(xobject.attrs.get("Subtype")) is _FORM:
+            return True
+    return False
+
+
+def _unescape(match):
+    octal, line_break, char = match.groups()
+    if octal:
+        return bytes([int(octal, 8) & 0xFF])
+    if line_break:
+        return b""
+    return _ESCAPES.get(char, char)
+
+
+def literal_text(content):
+    """
+    The text of a content stream's literal strings: unescaped, with the strings of one TJ
+    array (only kerning numbers between them) joined without a gap and a newline between
+    separate text operations.
+    """
+    pieces, end = [], None
+    for match in _LITERAL_RE.finditer(content):
+        if end is not None:
+            pieces.append(b"" if _KERNING_RE.fullmatch(content, end, match.start()) else b"\n")
+        pieces.append(_ESCAPE_RE.sub(_unescape, match.group()[1:-1]))
+        end = match.end()
+    return b"".join(pieces)
+
+
+def score_page(page, compiled=None):
+    """
+    Scores one page from its raw content stream. Returns a dict with keyword hits, whether
+    a rule of `compiled` matches, table ruling operators, text-show operators, whether the
+    text layer was readable, and the verdict `relevant`.
+    """
+    content = page_content(page)
+    literals = literal_text(content)
+    text_ops = len(_TEXT_SHOW_RE.findall(content))
+    ascii_ratio = sum(32 <= b < 127 for b in literals) / len(literals) if literals else 1.0
+    decidable = (ascii_ratio >= MIN_ASCII_RATIO
+                 and not (text_ops and _HEX_STRING_RE.search(content))
+                 and not _uses_forms(page, content))
+    keywords = len(RESULT_KEYWORDS_RE.findall(literals))
+    table_ops = len(_RULING_RE.findall(content))
+    rule_match = (decidable and not keywords and table_ops < TABLE_MIN_OPS and compiled is not None
+                  and compiled.matches(literals.decode("latin-1")))
+    return {
+        "page": page.page_number,
+        "keywords": keywords,
+        "rule_match": rule_match,
+        "table_ops": table_ops,
+        "text_ops": text_ops,
+        "decidable": decidable,
+        "relevant": not decidable or keywords > 0 or rule_match or table_ops >= TABLE_MIN_OPS,
+    }
+
+
+def new_pruning_stats():
+    return {"Pages": 0, "Pruned": 0, "Unreadable": 0, "Cached": 0, "Extracted": 0}
+
+
+def iter_relevant_pages(pdf, force_full=False, stats=None, compiled=None):
+    """
+    Yields the pages of an open pdfplumber document that may carry results for the rule pack
+    `compiled`, skipping the rest unless `force_full`. Fills `stats` (see new_pruning_stats)
+    as it goes.
+    """
+    stats = stats if stats is not None else new_pruning_stats()
+    for page in pdf.pages:
+        stats["Pages"] += 1
+        if force_full:
+            yield page
+            continue
+        try:
+            score = score_page(page, compiled)
+        except Exception:
+            score = {"relevant": True, "decidable": False}  # malformed stream: let the full parse decide
+        stats["Unreadable"] += not score["decidable"]
+        if score["relevant"]:
+            yield page
+        else:
+            stats["Pruned"] += 1
+            page.close()
@@ -3,9 +3,11 @@ import streamlit as st
 import pandas as pd
 import pdfplumber
 import openpyxl
-import re
 import os
-from io import BytesIO
+from uploads import decode_upload, open_upload
+from report_text import extract_test_data
+from workbook_parallel import parse_workbook
+from memory_governor import governed_state
 
 # To parse .docx files, you need to install python-docx
 try:
@@ -62,6 +64,7 @@ def init_session_state():
     for key, value in state_defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
+    governed_state("component_db", pd.DataFrame)  # tracks the per-session table under the memory governor
 init_session_state()
 
 # --- UNIFIED HELPER FUNCTIONS (for data parsing and display) ---
@@ -69,20 +72,20 @@ def parse_uploaded_file(uploaded_file):
     """Parses various file types to extract text and data."""
     file_type = uploaded_file.type
     content = None
-    file_bytes = BytesIO(uploaded_file.getvalue())
-
-    if file_type == "application/pdf":
-        with pdfplumber.open(file_bytes) as pdf:
-            content = " ".join(page.extract_text() for page in pdf.pages if page.extract_text())
-    elif file_type == "text/plain":
-        content = file_bytes.getvalue().decode("utf-8")
-    elif file_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
-        content = parse_xlsx(file_bytes)
-    elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        content = parse_docx(file_bytes)
-    else:
-        st.error(f"Unsupported file type: {file_type}")
-        return None
+
+    if file_type == "text/plain":
+        return decode_upload(uploaded_file)
+    with open_upload(uploaded_file) as file_bytes:
+        if file_type == "application/pdf":
+            with pdfplumber.open(file_bytes) as pdf:
+                content = " ".join(page.extract_text() for page in pdf.pages if page.extract_text())
+        elif file_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
+            content = parse_xlsx(file_bytes)
+        elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+            content = parse_docx(file_bytes)
+        else:
+            st.error(f"Unsupported file type: {file_type}")
+            return None
     return content
 
 def parse_docx(file_bytes):
@@ -110,53 +113,13 @@ def parse_xlsx(file_bytes):
         st.error(f"An error occurred while parsing the XLSX file: {e}")
         return None
 
-def extract_test_data(text_content):
-    """
-    Extracts individual test cases and their results from a continuous text block.
-    """
-    extracted_data = []
-    
-    # This regex handles the formats from the images: `[number]: [Test Description] -> [Result]` or `[number]: [Test Description] "FAIL"`
-    # It is designed to be flexible.
-    test_pattern = re.compile(
-        r"(\d+): (.*?)(?:->| |)(PASS|FAIL|N/A|COMPLETE|SUCCESS|FAILURE)",
-        re.IGNORECASE
-    )
-
-    matches = test_pattern.findall(text_content)
-
-    if not matches:
-        # Fallback to a simpler line-by-line search for results if the primary regex fails.
-        lines = text_content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            result = None
-            test_description = line
-            if "FAIL" in line.upper() or "FAILURE" in line.upper():
-                result = "FAIL"
-            elif "PASS" in line.upper() or "SUCCESS" in line.upper():
-                result = "PASS"
-            elif "N/A" in line.upper() or "NA" in line.upper():
-                result = "N/A"
-
-            if result:
-                test_description = re.sub(r'(PASS|FAIL|N/A|COMPLETE|SUCCESS|FAILURE)', '', test_description, flags=re.IGNORECASE).strip()
-                extracted_data.append({
-                    "Test Description": test_description,
-                    "Result": result
-                })
-    else:
-        for match in matches:
-            test_id, description, result = match
-            extracted_data.append({
-                "Test Description": f"{test_id}: {description.strip()}",
-                "Result": result.upper()
-            })
-
-    return extracted_data
-
+def parse_xlsx_sheets(uploaded_file):
+    """Parses each sheet of a .xlsx file in a worker process; returns (records tagged with their sheet, per-sheet summary)."""
+    try:
+        return parse_workbook(uploaded_file)
+    except Exception as e:
+        st.error(f"An error occurred while parsing the XLSX file: {e}")
+        return [], None
 
 def display_test_card(test_data, color):
     """Displays a single test case in a stylish card format."""
@@ -164,6 +127,7 @@ def display_test_card(test_data, color):
     <div class="card" style="border-left: 5px solid {color};">
         <p><strong>Test:</strong> {test_data.get('Test Description', 'N/A')}</p>
         <p><strong>Result:</strong> <span style="color:{color}; font-weight: bold;">{test_data.get('Result', 'N/A')}</span></p>
+        {f"<p><strong>Sheet:</strong> {test_data['Sheet']}</p>" if test_data.get('Sheet') else ""}
     </div>
     """, unsafe_allow_html=True)
 
@@ -181,11 +145,20 @@ if option == "Report Verification":
 
     if uploaded_file:
         st.session_state.reports_verified += 1
+        sheet_summary = None
         with st.spinner("Parsing and analyzing the report..."):
-            text_content = parse_uploaded_file(uploaded_file)
-
-        if text_content:
-            parsed_data = extract_test_data(text_content)
+            if uploaded_file.name.lower().endswith(".xlsx"):
+                parsed_data, sheet_summary = parse_xlsx_sheets(uploaded_file)
+                extracted = sheet_summary is not None
+            else:
+                text_content = parse_uploaded_file(uploaded_file)
+                extracted = bool(text_content)
+                parsed_data = extract_test_data(text_content) if extracted else []
+
+        if extracted:
+            if sheet_summary:
+                with st.expander(f"📑 Per-Sheet Results ({len(sheet_summary)} sheets)", expanded=False):
+                    st.dataframe(pd.DataFrame(sheet_summary), use_container_width=True, hide_index=True)
 
             if parsed_data:
                 passed = [t for t in parsed_data if "PASS" in str(t.get("Result", "")).upper()]
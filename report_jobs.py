@@ -0,0 +1,145 @@
+# report_jobs.py
+"""
+Background report parsing for the quick-preview mode.
+
+A ReportJob parses a report page by page (PDF) or in blocks of lines (text logs) on a
+worker thread, so the UI can render whatever has been extracted after a short time
+budget and refresh the summary until the job completes. Segments go through the same
+layout-cache parse as a full parse (layout_cache.LayoutParse), with the same per-rule
+statistics. Jobs live in a process-wide registry, which lets them survive Streamlit reruns.
+"""
+import io
+import threading
+import time
+from collections import OrderedDict
+
+import pdfplumber
+
+from memory_governor import get_governor, session_owner
+from page_cache import get_page_cache
+from pdf_pages import iter_relevant_pages, new_pruning_stats
+
+PREVIEW_BUDGET_S = 2.0
+TEXT_BLOCK_LINES = 5000
+MAX_JOBS = 16
+
+
+class ReportJob:
+    """
+    Parses one report on a daemon thread; `layout` (a layout_cache.LayoutParse) turns each
+    segment into records and learns the layout once the whole report is parsed. PDF pages
+    without result-bearing content are skipped unless `force_full`. Once finished, the records
+    are handed to the memory governor, charged to the session that started the job.
+    """
+
+    def __init__(self, name, data, layout, force_full=False):
+        self.name = name
+        self.force_full = force_full
+        self.pruning = new_pruning_stats()
+        self.unit = "pages" if name.lower().endswith(".pdf") else "lines"
+        self.owner = session_owner()
+        self.started = time.monotonic()
+        self.finished = None
+        self._data = data
+        self.layout = layout
+        self._records = []
+        self._records_handle = None
+        self._units_done = 0
+        self._units_total = None
+        self._error = None
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"report-job:{name}", daemon=True)
+        self._thread.start()
+
+    def _segments(self):
+        """Yields (units in segment, segment text) and sets the total number of units first."""
+        if self.unit == "pages":
+            with pdfplumber.open(io.BytesIO(self._data)) as pdf:
+                self._units_total = len(pdf.pages)
+                counted, memo, cache = 0, {}, get_page_cache()
+                for page in iter_relevant_pages(pdf, self.force_full, self.pruning, self.layout.compiled):
+                    text = cache.page_text(page, memo, self.pruning)
+                    yield self.pruning["Pages"] - counted, text  # pruned pages count as done
+                    counted = self.pruning["Pages"]
+                    page.close()  # drop the page's cached layout objects
+                if self.pruning["Pages"] > counted:
+                    yield self.pruning["Pages"] - counted, ""
+        else:
+            lines = self._data.decode("utf-8", errors="ignore").splitlines()
+            self._units_total = len(lines)
+            for start in range(0, len(lines), TEXT_BLOCK_LINES):
+                block = lines[start:start + TEXT_BLOCK_LINES]
+                yield len(block), "\n".join(block)
+
+    def _run(self):
+        try:
+            for units, text in self._segments():
+                records = self.layout.parse(text) if text else []
+                with self._lock:
+                    self._records.extend(records)
+                    self._units_done += units
+            self.layout.finish()
+        except Exception as e:  # surfaced to the UI through snapshot()
+            self._error = e
+        finally:
+            self._data = None
+            with self._lock:
+                self._records_handle = get_governor().track(self._records, self.owner, f"report job: {self.name}")
+                self._records = None
+            self.finished = time.monotonic()
+            self._done.set()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout):
+        """Blocks until the job finishes or `timeout` seconds pass; returns True if finished."""
+        return self._done.wait(timeout)
+
+    def snapshot(self):
+        """Returns a consistent view of the progress so far."""
+        with self._lock:
+            records = self._records if self._records_handle is None else self._records_handle.get()
+            return {
+                "records": list(records),
+                "done": self.done,
+                "units_done": self._units_done,
+                "units_total": self._units_total,
+                "unit": self.unit,
+                "pruned": self.pruning["Pruned"],
+                "cached": self.pruning["Cached"],
+                "page_pruning": dict(self.pruning),
+                "rule_stats": [dict(row) for row in self.layout.stats],
+                "layout_match": {"fingerprint": self.layout.fingerprint, "reused": self.layout.reused},
+                "error": self._error,
+                "elapsed": (self.finished or time.monotonic()) - self.started,
+            }
+
+
+_jobs = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+def find_job(key):
+    """Returns the job registered under `key`, or None."""
+    with _jobs_lock:
+        return _jobs.get(key)
+
+
+def get_or_start_job(key, name, data, layout, force_full=False):
+    """
+    Returns (job, started) for `key`, starting a job if this report has not been submitted yet.
+    Finished jobs beyond MAX_JOBS are dropped oldest first.
+    """
+    with _jobs_lock:
+        job = _jobs.get(key)
+        started = job is None
+        if started:
+            job = _jobs[key] = ReportJob(name, data, layout, force_full)
+            finished = [k for k, j in _jobs.items() if j.done]
+            while len(_jobs) > MAX_JOBS and finished:
+                del _jobs[finished.pop(0)]
+        _jobs.move_to_end(key)
+        return job, started
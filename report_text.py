@@ -0,0 +1,33 @@
+# report_text.py
+"""Extraction of test cases and results from the plain text of a report."""
+from rule_packs import compile_rule_pack
+
+RESULT_KEYWORDS = r"PASS|FAIL|N/A|COMPLETE|SUCCESS|FAILURE"
+
+# `[number]: [Test Description] -> [Result]` or `[number]: [Test Description] "FAIL"` anywhere in
+# the text; reports that are not numbered fall back to one result per line that names a verdict.
+REPORT_TEXT_RULE_PACK = {
+    "name": "Numbered test results",
+    "include_builtin": False,
+    "rules": [
+        {"name": "numbered result", "scope": "document", "pattern": rf"(\d+: .*?)(?:->| |)({RESULT_KEYWORDS})",
+         "fields": {"TestName": 1, "Result": 2}},
+        {"name": "line naming a failure", "pattern": r"^(.*(fail).*)$",
+         "fields": {"TestName": {"group": 1, "remove": RESULT_KEYWORDS}, "Result": 2}},
+        {"name": "line naming a pass", "pattern": r"^(.*(pass|success).*)$",
+         "fields": {"TestName": {"group": 1, "remove": RESULT_KEYWORDS}, "Result": 2},
+         "results": {"pass": "PASS", "success": "PASS"}},
+        {"name": "line naming n/a", "pattern": r"^(.*(n/a|na).*)$",
+         "fields": {"TestName": {"group": 1, "remove": RESULT_KEYWORDS}, "Result": 2},
+         "results": {"n/a": "N/A", "na": "N/A"}},
+    ],
+}
+
+
+def extract_test_data(text_content):
+    """
+    Extracts individual test cases and their results from a continuous text block
+    with REPORT_TEXT_RULE_PACK.
+    """
+    records = compile_rule_pack(REPORT_TEXT_RULE_PACK).parse(text_content)
+    return [{"Test Description": record["TestName"], "Result": record["Result"]} for record in records]
@@ -0,0 +1,173 @@
+# result_store.py
+"""
+Persistent, content-addressed store of parsed report results, shared by every Streamlit
+replica on the host and surviving restarts.
+
+Each result is a columnar table file (see columnar.py) named by its parse key, so any
+process that parses the same content with the same parser version and options finds it.
+Files are written to a temporary name and renamed into place, so readers see either no
+file or a complete one. An exclusive file lock (cache_paths.file_lock) serializes the shared
+bookkeeping: entry and byte totals, the hit/miss counters and eviction. Lookups never take
+it: each process counts its hits and misses in memory and adds them to the shared counters
+with its next store, or once STATS_FLUSH_S have passed. Least recently used files (mtime is
+refreshed on every hit) are evicted once the store grows beyond MAX_BYTES.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+from cache_paths import atomic_write, cache_path, file_lock
+from columnar import FileTable, write_table_file
+
+MAX_BYTES = int(os.environ.get("COMPLIANCE_RESULT_STORE_MB", "1024")) * 1024 * 1024
+STATS_FLUSH_S = 10
+
+_EMPTY_STATS = {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "bytes_saved": 0}
+
+
+class ResultStore:
+    """Columnar result files under `root`, with host-wide LRU eviction and statistics."""
+
+    def __init__(self, root=None, max_bytes=MAX_BYTES):
+        self.root = root or os.path.dirname(cache_path("results", "_"))
+        self.max_bytes = max_bytes
+        self._lock_path = os.path.join(self.root, ".lock")
+        self._stats_path = os.path.join(self.root, "stats.json")
+        self._thread_lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+        self._unsaved = dict.fromkeys(("hits", "misses", "bytes_saved"), 0)
+        self._flushed = time.monotonic()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive lock across threads and processes for read-modify-write of the bookkeeping."""
+        with self._thread_lock, file_lock(self._lock_path):
+            yield
+
+    def _read_stats(self):
+        stats = dict(_EMPTY_STATS)
+        try:
+            with open(self._stats_path, encoding="utf-8") as f:
+                stats.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return stats
+
+    def _take_unsaved(self):
+        with self._counts_lock:
+            unsaved = self._unsaved
+            self._unsaved = dict.fromkeys(unsaved, 0)
+            self._flushed = time.monotonic()
+            return unsaved
+
+    def _add_stats(self, **deltas):
+        """Adds `deltas` and this process's unsaved lookup counts to the shared counters; the caller holds _locked()."""
+        stats = self._read_stats()
+        for name, delta in (*deltas.items(), *self._take_unsaved().items()):
+            stats[name] += delta
+        atomic_write(self._stats_path, json.dumps(stats).encode("utf-8"))
+        return stats
+
+    def _count(self, **deltas):
+        """Counts a lookup in memory; writes the counters out once STATS_FLUSH_S have passed."""
+        with self._counts_lock:
+            for name, delta in deltas.items():
+                self._unsaved[name] += delta
+            due = time.monotonic() - self._flushed >= STATS_FLUSH_S
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Adds this process's unsaved lookup counts to the shared counters."""
+        with self._locked():
+            self._add_stats()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".col")
+
+    def get(self, key):
+        """Returns the stored result as a memory-mapped FileTable (close it when done), or None."""
+        path = self._path(key)
+        try:
+            table = FileTable(path)
+            os.utime(path)
+        except (OSError, ValueError):  # not stored, evicted meanwhile, or unreadable
+            self._count(misses=1)
+            return None
+        self._count(hits=1, bytes_saved=table.meta.get("source_bytes", 0))
+        return table
+
+    def put(self, key, records, meta=None):
+        """
+        Stores `records` under `key`. Put the size of the parsed source in meta["source_bytes"]
+        so hits can report the parsing they saved.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Encode outside the lock into a staging file evict() does not count, then replace
+        # and account under the lock so concurrent puts of the same key count it once.
+        staging = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            size = write_table_file(staging, records, meta)
+            with self._locked():
+                old_size = os.path.getsize(path) if os.path.exists(path) else None
+                os.replace(staging, path)
+                stats = self._add_stats(entries=old_size is None, bytes=size - (old_size or 0))
+        finally:
+            if os.path.exists(staging):
+                os.remove(staging)
+        if stats["bytes"] > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Deletes least recently used results until the store fits in max_bytes; recounts exactly."""
+        with self._locked():
+            files = []
+            for folder, _, names in os.walk(self.root):
+                for name in names:
+                    if name.endswith(".col"):
+                        path = os.path.join(folder, name)
+                        try:
+                            info = os.stat(path)
+                        except OSError:
+                            continue
+                        files.append((info.st_mtime, info.st_size, path))
+            total = sum(size for _, size, _ in files)
+            kept = len(files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)  # open readers keep their mapping
+                except OSError:
+                    continue
+                total -= size
+                kept -= 1
+            stats = self._read_stats()
+            stats.update(entries=kept, bytes=total)
+            atomic_write(self._stats_path, json.dumps(stats).encode("utf-8"))
+
+    def stats(self):
+        stats = self._read_stats()
+        with self._counts_lock:
+            for name, count in self._unsaved.items():
+                stats[name] += count
+        lookups = stats["hits"] + stats["misses"]
+        return {"Entries": stats["entries"], "Bytes": stats["bytes"], "Hits": stats["hits"],
+                "Misses": stats["misses"], "Hit Rate": stats["hits"] / lookups if lookups else 0.0,
+                "Bytes Saved": stats["bytes_saved"]}
+
+
+_result_store = None
+_result_store_lock = threading.Lock()
+
+
+def get_result_store():
+    """Returns the process-wide handle on the host's result store."""
+    global _result_store
+    with _result_store_lock:
+        if _result_store is None:
+            _result_store = ResultStore()
+        return _result_store
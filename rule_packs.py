@@ -0,0 +1,403 @@
+# rule_packs.py
+"""
+Loadable parsing rule packs for line-oriented supplier logs.
+
+A rule pack is a JSON document with a list of rules (regex pattern plus a mapping from
+capture groups onto the record schema) and an optional keyword -> standard map. Packs are
+screened for catastrophic-backtracking constructs, compiled once and cached by the hash
+of their content. Every run reports per-rule match counts and CPU time.
+
+Rules match one line at a time unless they set "scope": "document". Document rules are
+searched over the whole text (every non-overlapping match is a record, and "(?s)" lets a
+match span lines); they are tried first, in order, and the first one that matches anything
+supplies all the records. The line rules only run when no document rule matched.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import re._parser as _sre_parse
+    import re._constants as _sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+# The formats intelligent_parser has always understood, expressed as a rule pack.
+DEFAULT_RULE_PACK = {
+    "name": "Built-in",
+    "rules": [
+        {"name": "arrow verdict + actual", "pattern": r'^(.*?)\s*-->\s*(Passed|Failed|Success)\s*-->\s*(.+)$',
+         "fields": {"TestName": 1, "Result": 2, "Actual": 3},
+         "results": {"passed": "PASS", "success": "PASS"}, "results_default": "FAIL"},
+        {"name": "arrow value", "pattern": r'^(.*?)\s*-->\s*(.+)$',
+         "fields": {"TestName": 1, "Result": 2, "Actual": 2},
+         "results": {"passed": "PASS", "success": "PASS", "failed": "FAIL"}, "results_match": "contains",
+         "results_default": "INFO"},
+        {"name": "numbered quoted verdict", "pattern": r'^\d+:\s*([A-Z_]+):\s*"([A-Z]+)"$',
+         "fields": {"TestName": {"group": 1, "replace": ["_", " "]}, "Result": 2}},
+        {"name": "is success/failure", "pattern": r'^(.+?)\s+is\s+(success|failure|passed|failed)$',
+         "fields": {"TestName": 1, "Result": 2},
+         "results": {"success": "PASS", "passed": "PASS"}, "results_default": "FAIL"},
+        {"name": "trailing verdict", "pattern": r'^(.+?)\s+(Failed|Passed)$',
+         "fields": {"TestName": 1, "Result": 2},
+         "results": {"passed": "PASS"}, "results_default": "FAIL"},
+    ],
+    "standards": {
+        "gps": "NMEA 0183", "gnss": "3GPP", "bluetooth": "Bluetooth Core Specification", "wifi": "IEEE 802.11",
+        "lte": "3GPP LTE", "can": "ISO 11898", "sensor": "AEC-Q104", "ip rating": "IEC 60529",
+        "short circuit": "AIS-156 / IEC 62133", "overcharge": "AIS-156", "vibration": "IEC 60068-2-6"
+    },
+}
+
+RECORD_FIELDS = ("TestName", "Result", "Actual", "Standard", "Expected", "Description")
+
+# A single line taking longer than this on one rule disables the rule for the rest of the run.
+LINE_TIME_BUDGET_MS = 50
+# A counted repeat ({m,n}) above this many copies of a body with an unbounded quantifier is unsafe.
+MAX_REPEATED_UNBOUNDED = 2
+
+_COMPILED_CACHE = OrderedDict()
+_COMPILED_CACHE_SIZE = 32
+_compiled_cache_lock = threading.Lock()
+
+
+class RulePackError(ValueError):
+    """Raised when a rule pack is malformed or contains an unsafe pattern."""
+
+
+# --- Static ReDoS screening ---
+def _is_unbounded(op, av):
+    return op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) and av[1] == _sre_constants.MAXREPEAT
+
+
+def _contains_unbounded_repeat(items):
+    for op, av in items:
+        if _is_unbounded(op, av):
+            return True
+        for sub in _children(op, av):
+            if _contains_unbounded_repeat(sub):
+                return True
+    return False
+
+
+def _children(op, av):
+    """Yields the sub-sequences of a parsed regex node."""
+    if op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT):
+        yield av[2]
+    elif op == _sre_constants.SUBPATTERN:
+        yield av[3]
+    elif op == _sre_constants.BRANCH:
+        yield from av[1]
+    elif op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+        yield av[1]
+    elif op == _sre_constants.GROUPREF_EXISTS:
+        yield av[1]
+        if av[2]:
+            yield av[2]
+    # ATOMIC_GROUP and POSSESSIVE_REPEAT never backtrack into their body, so they are not descended.
+
+
+def _first_chars(items):
+    """Returns the set of literal first characters of a sequence, or None if it can start with anything."""
+    for op, av in items:
+        if op == _sre_constants.LITERAL:
+            return {av}
+        if op == _sre_constants.SUBPATTERN:
+            return _first_chars(av[3])
+        if op == _sre_constants.AT:
+            continue
+        return None
+    return set()
+
+
+def _branches(items):
+    """Yields the alternation nodes of a sequence, looking through plain groups."""
+    for op, av in items:
+        if op == _sre_constants.BRANCH:
+            yield av[1]
+        elif op == _sre_constants.SUBPATTERN:
+            yield from _branches(av[3])
+
+
+def _ambiguous(alternatives):
+    """True if two alternatives can start the same way (the regex compiler factors out shared prefixes,
+    which leaves an empty alternative behind)."""
+    seen = set()
+    for alternative in alternatives:
+        if not alternative:
+            return True
+        first = _first_chars(alternative)
+        if first is None or first & seen:
+            return True
+        seen |= first
+    return False
+
+
+def screen_pattern(pattern):
+    """
+    Returns a list of reasons why a pattern may backtrack catastrophically (empty if it looks safe).
+    Flags nested unbounded quantifiers such as (a+)+, counted repeats of an unbounded quantifier
+    such as (.*a){12} (each copy multiplies the ways to split a line, and one match call can run
+    far past the time box before it returns), and unbounded repetition of alternatives that can
+    match the same text, such as (a|aa)*.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except re.error as e:
+        return [f"invalid pattern: {e}"]
+
+    findings = set()
+
+    def walk(items):
+        for op, av in items:
+            if _is_unbounded(op, av):
+                if _contains_unbounded_repeat(av[2]):
+                    findings.add("nested unbounded quantifier")
+                if any(_ambiguous(alternatives) for alternatives in _branches(av[2])):
+                    findings.add("quantified alternation with overlapping branches")
+            elif (op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT)
+                  and max(av[0], av[1]) > MAX_REPEATED_UNBOUNDED and _contains_unbounded_repeat(av[2])):
+                findings.add("counted repeat of an unbounded quantifier")
+            for sub in _children(op, av):
+                walk(sub)
+
+    walk(list(parsed))
+    return sorted(findings)
+
+
+# --- Loading and compiling ---
+def load_rule_pack(source):
+    """Loads a rule pack from a dict, a JSON string/bytes, or a path to a JSON file."""
+    if isinstance(source, dict):
+        pack = source
+    else:
+        if isinstance(source, bytes):
+            source = source.decode("utf-8")
+        if isinstance(source, str) and not source.lstrip().startswith("{"):
+            with open(source, encoding="utf-8") as f:
+                source = f.read()
+        try:
+            pack = json.loads(source)
+        except json.JSONDecodeError as e:
+            raise RulePackError(f"Rule pack is not valid JSON: {e}")
+
+    if not isinstance(pack.get("rules"), list) or not pack["rules"]:
+        raise RulePackError("Rule pack must contain a non-empty 'rules' list.")
+    for i, rule in enumerate(pack["rules"]):
+        name = rule.get("name") or f"rule {i + 1}"
+        if not isinstance(rule.get("pattern"), str):
+            raise RulePackError(f"Rule '{name}' has no 'pattern'.")
+        if rule.get("scope", "line") not in ("line", "document"):
+            raise RulePackError(f"Rule '{name}' has an unknown 'scope' (use 'line' or 'document').")
+        fields = rule.get("fields")
+        if not isinstance(fields, dict) or "TestName" not in fields or "Result" not in fields:
+            raise RulePackError(f"Rule '{name}' must map at least 'TestName' and 'Result' in 'fields'.")
+        unknown = set(fields) - set(RECORD_FIELDS)
+        if unknown:
+            raise RulePackError(f"Rule '{name}' maps unknown fields: {', '.join(sorted(unknown))}")
+        patterns = [rule["pattern"]] + [spec["remove"] for spec in fields.values()
+                                        if isinstance(spec, dict) and isinstance(spec.get("remove"), str)]
+        problems = sorted({problem for pattern in patterns for problem in screen_pattern(pattern)})
+        if problems:
+            raise RulePackError(f"Rule '{name}' was rejected: {'; '.join(problems)}")
+    return pack
+
+
+def rule_pack_digest(pack):
+    """SHA-256 of the canonical JSON form of a pack; identical packs share one compiled plan."""
+    canonical = json.dumps(pack, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CompiledRule:
+    __slots__ = ("name", "regex", "document", "fields", "results", "results_contains", "results_default")
+
+    def __init__(self, rule, index):
+        flags = re.I if rule.get("ignore_case", True) else 0
+        self.name = rule.get("name") or f"rule {index + 1}"
+        self.regex = re.compile(rule["pattern"], flags)
+        self.document = rule.get("scope") == "document"
+        self.fields = {}
+        for field, spec in rule["fields"].items():
+            if isinstance(spec, int):
+                spec = {"group": spec}
+            if not isinstance(spec.get("group"), int) or spec["group"] > self.regex.groups:
+                raise RulePackError(f"Rule '{self.name}' maps '{field}' to missing group {spec['group']}.")
+            remove = re.compile(spec["remove"], flags) if spec.get("remove") else None
+            self.fields[field] = (spec["group"], tuple(spec.get("replace") or ()), remove)
+        self.results = {k.lower(): v for k, v in (rule.get("results") or {}).items()}
+        self.results_contains = rule.get("results_match") == "contains"
+        self.results_default = rule.get("results_default")
+
+    def to_record(self, match):
+        record = {"TestName": "Not found", "Result": "N/A", "Actual": "Not found", "Standard": "Not found"}
+        for field, (group, replace, remove) in self.fields.items():
+            value = match.group(group) or ""
+            if replace:
+                value = value.replace(*replace)
+            if remove:
+                value = remove.sub("", value)
+            record[field] = value.strip()
+        record["Result"] = self._result(record["Result"])
+        return record
+
+    def _result(self, value):
+        if not self.results:
+            return value.upper()
+        lowered = value.lower()
+        if self.results_contains:
+            for key, result in self.results.items():
+                if key in lowered:
+                    return result
+        elif lowered in self.results:
+            return self.results[lowered]
+        return self.results_default or value.upper()
+
+
+class CompiledRulePack:
+    """A compiled, immutable parsing plan. Obtain one through compile_rule_pack()."""
+
+    def __init__(self, pack, digest):
+        rules, standards = list(pack["rules"]), dict(pack.get("standards") or {})
+        if pack is not DEFAULT_RULE_PACK and pack.get("include_builtin", True):
+            # Supplier rules are tried first; anything they miss still gets the built-in formats.
+            rules += DEFAULT_RULE_PACK["rules"]
+            standards = {**DEFAULT_RULE_PACK["standards"], **standards}
+        self.name = pack.get("name", "Custom")
+        self.digest = digest
+        self.rules = [CompiledRule(rule, i) for i, rule in enumerate(rules)]
+        self.standards = {k.lower(): v for k, v in standards.items()}
+
+    def parse(self, text, stats=None):
+        """
+        Applies the rules to every non-empty line; the first rule that matches a line wins.
+        Rules are evaluated one at a time over the lines still unmatched, which keeps the
+        per-rule CPU accounting exact. Document rules go first (see the module docstring).
+        Fills `stats` (see new_rule_stats) if given.
+        """
+        budget_ns = LINE_TIME_BUDGET_MS * 1_000_000
+        stats = stats if stats is not None else new_rule_stats(self)
+        document_rules = [(rule, rule_stats) for rule, rule_stats in zip(self.rules, stats) if rule.document]
+        if document_rules:
+            document = text if isinstance(text, str) else "\n".join(text)
+            for rule, rule_stats in document_rules:
+                if not rule_stats["Tripped"]:
+                    extracted = self._parse_document(rule, rule_stats, document, budget_ns)
+                    if extracted:
+                        return self._add_standards(extracted)
+
+        lines = [line.strip() for line in (text.splitlines() if isinstance(text, str) else text)]
+        pending = [i for i, line in enumerate(lines) if line]
+        records = [None] * len(lines)
+
+        for rule, rule_stats in zip(self.rules, stats):
+            if not pending or rule_stats["Tripped"] or rule.document:
+                continue
+            match = rule.regex.match
+            unmatched = []
+            cpu_start = time.thread_time_ns()
+            for n, i in enumerate(pending):
+                started = time.perf_counter_ns()
+                m = match(lines[i])
+                if time.perf_counter_ns() - started > budget_ns:
+                    rule_stats["Tripped"] = True
+                    unmatched.extend(pending[n + (m is not None):])
+                    if m is not None:
+                        records[i] = rule.to_record(m)
+                        rule_stats["Matches"] += 1
+                    rule_stats["Lines Tried"] += 1
+                    break
+                if m is None:
+                    unmatched.append(i)
+                else:
+                    records[i] = rule.to_record(m)
+                    rule_stats["Matches"] += 1
+                rule_stats["Lines Tried"] += 1
+            rule_stats["CPU ms"] += (time.thread_time_ns() - cpu_start) / 1e6
+            pending = unmatched
+
+        return self._add_standards([r for r in records if r is not None])
+
+    def matches(self, text):
+        """
+        True if some rule would extract a record from `text`: a document rule anywhere in it, or
+        a line rule on one of its lines. Rules whose single match overruns the line time budget
+        count as matching, so a slow check never hides content.
+        """
+        budget_ns = LINE_TIME_BUDGET_MS * 1_000_000
+        lines = [line.strip() for line in text.splitlines()]
+        for rule in self.rules:
+            started = time.perf_counter_ns()
+            if rule.document:
+                if rule.regex.search(text):
+                    return True
+            elif any(line and rule.regex.match(line) for line in lines):
+                return True
+            if time.perf_counter_ns() - started > budget_ns:
+                return True
+        return False
+
+    @staticmethod
+    def _parse_document(rule, rule_stats, document, budget_ns):
+        """Records of every match of a document rule; one search step over the budget trips the rule."""
+        extracted, matches = [], rule.regex.finditer(document)
+        cpu_start = time.thread_time_ns()
+        while True:
+            started = time.perf_counter_ns()
+            m = next(matches, None)
+            slow = time.perf_counter_ns() - started > budget_ns
+            if m is not None:
+                extracted.append(rule.to_record(m))
+                rule_stats["Matches"] += 1
+            if m is None or slow:
+                rule_stats["Tripped"] = slow
+                break
+        rule_stats["Lines Tried"] += 1
+        rule_stats["CPU ms"] += (time.thread_time_ns() - cpu_start) / 1e6
+        return extracted
+
+    def _add_standards(self, extracted):
+        if self.standards:
+            for record in extracted:
+                if record["Standard"] != "Not found":
+                    continue
+                name = record["TestName"].lower()
+                for keyword, standard in self.standards.items():
+                    if keyword in name:
+                        record["Standard"] = standard
+                        break
+        return extracted
+
+
+def new_rule_stats(compiled):
+    """Returns an empty per-rule statistics table (one row per rule, in evaluation order)."""
+    return [{"Rule": rule.name, "Lines Tried": 0, "Matches": 0, "CPU ms": 0.0, "Tripped": False}
+            for rule in compiled.rules]
+
+
+def compile_rule_pack(pack=None):
+    """
+    Validates and compiles a rule pack (dict, JSON text or path), reusing the cached plan
+    for a pack whose content was seen before.
+    """
+    pack = DEFAULT_RULE_PACK if pack is None else pack
+    if not isinstance(pack, dict):
+        pack = load_rule_pack(pack)
+    digest = rule_pack_digest(pack)
+    with _compiled_cache_lock:
+        compiled = _COMPILED_CACHE.get(digest)
+        if compiled is not None:
+            _COMPILED_CACHE.move_to_end(digest)
+            return compiled
+    load_rule_pack(pack)
+    compiled = CompiledRulePack(pack, digest)  # compiled outside the lock; a concurrent twin is harmless
+    with _compiled_cache_lock:
+        compiled = _COMPILED_CACHE.setdefault(digest, compiled)
+        _COMPILED_CACHE.move_to_end(digest)
+        if len(_COMPILED_CACHE) > _COMPILED_CACHE_SIZE:
+            _COMPILED_CACHE.popitem(last=False)
+    return compiled
@@ -0,0 +1,84 @@
+# session_snapshot.py
+"""
+Session workspaces that survive a browser refresh or a reconnect.
+
+Each browser session gets a random key carried in the page URL (?session=...). After every
+run the app's small state (counters, lookups, a reference to the last parsed report) is
+written as compressed JSON under the cache directory, and a new session opened with the
+same key restores it before anything renders. Parsed records are not copied into the
+snapshot: it keeps the report's content key, and the records come back from the result store.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+import zlib
+
+import streamlit as st
+
+from cache_paths import atomic_write, cache_path
+
+QUERY_PARAM = "session"
+SNAPSHOT_TTL_S = 7 * 24 * 3600
+
+_KEY_RE = re.compile(r"[0-9a-f]{32}")
+_RESTORED_STATE = "_snapshot_restored"
+_DIGEST_STATE = "_snapshot_digest"
+
+
+def session_key():
+    """Returns this browser session's key, adding a new one to the URL if it has none."""
+    key = st.query_params.get(QUERY_PARAM)
+    if not key or not _KEY_RE.fullmatch(key):
+        key = uuid.uuid4().hex
+        st.query_params[QUERY_PARAM] = key
+    return key
+
+
+def _snapshot_path(key):
+    return cache_path("sessions", f"{key}.json.z")
+
+
+def _purge_expired():
+    folder = os.path.dirname(_snapshot_path("_"))
+    cutoff = time.time() - SNAPSHOT_TTL_S
+    for name in os.listdir(folder):
+        path = os.path.join(folder, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def restore_session(keys):
+    """
+    Copies `keys` from this session's snapshot into st.session_state, once per browser
+    session. Returns True if a snapshot was restored.
+    """
+    if st.session_state.get(_RESTORED_STATE):
+        return False
+    st.session_state[_RESTORED_STATE] = True
+    _purge_expired()
+    try:
+        with open(_snapshot_path(session_key()), "rb") as f:
+            state = json.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, zlib.error):
+        return False
+    for key in keys:
+        if key in state:
+            st.session_state[key] = state[key]
+    return True
+
+
+def save_session(keys):
+    """Writes the snapshot of `keys` if any of them changed since the last save."""
+    state = {key: st.session_state[key] for key in keys if key in st.session_state}
+    payload = json.dumps(state, separators=(",", ":"), sort_keys=True, default=str).encode("utf-8")
+    digest = hashlib.sha1(payload).hexdigest()
+    if st.session_state.get(_DIGEST_STATE) == digest:
+        return
+    atomic_write(_snapshot_path(session_key()), zlib.compress(payload, 6))
+    st.session_state[_DIGEST_STATE] = digest
@@ -0,0 +1,156 @@
+# tail_follow.py
+"""
+Follow mode for bench logs that keep growing during long endurance runs.
+
+For every log source of a session we remember how many bytes have been parsed, anchors
+that prove a re-upload is the same file grown (hashes of its first bytes and of the bytes
+just before the offset) and the records extracted so far. A re-upload then costs time
+proportional to the appended bytes only. Sources are keyed by session and source name, so
+two sessions following logs of the same name keep separate offsets. State is persisted
+under the cache directory, with records in an append-only JSON-lines file.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+from cache_paths import atomic_write, cache_path
+from memory_governor import get_governor, measure, session_owner
+from rule_packs import new_rule_stats
+
+ANCHOR_BYTES = 4096
+
+
+def _digest(data):
+    return hashlib.sha256(bytes(data)).hexdigest()
+
+
+class FollowState:
+    """Parser state of one log source followed by one session. Hold `lock` while using it."""
+
+    def __init__(self, source, session=""):
+        self.source = source
+        key = hashlib.sha256(f"{session}\x1f{source}".encode("utf-8")).hexdigest()[:24]
+        self._state_path = cache_path("follow", f"{key}.json")
+        self._records_path = cache_path("follow", f"{key}.records.jsonl")
+        self.offset = 0
+        self.head = None
+        self.tail = None
+        self.pack_digest = None
+        self.stats = None
+        self._records = get_governor().track([], session_owner(), f"follow: {source}")
+        self.updated = None
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            with open(self._records_path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            return
+        if len(records) != state.get("record_count"):
+            return  # interrupted write; start over rather than trust a partial file
+        self.offset, self.head, self.tail = state["offset"], state["head"], state["tail"]
+        self.pack_digest, self.stats, self.updated = state["pack"], state["stats"], state["updated"]
+        self.records = records
+
+    @property
+    def records(self):
+        """Records extracted so far (kept under the memory governor)."""
+        return self._records.get()
+
+    @records.setter
+    def records(self, records):
+        self._records.set(records)
+
+    def _save(self, new_records, truncate):
+        with open(self._records_path, "w" if truncate else "a", encoding="utf-8") as f:
+            for record in new_records:
+                f.write(json.dumps(record, default=str) + "\n")
+        state = {"source": self.source, "offset": self.offset, "head": self.head, "tail": self.tail,
+                 "pack": self.pack_digest, "stats": self.stats, "updated": self.updated,
+                 "record_count": len(self.records)}
+        atomic_write(self._state_path, json.dumps(state).encode("utf-8"))
+
+    def clear(self):
+        """Forgets everything parsed, in memory and on disk."""
+        self.offset, self.head, self.tail = 0, None, None
+        self.pack_digest = self.stats = self.updated = None
+        self.records = []
+        for path in (self._state_path, self._records_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def continues(self, data, pack_digest):
+        """True if `data` is the previously parsed content with bytes appended, under the same rule pack."""
+        if self.offset == 0 or pack_digest != self.pack_digest or len(data) < self.offset:
+            return False
+        head = data[:min(ANCHOR_BYTES, self.offset)]
+        tail = data[max(0, self.offset - ANCHOR_BYTES):self.offset]
+        return _digest(head) == self.head and _digest(tail) == self.tail
+
+    def update(self, data, compiled):
+        """
+        Parses the complete lines appended since the last update and merges their records.
+        `data` is the whole current log as bytes or a memoryview; only the appended part is copied.
+        Returns (new bytes parsed, new records).
+        """
+        data = memoryview(data)
+        restart = not self.continues(data, compiled.digest)
+        if restart:
+            self.offset, self.records = 0, []
+            self.stats = new_rule_stats(compiled)
+            self.pack_digest = compiled.digest
+
+        appended = data[self.offset:].tobytes()
+        end = appended.rfind(b"\n") + 1  # a trailing partial line waits for the next upload
+        if end == 0:
+            if restart:
+                self._save([], truncate=True)
+            return 0, []
+
+        text = appended[:end].decode("utf-8", errors="ignore")
+        new_records = compiled.parse(text, self.stats)
+        records = self.records
+        records.extend(new_records)
+        self._records.set(records, size=self._records.size + measure(new_records))
+        self.offset += end
+        self.head = _digest(data[:min(ANCHOR_BYTES, self.offset)])
+        self.tail = _digest(data[max(0, self.offset - ANCHOR_BYTES):self.offset])
+        self.updated = time.time()
+        self._save(new_records, truncate=restart)
+        return end, new_records
+
+
+_states = {}
+_states_lock = threading.Lock()
+
+
+def _follow_state(source, session):
+    with _states_lock:
+        state = _states.get((session, source))
+        if state is None:
+            state = _states[session, source] = FollowState(source, session)
+        return state
+
+
+def follow_log(source, data, compiled, session=""):
+    """
+    Feeds the current content of the log `source` to `session`'s follow state;
+    returns (state, new bytes, new records).
+    """
+    state = _follow_state(source, session)
+    with state.lock:  # reruns of the same session must not interleave updates
+        new_bytes, new_records = state.update(data, compiled)
+    return state, new_bytes, new_records
+
+
+def reset_follow(source, session=""):
+    """Forgets everything `session` parsed for `source`; waits for an update in progress to finish first."""
+    state = _follow_state(source, session)
+    with state.lock:
+        state.clear()
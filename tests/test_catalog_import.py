@@ -0,0 +1,53 @@
+# test_catalog_import.py
+"""A distributor dump must never take over or remove a part another source owns."""
+import json
+
+from catalog_db import CatalogDB, CatalogImport
+from catalog_import import iter_dump
+
+CURATED = {"ABC123": {"Manufacturer": "Murata", "Product Category": "Capacitor", "Qualification": "AEC-Q200"}}
+
+
+def write_dump(path, rows):
+    path.write_text("Mfr Part #,Mfr,Category,Qualification\n"
+                    + "".join(f"{part},{mfr},Capacitor,{qualification}\n" for part, mfr, qualification in rows),
+                    encoding="utf-8")
+    return path
+
+
+def import_dump(db_path, csv_path, source):
+    catalog_import = CatalogImport(db_path, source)
+    for part_numbers, hashes, record_of, _ in iter_dump(csv_path):
+        catalog_import.add(part_numbers, hashes, record_of)
+    return catalog_import.finish()
+
+
+def open_catalog(tmp_path, components):
+    components_file = tmp_path / "components.json"
+    components_file.write_text(json.dumps(components), encoding="utf-8")
+    return CatalogDB(str(tmp_path / "catalog.sqlite3"), str(components_file))
+
+
+def test_dump_keeps_out_of_curated_parts(tmp_path):
+    db = open_catalog(tmp_path, CURATED)
+    dump = write_dump(tmp_path / "digikey.csv", [("ABC123", "Other", "None"), ("XYZ9", "TDK", "AEC-Q200")])
+    stats = import_dump(db.path, dump, "digikey")
+    assert (stats["inserted"], stats["conflicts"], stats["removed"]) == (1, 1, 0)
+    assert open_catalog(tmp_path, CURATED).get("abc123")["Qualification"] == "AEC-Q200"
+
+    stats = import_dump(db.path, write_dump(tmp_path / "digikey.csv", [("XYZ9", "TDK", "AEC-Q200")]), "digikey")
+    assert (stats["unchanged"], stats["conflicts"], stats["removed"]) == (1, 0, 0)
+    db = open_catalog(tmp_path, CURATED)
+    assert db.get("ABC123")["Manufacturer"] == "Murata"
+    assert db.get("XYZ9")["Manufacturer"] == "TDK"
+
+
+def test_catalog_takes_over_a_dumped_part(tmp_path):
+    db = open_catalog(tmp_path, CURATED)
+    import_dump(db.path, write_dump(tmp_path / "digikey.csv", [("XYZ9", "TDK", "None")]), "digikey")
+    curated = {**CURATED, "XYZ9": {"Manufacturer": "TDK", "Qualification": "AEC-Q200"}}
+    assert open_catalog(tmp_path, curated).get("XYZ9")["Qualification"] == "AEC-Q200"
+
+    stats = import_dump(db.path, write_dump(tmp_path / "digikey.csv", [("OTHER1", "TDK", "None")]), "digikey")
+    assert (stats["inserted"], stats["removed"]) == (1, 0)
+    assert open_catalog(tmp_path, curated).get("XYZ9")["Qualification"] == "AEC-Q200"
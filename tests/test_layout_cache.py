@@ -0,0 +1,19 @@
+# test_layout_cache.py
+"""A known layout must parse to the same records as a fresh parse of the whole pack."""
+import layout_cache
+from layout_cache import LayoutCache, parse_with_layout_cache
+from rule_packs import compile_rule_pack
+
+STEPS = "\n".join(f"Step {i} --> {i}" for i in range(500))
+
+
+def test_repeat_layout_keeps_first_match_wins(tmp_path, monkeypatch):
+    monkeypatch.setattr(layout_cache, "_layout_cache", LayoutCache(str(tmp_path / "layouts.json")))
+    compiled = compile_rule_pack()
+    parse_with_layout_cache(compiled, STEPS)
+
+    doc = STEPS + "\nVoltage check --> Passed --> 12.1V"
+    records, _, reused = parse_with_layout_cache(compiled, doc)
+    assert reused
+    assert records == compiled.parse(doc)
+    assert records[-1]["Actual"] == "12.1V"
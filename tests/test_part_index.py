@@ -0,0 +1,20 @@
+# test_part_index.py
+"""Closest-part suggestions must survive the trigrams left out of the postings."""
+from part_index import NGramIndex
+
+KEYS = sorted(f"p{i:08d}x" for i in range(20000))  # "p00", "000", ... are too common to index
+
+
+def test_one_character_typo_finds_the_part():
+    index = NGramIndex(KEYS)
+    assert len(index._common_codes)
+    found = dict(index.closest(["p0001O001x"], limit=10)["p0001O001x"])
+    assert found.get("p00010001x", 0) >= 0.7
+
+
+def test_exact_match_ranks_first_among_equal_scores():
+    index = NGramIndex(KEYS)
+    for query in ("p00010001x", "p00001001x"):  # the same set of trigrams
+        best = index.closest([query])[query]
+        assert best[0] == (query, 1.0)
+        assert best[1] == ("p00001001x" if query == "p00010001x" else "p00010001x", 1.0)
@@ -0,0 +1,73 @@
+# test_pdf_pages.py
+"""The PDF page pre-pass must never prune a page that shows results."""
+import pdfplumber
+
+from pdf_pages import iter_relevant_pages, literal_text, new_pruning_stats, score_page
+from rule_packs import compile_rule_pack
+
+
+def write_pdf(path, page_streams):
+    """Writes a minimal PDF with one Helvetica page per content stream."""
+    n = len(page_streams)
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>",
+               f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(n))}] /Count {n} >>".encode()]
+    for i, stream in enumerate(page_streams):
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 {3 + 2 * n} 0 R >> >> "
+                       f"/Contents {4 + 2 * i} 0 R >>".encode())
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    out, offsets = b"%PDF-1.4\n", []
+    for i, obj in enumerate(objects):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i + 1, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(out)
+
+
+COVER = b"BT /F1 12 Tf 72 700 Td (Cover page of report) Tj ET"
+KERNED_RESULTS = (b"BT /F1 12 Tf 72 700 Td [(GPS fix --)10(> Pa)20(ssed)] TJ "
+                  b"0 -20 Td [(CAN bus load F)15(ailed)] TJ ET")
+
+
+def test_literal_text_joins_kerned_strings_and_unescapes():
+    assert literal_text(KERNED_RESULTS) == b"GPS fix --> Passed\nCAN bus load Failed"
+    assert literal_text(rb"BT (Result\: \(ok\)) Tj (\120ass\
+ed) Tj ET") == b"Result: (ok)\nPassed"
+
+
+def test_kerned_results_page_is_kept(tmp_path):
+    path = tmp_path / "kerned.pdf"
+    write_pdf(path, [COVER, KERNED_RESULTS])
+    with pdfplumber.open(path) as pdf:
+        assert pdf.pages[1].extract_text() == "GPS fix --> Passed\nCAN bus load Failed"
+        assert score_page(pdf.pages[1])["relevant"]
+        stats = new_pruning_stats()
+        kept = [page.page_number for page in iter_relevant_pages(pdf, stats=stats)]
+    assert kept == [2]
+    assert stats["Pages"] == 2 and stats["Pruned"] == 1
+
+
+def kept_pages(path, compiled):
+    with pdfplumber.open(path) as pdf:
+        return [page.page_number for page in iter_relevant_pages(pdf, compiled=compiled)]
+
+
+def test_pages_the_builtin_rules_extract_are_kept(tmp_path):
+    path = tmp_path / "quoted.pdf"
+    write_pdf(path, [COVER, b'BT /F1 12 Tf 72 700 Td (1: GPS_FIX: "OK") Tj ET'])
+    compiled = compile_rule_pack()
+    assert kept_pages(path, compiled) == [2]
+    with pdfplumber.open(path) as pdf:
+        assert compiled.parse(pdf.pages[1].extract_text())[0]["Result"] == "OK"
+
+
+def test_pages_a_supplier_pack_extracts_are_kept(tmp_path):
+    path = tmp_path / "supplier.pdf"
+    write_pdf(path, [COVER, b"BT /F1 12 Tf 72 700 Td (Brake light check is good) Tj ET"])
+    pack = {"name": "Supplier", "rules": [{"name": "is good/bad", "pattern": r"^(.+?)\s+is\s+(good|bad)$",
+                                            "fields": {"TestName": 1, "Result": 2}}]}
+    assert kept_pages(path, compile_rule_pack()) == []
+    assert kept_pages(path, compile_rule_pack(pack)) == [2]
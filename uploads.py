@@ -0,0 +1,91 @@
+# uploads.py
+"""
+Upload handling that gives the format readers the bytes already in memory instead of copies.
+
+Streamlit's UploadedFile is a BytesIO over the received bytes, so readers that take a file
+object get the upload itself, rewound, and text is decoded straight from a memoryview of
+getvalue(), which returns those bytes themselves. getbuffer() is never used: exporting a
+BytesIO's buffer unshares it, copying the whole upload.
+Other sources (paths, pipes, sockets) are copied in chunks into a SpooledTemporaryFile
+that spills to disk above SPOOL_THRESHOLD, which bounds the memory a very large file takes.
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+
+SPOOL_THRESHOLD = int(os.environ.get("COMPLIANCE_SPOOL_MB", "32")) * 1024 * 1024
+COPY_CHUNK = 1 << 20
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+@contextlib.contextmanager
+def open_upload(source):
+    """
+    Yields a seekable binary file positioned at the start of `source`: the in-memory upload
+    itself, an opened path, or a spooled copy of any other stream.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)  # shares an immutable bytes object until written to
+    elif _is_path(source):
+        with open(source, "rb") as f:
+            yield f
+    elif isinstance(source, io.BytesIO):
+        source.seek(0)
+        try:
+            yield source
+        finally:
+            source.seek(0)
+    else:
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_THRESHOLD) as spool:
+            shutil.copyfileobj(source, spool, COPY_CHUNK)
+            spool.seek(0)
+            yield spool
+
+
+@contextlib.contextmanager
+def upload_view(source):
+    """
+    Yields a memoryview of the upload's bytes, without copying for in-memory uploads. The view
+    is released on exit.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+    elif isinstance(source, io.BytesIO):
+        view = memoryview(source.getvalue())  # the shared bytes, not a copy
+    else:
+        with open_upload(source) as f:
+            view = memoryview(f.read())
+    try:
+        yield view
+    finally:
+        view.release()
+
+
+def decode_upload(source, encoding="utf-8", errors="strict"):
+    """Decodes the whole upload to text; the only copy made is the resulting string."""
+    with upload_view(source) as view:
+        return str(view, encoding, errors)
+
+
+@contextlib.contextmanager
+def upload_path(source, suffix=""):
+    """
+    Yields a filesystem path holding the upload, for readers in other processes. Paths are
+    passed through; anything else is written in chunks to a temporary file removed on exit.
+    """
+    if _is_path(source):
+        yield os.fspath(source)
+        return
+    fd, path = tempfile.mkstemp(suffix=suffix, prefix="upload-")
+    try:
+        with os.fdopen(fd, "wb") as out, upload_view(source) as view:
+            for start in range(0, len(view), COPY_CHUNK):
+                out.write(view[start:start + COPY_CHUNK])
+        yield path
+    finally:
+        os.remove(path)
@@ -0,0 +1,105 @@
+# workbook_parallel.py
+"""
+Parallel parsing of multi-sheet workbooks (one sheet per DUT in our environmental tests).
+
+Each sheet is read and parsed in a worker process that opens the workbook in read-only
+mode and streams only its own sheet, so no process ever holds the whole workbook text.
+Cells are read like the serial parser reads them: a formula cell gives its formula text,
+not the value Excel cached for it.
+Every record is tagged with its sheet name. Workers return their records as a columnar
+table in shared memory (see columnar.py) rather than pickled dicts, and the tables are
+merged in workbook order without copying.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import openpyxl
+
+from columnar import SharedTable, TableChain, write_shared_table
+from report_text import extract_test_data
+from uploads import upload_path
+
+RECORD_COLUMNS = ("Test Description", "Result", "Sheet")
+MAX_WORKERS = int(os.environ.get("COMPLIANCE_SHEET_WORKERS", "0")) or os.cpu_count() or 1
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """Returns the process-wide worker pool, started on first use and reused across uploads."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # forkserver/spawn: forking the multi-threaded Streamlit server is not safe
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context(method))
+        return _pool
+
+
+def sheet_text(sheet):
+    """Renders a worksheet like the serial parser: a sheet marker line, then tab-separated rows."""
+    lines = [f"--- Sheet: {sheet.title} ---"]
+    for row in sheet.iter_rows(values_only=True):
+        lines.append("\t".join("" if value is None else str(value) for value in row))
+    return "\n".join(lines)
+
+
+def parse_sheet(path, sheet_name):
+    """Worker: extracts the test records of one sheet. Returns (sheet name, records, error)."""
+    try:
+        workbook = openpyxl.load_workbook(path, read_only=True)  # not data_only: same cell values as parse_xlsx
+        try:
+            records = extract_test_data(sheet_text(workbook[sheet_name]))
+        finally:
+            workbook.close()
+    except Exception as e:
+        return sheet_name, [], f"{type(e).__name__}: {e}"
+    for record in records:
+        record["Sheet"] = sheet_name
+    return sheet_name, records, None
+
+
+def parse_sheet_shared(path, sheet_name):
+    """Worker: like parse_sheet, but returns the records as a shared table descriptor."""
+    sheet_name, records, error = parse_sheet(path, sheet_name)
+    return sheet_name, write_shared_table(records, columns=RECORD_COLUMNS), error
+
+
+def parse_workbook(source, max_workers=None):
+    """
+    Parses every sheet of the workbook `source` (an upload, bytes or a path), concurrently when
+    there is more than one sheet and more than one worker. Returns (records, per-sheet summary);
+    records is a read-only sequence of dicts.
+    """
+    with upload_path(source, suffix=".xlsx") as path:
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        names = workbook.sheetnames
+        workbook.close()
+
+        workers = min(len(names), max_workers or MAX_WORKERS)
+        if workers > 1:
+            pool = _get_pool()
+            results = [(name, SharedTable(descriptor), error)
+                       for name, descriptor, error in pool.map(parse_sheet_shared, [path] * len(names), names)]
+        else:
+            results = [parse_sheet(path, name) for name in names]
+
+    summary = []
+    for name, sheet_records, error in results:
+        if isinstance(sheet_records, SharedTable):
+            results_count = sheet_records.value_counts("Result")
+        else:
+            results_count = {}
+            for record in sheet_records:
+                results_count[record.get("Result")] = results_count.get(record.get("Result"), 0) + 1
+        summary.append({
+            "Sheet": name,
+            "Tests": len(sheet_records),
+            "Passed": sum(n for result, n in results_count.items() if "PASS" in str(result).upper()),
+            "Failed": sum(n for result, n in results_count.items() if "FAIL" in str(result).upper()),
+            "Error": error or "",
+        })
+    return TableChain(sheet_records for _, sheet_records, _ in results), summary